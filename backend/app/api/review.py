@@ -1,50 +1,304 @@
-from fastapi import APIRouter, Request, HTTPException
+import asyncio
+import json
+import math
+import os
+from typing import List, Optional
+
+import requests
+from fastapi import APIRouter, Request, Response, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import ValidationError
 
-from app.models.schemas import ReviewRequest
+from app.models.schemas import ReviewRequest, BaselineUpdate
 from app.core.analyzer import analyze_code
 from app.core.project_analyzer import analyze_project
-from app.core.deduplicator import deduplicate_issues
+from app.core.deduplicator import group_issues
 from app.core.scorer import calculate_risk
-from app.core.decision import make_decision
+from app.core.policy import policy_registry
 from app.core.ai_reasoner import enrich_issue
 from app.core.coverage import get_language_coverage
 from app.core.groq_advisory import generate_groq_advisory
+from app.core.advisory_cache import advisory_cache
+from app.core.advisory_jobs import advisory_jobs, is_local_callback
+from app.core.memory_guard import MemoryTracker, MemoryCeilingExceeded
+from app.core.rule_stats import RULE_STATS_ALWAYS, collect_rule_stats, process_rule_stats
+from app.core.request_profiler import request_profiler, ProfilingDenied
+from app.core.admission import admission, AdmissionRejected
+from app.core.review_store import review_store, InvalidQuery
+from app.core.response_cache import response_cache, request_fingerprint, etag_for, etag_matches
+from app.core.report_writers import REPORT_FORMATS, MEDIA_TYPES, report_chunks
+from app.core.baseline import baseline_store, apply_baseline, parse_fingerprints, BaselineError
 
 router = APIRouter()
 
+# Keep references so background advisories are not garbage-collected
+_background_tasks = set()
+
+# SSE comment sent while an advisory is pending (keeps proxies from timing out)
+SSE_KEEPALIVE_SECONDS = 15
+
 
 @router.post("/review")
-async def review_code(request: Request):
+async def review_code(request: Request, response: Response):
+
+    # Admission control: bounded concurrency, queued requests released
+    # by payload size (sjf) or per client (wfq); 429 when saturated
+    cost = len(await request.body())
+    client = request.headers.get("x-client-id") or (
+        request.client.host if request.client else "unknown"
+    )
+
+    try:
+        async with admission.admit(cost, client):
+            return await review_admitted(request, response)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429,
+            detail=e.detail,
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+
+def report_format(request):
+    """
+    ?format=json (default) | sarif | junit; 422 for anything else.
+    """
+    report_format = (request.query_params.get("format") or "json").lower()
+
+    if report_format not in REPORT_FORMATS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"'format' must be one of {list(REPORT_FORMATS)}"
+        )
+
+    return report_format
+
+
+def report_response(result, report_format, headers=None):
+    """
+    SARIF / JUnit body written incrementally; the gate decision is also
+    in X-Quality-Gate-Decision so CLIs can exit without parsing it.
+    """
+    headers = dict(headers or {})
+    headers.pop("content-length", None)
+    headers["X-Quality-Gate-Decision"] = result.get("decision") or "PASS"
+
+    return StreamingResponse(
+        report_chunks(result, report_format),
+        media_type=MEDIA_TYPES[report_format],
+        headers=headers
+    )
+
+
+async def run_analysis(offload, func, *args, **kwargs):
+    """
+    Analysis is CPU-bound: it runs in a worker thread so admitted reviews
+    overlap and the event loop keeps serving. Profiled requests stay on
+    the loop thread, the one the profiler watches.
+    """
+    if not offload:
+        return func(*args, **kwargs)
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+async def review_admitted(request, response):
+
+    output_format = report_format(request)
+
+    # Privileged profiling (?profile=cprofile|sampling or X-Profile,
+    # authorized by X-Profile-Token; rate-limited, one at a time)
+    profile = None
+    profile_kind = request.query_params.get("profile") or request.headers.get("x-profile")
+
+    if profile_kind:
+        try:
+            profile = request_profiler.start(
+                profile_kind.lower(), request.headers.get("x-profile-token")
+            )
+        except ProfilingDenied as e:
+            headers = None
+            if e.retry_after:
+                headers = {"Retry-After": str(math.ceil(e.retry_after))}
+            raise HTTPException(status_code=e.status_code, detail=e.detail, headers=headers)
+
+    # Opt-in memory accounting (?debug=memory or X-Debug-Memory: 1)
+    memory = MemoryTracker(
+        profiling=(
+            request.query_params.get("debug") == "memory"
+            or request.headers.get("x-debug-memory") == "1"
+        )
+    )
+
+    # Opt-in per-rule counters (?rule_stats=1 or X-Debug-Rules: 1)
+    rule_stats_requested = (
+        request.query_params.get("rule_stats") == "1"
+        or request.headers.get("x-debug-rules") == "1"
+    )
+
+    # Debug output is per request: never served from or stored in the cache
+    cacheable = not (profile or memory.profiling or rule_stats_requested)
+
+    try:
+        if rule_stats_requested or RULE_STATS_ALWAYS:
+            with collect_rule_stats() as rule_stats:
+                result = await run_review(
+                    request, response, memory, cacheable, output_format, offload=profile is None
+                )
+
+            if rule_stats_requested:
+                result.setdefault("debug", {})["rules"] = rule_stats.report()
+        else:
+            result = await run_review(
+                request, response, memory, cacheable, output_format, offload=profile is None
+            )
+
+        if profile is not None:
+            result.setdefault("debug", {})["profile"] = profile.stop()
+
+        # SARIF / JUnit (a 304 stays a 304)
+        if output_format != "json" and isinstance(result, dict):
+            return report_response(result, output_format, response.headers)
+
+        return result
+    except MemoryCeilingExceeded as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    finally:
+        memory.close()
+        if profile is not None:
+            profile.stop()
+
+
+async def run_review(request, response, memory, cacheable=True, output_format="json", offload=True):
 
     # =================================================
     # Step 0: Parse & Validate Request
     # =================================================
     try:
-        data = await request.json()
-        payload = ReviewRequest(**data)
+        with memory.stage("parse_request"):
+            data = await request.json()
+            payload = ReviewRequest(**data)
     except ValidationError as ve:
         raise HTTPException(status_code=422, detail=ve.errors())
     except Exception:
         raise HTTPException(status_code=422, detail="Invalid or empty JSON body")
 
+    # Raw JSON is no longer needed once validated
+    del data
+
+    advisory_mode = (payload.advisory_mode or "inline").lower()
+
+    if advisory_mode not in ("inline", "deferred"):
+        raise HTTPException(
+            status_code=422,
+            detail="'advisory_mode' must be 'inline' or 'deferred'"
+        )
+
+    if payload.callback_url and not is_local_callback(payload.callback_url):
+        raise HTTPException(
+            status_code=422,
+            detail="'callback_url' must point to localhost"
+        )
+
+    # Quality-gate policy + what-if policies, resolved before any analysis
+    registry = policy_registry()
+    what_if = payload.what_if or []
+    if what_if == ["*"]:
+        what_if = registry.names()
+
+    unknown = [name for name in [payload.policy] + what_if if name and name not in registry.policies]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown policy {unknown[0]!r}; available: {registry.names()}"
+        )
+
+    policy = registry.get(payload.policy)
+
+    # Baseline of known issues (legacy code): resolved before analysis
+    baseline = None
+    if payload.baseline:
+        try:
+            baseline = baseline_store().get(payload.baseline)
+        except BaselineError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+        if baseline is None:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown baseline {payload.baseline!r}; available: {baseline_store().names()}"
+            )
+
+    # =================================================
+    # Repeat Payloads: ETag / If-None-Match + Response Cache
+    # (inline advisory only; deferred responses carry a job handle)
+    # =================================================
+    fingerprint = None
+
+    if cacheable and advisory_mode == "inline":
+        fingerprint = request_fingerprint(payload, baseline=baseline)
+        etag = etag_for(fingerprint, output_format)
+        response.headers["ETag"] = etag
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            response_cache.record_not_modified()
+            return Response(status_code=304, headers={"ETag": etag})
+
+        cached = response_cache.get(fingerprint)
+        if cached is not None:
+            cached_result, cached_fingerprints = cached
+
+            # The stored review may expire before the cached response
+            review_store.restore(cached_result, cached_fingerprints)
+
+            response.headers["X-Cache"] = "HIT"
+            return cached_result
+
+        response.headers["X-Cache"] = "MISS"
+
     # =================================================
     # Step 1: Analyze Code (Single or Project Mode)
     # =================================================
     raw_issues = []
+    file_metrics = {}
+    file_languages = {}
+    project_languages = {}
+    skipped_files = []
 
     if payload.files:
-        project_results = analyze_project(payload.files, payload.language)
+        with memory.stage("analysis"):
+            project_results = await run_analysis(offload, analyze_project, payload.files, memory=memory)
+
+            for file_result in project_results:
+                for issue in file_result["issues"]:
+                    # Project-level issues keep the file they point at
+                    if file_result["path"] != "__project__" or not issue.get("path"):
+                        issue["path"] = file_result["path"]
+                    raw_issues.append(issue)
+
+                if file_result.get("metrics"):
+                    file_metrics[file_result["path"]] = file_result["metrics"]
 
-        for file_result in project_results:
-            for issue in file_result["issues"]:
-                issue["path"] = file_result["path"]
-                raw_issues.append(issue)
+                if "language" in file_result:
+                    file_languages[file_result["path"]] = file_result["language"]
+
+                if file_result["path"] == "__project__":
+                    project_languages = file_result["languages"]
+                    skipped_files = file_result["skipped_files"]
+
+            del project_results
 
         analysis_mode = "project"
 
     elif payload.code:
-        raw_issues = analyze_code(payload.code, payload.language)
+        with memory.stage("analysis"):
+            single_metrics = {}
+            raw_issues = await run_analysis(
+                offload, analyze_code, payload.code, payload.language, metrics=single_metrics
+            )
+            if single_metrics:
+                file_metrics["<code>"] = single_metrics
+        memory.enforce()
         analysis_mode = "single-file"
 
     else:
@@ -54,53 +308,184 @@ async def review_code(request: Request):
         )
 
     # =================================================
-    # Step 2: Filter Issues by Language
+    # Step 1b: Fingerprint + Baseline (known issues never reach
+    # grouping, enrichment, scoring or the advisory)
     # =================================================
-    filtered_issues = []
-    for issue in raw_issues:
-        issue_language = issue.get("language")
-        if issue_language and issue_language != payload.language.lower():
-            continue
-        filtered_issues.append(issue)
+    with memory.stage("baseline"):
+        raw_issues, issue_fingerprints, baseline_matches = apply_baseline(raw_issues, baseline)
 
     # =================================================
-    # Step 3: Deduplicate Issues
+    # Step 2: Filter Issues by Language (per file in project mode)
     # =================================================
-    deduped_issues = deduplicate_issues(filtered_issues)
+    default_language = payload.language.lower()
+
+    filtered_issues = (
+        issue for issue in raw_issues
+        if not issue.get("language")
+        or issue["language"] == file_languages.get(issue.get("path"), default_language)
+    )
+
+    # =================================================
+    # Step 3: Group Issues (one per rule/target, with occurrences)
+    # =================================================
+    with memory.stage("deduplicate"):
+        deduped_issues = group_issues(filtered_issues)
+        del raw_issues, filtered_issues
 
     # =================================================
     # Step 4: Enrich Issues
     # =================================================
-    enriched_issues = [
-        enrich_issue(issue, payload.context)
-        for issue in deduped_issues
-    ]
+    with memory.stage("enrich"):
+        enriched_issues = [
+            enrich_issue(issue, payload.context)
+            for issue in deduped_issues
+        ]
 
     # =================================================
     # Step 5: Static Risk Scoring (Authority)
     # =================================================
-    static_score, metrics = calculate_risk(enriched_issues)
+    with memory.stage("score"):
+        static_score, metrics = calculate_risk(enriched_issues)
+
+    # Per-file / per-function code metrics (Python)
+    metrics["files"] = file_metrics
 
     # =================================================
     # Step 6: Structural Risk (Project-Level Only)
     # =================================================
-    project_score = 0
+    project_score = policy.structural_score(len(enriched_issues), analysis_mode)
+
+    # =================================================
+    # Step 7: LLM Advisory (Advisory Layer Only)
+    # =================================================
+    llm_advisory = None
+    llm_modifier = 0
+    interview_readiness = 0
+    advisory_handle = None
+    advisory_failed = False
+
+    if advisory_mode == "inline":
+        with memory.stage("advisory"):
+            llm_advisory, llm_modifier, interview_readiness, advisory_failed = await run_advisory(
+                payload, analysis_mode, enriched_issues
+            )
+
+    # =================================================
+    # Step 8: Composite Weighted Score + Policy Decision
+    # (one pass over the issues for the policy and every what-if)
+    # =================================================
+    outcomes = registry.policy_set(dict.fromkeys([policy.name] + what_if)).evaluate(
+        enriched_issues, static_score, analysis_mode, llm_modifier
+    )
+    outcome = outcomes[policy.name]
+
+    final_score = outcome["final_score"]
+    decision = outcome["decision"]
+    decision_trace = outcome["decision_trace"]
+
+    # Deferred: the static decision is final, the advisory arrives later
+    if advisory_mode == "deferred":
+        advisory_handle = start_deferred_advisory(
+            payload, analysis_mode, enriched_issues,
+            static_score, project_score, decision, policy
+        )
+
+    # =================================================
+    # Step 9: Coverage
+    # =================================================
+    coverage = get_language_coverage(payload.language)
+    coverage_by_language = None
 
     if analysis_mode == "project":
-        project_score = min(40, len(enriched_issues) * 5)
+        coverage_by_language = {
+            language: dict(get_language_coverage(language), files=count)
+            for language, count in sorted(project_languages.items())
+        }
+
+        # Headline coverage follows the dominant language of the project
+        if project_languages:
+            dominant = max(sorted(project_languages), key=project_languages.get)
+            coverage = get_language_coverage(dominant)
 
     # =================================================
-    # Step 7: LLM Advisory (Advisory Layer Only)
+    # Final Response
     # =================================================
+    ai_section = {
+        "interview_readiness": interview_readiness,
+        "advisory": llm_advisory
+    }
+
+    if advisory_handle:
+        ai_section.update(advisory_handle)
+
+    result = {
+        "mode": analysis_mode,
+        "risk_breakdown": {
+            "static_risk": static_score,
+            "structural_risk": project_score,
+            "ai_modifier": llm_modifier
+        },
+        "final_score": final_score,
+        "decision": decision,
+        "decision_trace": decision_trace,
+        "policy": {"name": policy.name, "trace": outcome["trace"]},
+        "summary": f"{len(enriched_issues)} issue(s) detected",
+        "coverage": coverage,
+        "metrics": metrics,
+        "issues": enriched_issues,
+        "ai_section": ai_section
+    }
+
+    if what_if:
+        result["what_if"] = {name: outcomes[name] for name in what_if}
+
+    if coverage_by_language is not None:
+        result["coverage_by_language"] = coverage_by_language
+        result["skipped_files"] = skipped_files
+
+    if baseline is not None:
+        result["baseline"] = {
+            "name": baseline.name,
+            "revision": baseline.revision,
+            "suppressed": baseline_matches
+        }
+
+    # Stored for filtered, paginated retrieval (GET /reviews/{id}/issues)
+    # and as a baseline source (PUT /baselines/{name})
+    result["review_id"] = review_store.save(result, issue_fingerprints)
+
+    # Failed advisories are retried on the next identical request
+    if fingerprint is not None and not advisory_failed:
+        response_cache.put(fingerprint, result, issue_fingerprints)
+
+    if memory.enabled:
+        memory_report = memory.report()
+        response.headers["X-Peak-Memory-MB"] = str(memory_report["peak_mb"])
+        if memory.profiling:
+            result.setdefault("debug", {})["memory"] = memory_report
+
+    return result
+
+
+# =====================================================
+# Advisory Helpers
+# =====================================================
+
+async def run_advisory(payload, analysis_mode, enriched_issues):
+    """
+    Returns (advisory, risk_modifier, readiness, failed) — never raises.
+    """
     llm_advisory = None
     llm_modifier = 0
     interview_readiness = 0
+    failed = False
 
     try:
 
         if analysis_mode == "single-file" and payload.code:
 
-            llm_response = generate_groq_advisory(
+            llm_response = await run_in_threadpool(
+                generate_groq_advisory,
                 mode="single",
                 code=payload.code,
                 language=payload.language,
@@ -120,11 +505,13 @@ async def review_code(request: Request):
                 "files": [f.path for f in payload.files]
             }
 
-            llm_response = generate_groq_advisory(
+            llm_response = await run_in_threadpool(
+                generate_groq_advisory,
                 mode="project",
                 project_summary=project_summary,
                 language=payload.language,
-                issues=enriched_issues
+                issues=enriched_issues,
+                files=payload.files
             )
 
         else:
@@ -132,6 +519,7 @@ async def review_code(request: Request):
 
         if isinstance(llm_response, dict):
             llm_advisory = llm_response.get("advisory")
+            failed = bool(llm_response.get("error"))
 
             # Safe int conversion
             try:
@@ -156,44 +544,333 @@ async def review_code(request: Request):
         llm_advisory = f"AI advisory unavailable: {str(e)}"
         llm_modifier = 0
         interview_readiness = 0
+        failed = True
+
+    return llm_advisory, llm_modifier, interview_readiness, failed
+
+
+def start_deferred_advisory(payload, analysis_mode, enriched_issues,
+                            static_score, project_score, decision, policy):
+    """
+    Schedules the advisory in the background and returns its handle.
+    """
+    advisory_id = advisory_jobs.create({
+        "static_risk": static_score,
+        "structural_risk": project_score,
+        "decision": decision
+    })
+
+    task = asyncio.create_task(
+        complete_deferred_advisory(
+            advisory_id, payload, analysis_mode, enriched_issues,
+            static_score, project_score, decision, policy
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-    # =================================================
-    # Step 8: Composite Weighted Score
-    # =================================================
-    final_score = int(
-        0.5 * static_score +
-        0.3 * project_score +
-        0.2 * llm_modifier
+    return {
+        "status": "pending",
+        "advisory_id": advisory_id,
+        "poll_url": f"/api/v1/advisory/{advisory_id}",
+        "events_url": f"/api/v1/advisory/{advisory_id}/events"
+    }
+
+
+async def complete_deferred_advisory(advisory_id, payload, analysis_mode, enriched_issues,
+                                     static_score, project_score, decision, policy):
+    """
+    Final-score update rules (see ARCHITECTURE.md):
+    - final_score is recomputed with the advisory modifier
+    - decision is the one already returned and is never changed
+    """
+    llm_advisory, llm_modifier, interview_readiness, _ = await run_advisory(
+        payload, analysis_mode, enriched_issues
     )
 
-    final_score = max(0, min(final_score, 100))
+    job = advisory_jobs.complete(advisory_id, "done", {
+        "advisory": llm_advisory,
+        "interview_readiness": interview_readiness,
+        "ai_modifier": llm_modifier,
+        "final_score": policy.final_score(static_score, project_score, llm_modifier),
+        "decision": decision
+    })
+
+    if job and payload.callback_url:
+        await run_in_threadpool(
+            deliver_callback, payload.callback_url, advisory_jobs.public_view(job)
+        )
 
-    decision, decision_trace = make_decision(final_score, enriched_issues)
 
-    # =================================================
-    # Step 9: Coverage
-    # =================================================
-    coverage = get_language_coverage(payload.language)
+def deliver_callback(url, body):
+    try:
+        requests.post(url, json=body, timeout=5)
+    except requests.RequestException:
+        pass
+
+
+@router.get("/advisory/cache")
+def advisory_cache_stats():
+    """
+    Hit rate and saved upstream latency of the advisory cache.
+    """
+    return advisory_cache.stats()
+
+
+@router.get("/reviews/{review_id}")
+def get_review(review_id: str):
+    """
+    Stored review without its issue list.
+    """
+    review = review_store.get(review_id)
+
+    if review is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired review_id")
+
+    return dict(review["summary"], review_id=review_id, issue_entries=len(review["index"]))
+
+
+@router.get("/reviews/{review_id}/what-if")
+def review_what_if(review_id: str, policy: List[str] = Query(default=[])):
+    """
+    A stored review re-decided under other policies, without re-analysis:
+    ?policy=strict&policy=lenient (default: every configured policy).
+    """
+    review = review_store.get(review_id)
+
+    if review is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired review_id")
+
+    registry = policy_registry()
+    names = policy or registry.names()
+
+    unknown = [name for name in names if name not in registry.policies]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown policy {unknown[0]!r}; available: {registry.names()}"
+        )
+
+    summary = review["summary"]
+    breakdown = summary.get("risk_breakdown", {})
 
-    # =================================================
-    # Final Response
-    # =================================================
     return {
-        "mode": analysis_mode,
-        "risk_breakdown": {
-            "static_risk": static_score,
-            "structural_risk": project_score,
-            "ai_modifier": llm_modifier
-        },
-        "final_score": final_score,
-        "decision": decision,
-        "decision_trace": decision_trace,
-        "summary": f"{len(enriched_issues)} issue(s) detected",
-        "coverage": coverage,
-        "metrics": metrics,
-        "issues": enriched_issues,
-        "ai_section": {
-            "interview_readiness": interview_readiness,
-            "advisory": llm_advisory
-        }
+        "review_id": review_id,
+        "policy": summary.get("policy", {}).get("name"),
+        "decision": summary.get("decision"),
+        "what_if": registry.policy_set(dict.fromkeys(names)).evaluate(
+            review["issues"],
+            breakdown.get("static_risk", 0),
+            summary.get("mode"),
+            breakdown.get("ai_modifier", 0)
+        )
+    }
+
+
+@router.get("/reviews/{review_id}/report")
+def review_report(review_id: str, format: str = "sarif"):
+    """
+    A stored review as SARIF or JUnit XML (?format=sarif|junit).
+    """
+    review = review_store.get(review_id)
+
+    if review is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired review_id")
+
+    if format not in MEDIA_TYPES:
+        raise HTTPException(status_code=422, detail=f"'format' must be one of {list(MEDIA_TYPES)}")
+
+    result = dict(review["summary"], review_id=review_id, issues=review["issues"])
+    return report_response(result, format)
+
+
+@router.get("/baselines")
+def list_baselines():
+    return {"baselines": baseline_store().names()}
+
+
+@router.get("/baselines/{name}")
+def get_baseline(name: str):
+    try:
+        baseline = baseline_store().get(name)
+    except BaselineError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    if baseline is None:
+        raise HTTPException(status_code=404, detail="Unknown baseline")
+
+    return baseline.describe()
+
+
+@router.put("/baselines/{name}")
+def put_baseline(name: str, update: BaselineUpdate):
+    """
+    Stores every issue of a review ({"review_id": ...}) or explicit
+    fingerprints ({"fingerprints": [...]}) as the baseline 'name';
+    "merge": true adds them to the existing baseline instead.
+    """
+    if update.review_id:
+        review = review_store.get(update.review_id)
+        if review is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired review_id")
+        fingerprints = review["fingerprints"]
+    elif update.fingerprints is not None:
+        try:
+            fingerprints = parse_fingerprints(update.fingerprints)
+        except BaselineError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    else:
+        raise HTTPException(status_code=422, detail="Either 'review_id' or 'fingerprints' must be provided")
+
+    try:
+        baseline = baseline_store().save(name, fingerprints, merge=update.merge)
+    except BaselineError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return baseline.describe()
+
+
+@router.delete("/baselines/{name}")
+def delete_baseline(name: str):
+    try:
+        deleted = baseline_store().delete(name)
+    except BaselineError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Unknown baseline")
+
+    return {"status": "deleted"}
+
+
+@router.get("/policies")
+def list_policies():
+    """
+    Configured quality-gate policies (resolved, validated).
+    """
+    registry = policy_registry()
+    return {
+        "default": registry.default,
+        "version": registry.version,
+        "policies": [policy.describe() for policy in registry.policies.values()]
     }
+
+
+@router.get("/reviews/{review_id}/issues")
+def get_review_issues(
+    review_id: str,
+    severity: Optional[str] = None,
+    type: Optional[str] = None,
+    path_prefix: Optional[str] = None,
+    min_confidence: Optional[float] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50
+):
+    """
+    One page of a stored review's issues (one entry per issue and path),
+    filtered server-side: ?severity=CRITICAL,HIGH&type=Security
+    &path_prefix=app/&min_confidence=0.8. Follow 'next_cursor'.
+    """
+    try:
+        page = review_store.issues(
+            review_id,
+            severity=severity,
+            issue_type=type,
+            path_prefix=path_prefix,
+            min_confidence=min_confidence,
+            cursor=cursor,
+            limit=limit
+        )
+    except InvalidQuery as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    if page is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired review_id")
+
+    return page
+
+
+@router.get("/review/cache")
+def review_cache_stats():
+    """
+    Hit rate of the whole-response cache (and 304s served).
+    """
+    return response_cache.stats()
+
+
+@router.delete("/review/cache")
+def clear_review_cache():
+    response_cache.clear()
+    return {"status": "cleared"}
+
+
+@router.get("/queue/stats")
+def queue_stats():
+    """
+    Admission queue depth, running reviews and queue wait percentiles.
+    """
+    return admission.stats()
+
+
+@router.get("/stats/rules")
+def rule_stats_report():
+    """
+    Process-wide per-rule counters (requests that collected stats).
+    """
+    return {"checks": process_rule_stats.report()}
+
+
+@router.delete("/stats/rules")
+def reset_rule_stats():
+    process_rule_stats.reset()
+    return {"status": "reset"}
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(profile_id: str, request: Request):
+    """
+    Saved profile: pstats (cprofile) or collapsed stacks (sampling).
+    """
+    if not request_profiler.authorized(request.headers.get("x-profile-token")):
+        raise HTTPException(status_code=403, detail="Profiling requires a valid X-Profile-Token")
+
+    path = request_profiler.find(profile_id)
+
+    if path is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired profile_id")
+
+    media_type = "text/plain" if path.endswith(".folded") else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=os.path.basename(path))
+
+
+@router.get("/advisory/{advisory_id}")
+def get_advisory(advisory_id: str):
+    job = advisory_jobs.get(advisory_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired advisory_id")
+
+    return advisory_jobs.public_view(job)
+
+
+@router.get("/advisory/{advisory_id}/events")
+async def advisory_events(advisory_id: str):
+    """
+    Server-Sent Events stream that emits one 'advisory' event when done.
+    """
+    job = advisory_jobs.get(advisory_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired advisory_id")
+
+    async def stream():
+        while not job["done"].is_set():
+            try:
+                await asyncio.wait_for(job["done"].wait(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+
+        body = json.dumps(advisory_jobs.public_view(job))
+        yield f"event: advisory\ndata: {body}\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
@@ -0,0 +1,263 @@
+import asyncio
+import itertools
+import math
+import os
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+REVIEW_MAX_CONCURRENT = int(os.getenv("REVIEW_MAX_CONCURRENT", "4"))   # 0 = no admission control
+REVIEW_MAX_QUEUE = int(os.getenv("REVIEW_MAX_QUEUE", "64"))
+REVIEW_SCHEDULER = os.getenv("REVIEW_SCHEDULER", "sjf")                # sjf | wfq | fifo
+REVIEW_QUEUE_TIMEOUT = float(os.getenv("REVIEW_QUEUE_TIMEOUT", "30"))  # seconds
+REVIEW_SJF_AGING = float(os.getenv("REVIEW_SJF_AGING", "5"))           # seconds to halve a job's cost
+
+SCHEDULERS = ("sjf", "wfq", "fifo")
+
+# Payload size classes (bytes), for reporting
+SIZE_CLASSES = [("small", 64 * 1024), ("medium", 1024 * 1024), ("large", float("inf"))]
+
+
+def size_class(cost):
+    for name, limit in SIZE_CLASSES:
+        if cost < limit:
+            return name
+    return "large"
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, detail, retry_after):
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+# =========================================================
+# ADMISSION CONTROLLER
+# =========================================================
+
+class AdmissionController:
+    """
+    Bounded concurrency with a bounded wait queue.
+
+    Queued requests are released by policy when a slot frees up:
+    - sjf:  smallest payload first; waiting ages a job's cost down so
+            large jobs are never starved
+    - wfq:  start-time fair queuing per client (cost = payload bytes),
+            so one client's burst cannot starve others
+    - fifo: arrival order
+
+    A full queue, or a wait longer than 'queue_timeout', is rejected
+    with AdmissionRejected (→ 429 + Retry-After).
+    """
+
+    def __init__(self, max_concurrent=REVIEW_MAX_CONCURRENT, max_queue=REVIEW_MAX_QUEUE,
+                 policy=REVIEW_SCHEDULER, queue_timeout=REVIEW_QUEUE_TIMEOUT,
+                 aging=REVIEW_SJF_AGING):
+        if policy not in SCHEDULERS:
+            raise ValueError(f"Unknown scheduler '{policy}'")
+
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.policy = policy
+        self.queue_timeout = queue_timeout
+        self.aging = aging
+
+        self.running = 0
+        self.queue = []
+        self.sequence = itertools.count()
+
+        # WFQ state
+        self.virtual_time = 0.0
+        self.client_finish = {}
+
+        self.counters = Counter()
+        self.waits = deque(maxlen=1000)        # seconds spent queued
+        self.service_times = deque(maxlen=200)
+
+    @property
+    def enabled(self):
+        return self.max_concurrent > 0
+
+    # -----------------------------------------------------
+    # Scheduling
+    # -----------------------------------------------------
+    def _tag(self, entry):
+        """
+        WFQ start tag; only for admitted or queued requests, so rejected
+        ones never push their client's finish time forward.
+        """
+        start = max(self.virtual_time, self.client_finish.get(entry["client"], 0.0))
+        entry["start"] = start
+        self.client_finish[entry["client"]] = start + entry["cost"]
+
+    def _untag(self, entry):
+        """
+        Gives back the virtual time of a request that never ran.
+        """
+        finish = self.client_finish.get(entry["client"])
+        if finish is None:
+            return
+
+        finish -= entry["cost"]
+        if finish <= self.virtual_time:
+            del self.client_finish[entry["client"]]
+        else:
+            self.client_finish[entry["client"]] = finish
+
+    def _advance(self, entry):
+        """
+        Virtual time moves to the dispatched request's start; clients
+        whose finish time it has reached are forgotten.
+        """
+        if entry["start"] <= self.virtual_time:
+            return
+
+        self.virtual_time = entry["start"]
+        for client in [c for c, finish in self.client_finish.items() if finish <= self.virtual_time]:
+            del self.client_finish[client]
+
+    def _priority(self, entry, now):
+        if self.policy == "sjf":
+            age = now - entry["enqueued"]
+            return (entry["cost"] / (1 + age / self.aging), entry["seq"])
+        if self.policy == "wfq":
+            return (entry["start"] + entry["cost"], entry["seq"])
+        return (entry["seq"],)
+
+    def _dispatch(self):
+        now = time.monotonic()
+
+        while self.queue and self.running < self.max_concurrent:
+            entry = min(self.queue, key=lambda e: self._priority(e, now))
+            self.queue.remove(entry)
+
+            if entry["future"].done():      # waiter already gave up
+                continue
+
+            self.running += 1
+            self._advance(entry)
+            entry["future"].set_result(True)
+
+    def retry_after(self):
+        """
+        Seconds until the current queue has likely drained (at least 1).
+        """
+        service = (
+            sum(self.service_times) / len(self.service_times)
+            if self.service_times else 1.0
+        )
+        estimate = (len(self.queue) + 1) * service / max(1, self.max_concurrent)
+        return max(1, math.ceil(estimate))
+
+    # -----------------------------------------------------
+    # Acquire / release
+    # -----------------------------------------------------
+    async def acquire(self, cost, client):
+        entry = {
+            "cost": cost,
+            "client": client,
+            "seq": next(self.sequence),
+            "enqueued": time.monotonic()
+        }
+
+        if self.running < self.max_concurrent and not self.queue:
+            self._tag(entry)
+            self.running += 1
+            self._advance(entry)
+            self.counters["admitted"] += 1
+            self.waits.append(0.0)
+            return
+
+        if len(self.queue) >= self.max_queue:
+            self.counters["rejected"] += 1
+            raise AdmissionRejected("Server is saturated, retry later", self.retry_after())
+
+        self._tag(entry)
+        entry["future"] = asyncio.get_running_loop().create_future()
+        self.queue.append(entry)
+        self.counters["queued_" + size_class(cost)] += 1
+
+        try:
+            await asyncio.wait_for(asyncio.shield(entry["future"]), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if entry["future"].done() and not entry["future"].cancelled():
+                # Dispatched at the same moment: hand the slot on
+                self.release()
+            else:
+                entry["future"].cancel()
+                if entry in self.queue:
+                    self.queue.remove(entry)
+                self._untag(entry)
+
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+            self.counters["timed_out"] += 1
+            raise AdmissionRejected("Queue wait exceeded, retry later", self.retry_after())
+
+        self.counters["admitted"] += 1
+        self.waits.append(time.monotonic() - entry["enqueued"])
+
+    def release(self, service_time=None):
+        self.running -= 1
+        if service_time is not None:
+            self.service_times.append(service_time)
+        self._dispatch()
+
+        # Idle: the busy period is over, every client starts afresh
+        if not self.running and not self.queue:
+            self.client_finish.clear()
+
+    @asynccontextmanager
+    async def admit(self, cost, client):
+        if not self.enabled:
+            yield
+            return
+
+        await self.acquire(cost, client)
+        started = time.monotonic()
+
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    # -----------------------------------------------------
+    # Reporting
+    # -----------------------------------------------------
+    def stats(self):
+        waits = sorted(self.waits)
+        queued_by_class = Counter(size_class(entry["cost"]) for entry in self.queue)
+
+        return {
+            "policy": self.policy,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queue_depth": len(self.queue),
+            "queue_depth_by_class": dict(queued_by_class),
+            "admitted": self.counters["admitted"],
+            "rejected": self.counters["rejected"],
+            "timed_out": self.counters["timed_out"],
+            "wait_ms": {
+                "p50": round(percentile(waits, 0.50) * 1000, 1),
+                "p95": round(percentile(waits, 0.95) * 1000, 1),
+                "p99": round(percentile(waits, 0.99) * 1000, 1),
+                "max": round((waits[-1] if waits else 0.0) * 1000, 1)
+            }
+        }
+
+
+admission = AdmissionController()
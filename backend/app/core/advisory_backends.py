@@ -0,0 +1,296 @@
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+
+# =========================================================
+# CONFIG
+# =========================================================
+#
+# ADVISORY_BACKEND              groq (default) | replay
+# ADVISORY_RECORD_FILE          groq only: append every response as JSONL
+# ADVISORY_REPLAY_FILE          replay only: JSONL recordings to serve
+# ADVISORY_REPLAY_LATENCY       fixed:S | uniform:MIN,MAX | normal:MEAN,STD
+#                               | lognormal:MU,SIGMA   (seconds)
+# ADVISORY_REPLAY_ERROR_RATE    0.0 - 1.0
+# ADVISORY_REPLAY_SEED          RNG seed (deterministic runs)
+
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+DEFAULT_REPLAY_RESPONSES = {
+    "single": json.dumps({
+        "advisory": "Replay advisory: add tests and split long functions.",
+        "risk_modifier": 3,
+        "readiness_score": 70
+    }),
+    "project": json.dumps({
+        "advisory": "Replay advisory: separate API, core and persistence layers.",
+        "risk_modifier": 2,
+        "readiness_score": 65
+    })
+}
+
+
+class AdvisoryBackendError(Exception):
+    pass
+
+
+def prompt_hash(prompt):
+    return hashlib.sha256(prompt.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+# =========================================================
+# BACKEND INTERFACE
+# =========================================================
+
+class AdvisoryBackend(ABC):
+    """
+    complete() returns the raw model text for a prompt, or raises.
+    A backend without complete() cannot be constructed.
+    """
+
+    name = "base"
+    model = "none"
+    unconfigured_message = "Advisory backend not configured."
+
+    def is_configured(self):
+        return True
+
+    @abstractmethod
+    def complete(self, prompt, mode):
+        ...
+
+
+# =========================================================
+# GROQ
+# =========================================================
+
+class GroqBackend(AdvisoryBackend):
+
+    name = "groq"
+    model = GROQ_MODEL
+    unconfigured_message = "GROQ_API_KEY not configured."
+
+    def __init__(self, api_key=None):
+        self.api_key = (api_key or os.getenv("GROQ_API_KEY") or "").strip()
+
+    def is_configured(self):
+        return bool(self.api_key)
+
+    def complete(self, prompt, mode):
+        # Imported lazily so offline replay runs don't need the SDK
+        from groq import Groq
+
+        client = Groq(api_key=self.api_key)
+
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "Return strictly JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.2,
+        )
+
+        # 🔒 SAFE RESPONSE CHECK
+        if not response or not response.choices:
+            raise AdvisoryBackendError("Empty response from Groq")
+
+        return response.choices[0].message.content
+
+
+class RecordingBackend(AdvisoryBackend):
+    """
+    Wraps a backend and appends each response to a JSONL file
+    that ReplayBackend can serve later.
+    """
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.path = path
+        self.lock = threading.Lock()
+        self.name = inner.name
+        self.model = inner.model
+        self.unconfigured_message = inner.unconfigured_message
+
+    def is_configured(self):
+        return self.inner.is_configured()
+
+    def complete(self, prompt, mode):
+        started = time.perf_counter()
+        content = self.inner.complete(prompt, mode)
+        latency = time.perf_counter() - started
+
+        record = {
+            "prompt_hash": prompt_hash(prompt),
+            "mode": mode,
+            "model": self.inner.model,
+            "latency": round(latency, 4),
+            "response": content
+        }
+
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record) + "\n")
+
+        return content
+
+
+# =========================================================
+# RECORDED REPLAY (OFFLINE, DETERMINISTIC)
+# =========================================================
+
+def parse_latency(spec):
+    """
+    'lognormal:-0.2,0.4' → ("lognormal", [-0.2, 0.4])
+    """
+    if not spec:
+        return ("fixed", [0.0])
+
+    kind, _, raw = spec.partition(":")
+    kind = kind.strip().lower()
+    params = [float(value) for value in raw.split(",") if value.strip()]
+
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+
+    if kind not in expected or len(params) != expected[kind]:
+        raise ValueError(f"Invalid latency distribution: '{spec}'")
+
+    return (kind, params)
+
+
+class ReplayBackend(AdvisoryBackend):
+    """
+    Serves recorded responses with a configurable latency distribution
+    and error rate. A prompt with an exact recording gets that recording;
+    otherwise a recording of the same mode is picked by prompt hash.
+    """
+
+    name = "replay"
+
+    def __init__(self, path=None, latency="fixed:0", error_rate=0.0, seed=0):
+        self.path = path
+        self.latency = parse_latency(latency)
+        self.error_rate = max(0.0, min(float(error_rate), 1.0))
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.model = "replay"
+
+        self.by_hash = {}
+        self.by_mode = {"single": [], "project": []}
+
+        if path:
+            self.load(path)
+
+    def load(self, path):
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+
+                record = json.loads(line)
+                content = record.get("response", "")
+                mode = record.get("mode", "single")
+
+                if record.get("prompt_hash"):
+                    self.by_hash[record["prompt_hash"]] = content
+                self.by_mode.setdefault(mode, []).append(content)
+
+        with open(path, "rb") as handle:
+            digest = hashlib.sha256(handle.read()).hexdigest()[:12]
+        self.model = f"replay:{digest}"
+
+    def sample_latency(self):
+        kind, params = self.latency
+
+        if kind == "fixed":
+            value = params[0]
+        elif kind == "uniform":
+            value = self.rng.uniform(params[0], params[1])
+        elif kind == "normal":
+            value = self.rng.gauss(params[0], params[1])
+        else:
+            value = math.exp(self.rng.gauss(params[0], params[1]))
+
+        return max(0.0, value)
+
+    def complete(self, prompt, mode):
+        key = prompt_hash(prompt)
+
+        with self.lock:
+            latency = self.sample_latency()
+            failed = self.rng.random() < self.error_rate
+
+        time.sleep(latency)
+
+        if failed:
+            raise AdvisoryBackendError("Replay backend injected error")
+
+        if key in self.by_hash:
+            return self.by_hash[key]
+
+        recordings = self.by_mode.get(mode) or []
+        if recordings:
+            return recordings[int(key, 16) % len(recordings)]
+
+        return DEFAULT_REPLAY_RESPONSES.get(mode, DEFAULT_REPLAY_RESPONSES["single"])
+
+
+# =========================================================
+# SELECTION
+# =========================================================
+
+_backend = None
+_backend_config = None
+_backend_lock = threading.Lock()
+
+
+def _config_from_env():
+    return (
+        os.getenv("ADVISORY_BACKEND", "groq").strip().lower(),
+        os.getenv("GROQ_API_KEY", ""),
+        os.getenv("ADVISORY_RECORD_FILE", ""),
+        os.getenv("ADVISORY_REPLAY_FILE", ""),
+        os.getenv("ADVISORY_REPLAY_LATENCY", "fixed:0"),
+        os.getenv("ADVISORY_REPLAY_ERROR_RATE", "0"),
+        os.getenv("ADVISORY_REPLAY_SEED", "0"),
+    )
+
+
+def get_advisory_backend():
+    """
+    Returns the configured backend (rebuilt when the env changes).
+    """
+    global _backend, _backend_config
+
+    config = _config_from_env()
+
+    with _backend_lock:
+        if _backend is not None and config == _backend_config:
+            return _backend
+
+        kind, api_key, record_file, replay_file, latency, error_rate, seed = config
+
+        if kind == "replay":
+            backend = ReplayBackend(
+                path=replay_file or None,
+                latency=latency,
+                error_rate=float(error_rate),
+                seed=int(seed)
+            )
+        elif kind == "groq":
+            backend = GroqBackend(api_key)
+            if record_file:
+                backend = RecordingBackend(backend, record_file)
+        else:
+            raise ValueError(f"Unknown ADVISORY_BACKEND '{kind}'")
+
+        _backend = backend
+        _backend_config = config
+
+        return backend
@@ -0,0 +1,200 @@
+import ast
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+ADVISORY_CACHE_TTL = int(os.getenv("ADVISORY_CACHE_TTL", "3600"))        # seconds
+ADVISORY_CACHE_SIZE = int(os.getenv("ADVISORY_CACHE_SIZE", "1024"))      # entries
+
+
+# =========================================================
+# BOUNDED TTL CACHE (LRU EVICTION)
+# =========================================================
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry expiry.
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()     # key → (expires_at, value)
+        self.lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# =========================================================
+# NORMALIZED FINGERPRINT
+# =========================================================
+
+def normalize_code(code, language):
+    """
+    Python → AST dump (comments, formatting and positions removed).
+    Other languages → trailing whitespace and blank lines removed.
+    """
+    if language.lower() == "python":
+        try:
+            return ast.dump(ast.parse(code))
+        except SyntaxError:
+            pass
+
+    lines = (line.rstrip() for line in code.replace("\r\n", "\n").split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def advisory_fingerprint(mode, language, model, code=None, project_summary=None, files=None):
+    """
+    Project mode: the summary plus sorted (path, content hash) pairs of
+    'files', so projects with the same paths and issue counts but
+    different code never share an advisory.
+    """
+    if mode == "single":
+        normalized = normalize_code(code or "", language)
+    else:
+        normalized = json.dumps(project_summary, sort_keys=True, default=str)
+        normalized += "".join(
+            f"\0{path}\0{content_hash}"
+            for path, content_hash in sorted((f.path, _digest(f.code)) for f in files or ())
+        )
+
+    return _digest("\0".join([mode, language.lower(), model, normalized]))
+
+
+# =========================================================
+# ADVISORY CACHE (COALESCING + METRICS)
+# =========================================================
+
+class AdvisoryCache:
+    """
+    Caches successful advisory results by fingerprint.
+
+    - Identical concurrent requests wait on one upstream call
+    - Failures are never cached
+    - Hit rate and saved upstream latency are tracked
+    """
+
+    def __init__(self, max_entries=ADVISORY_CACHE_SIZE, ttl_seconds=ADVISORY_CACHE_TTL):
+        self.cache = TTLCache(max_entries, ttl_seconds)
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.upstream_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns compute() for 'key', calling it at most once per key
+        at a time. Exceptions from compute() propagate to every waiter.
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            result, latency = cached
+            with self.lock:
+                self.hits += 1
+                self.saved_seconds += latency
+            return result
+
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+
+            if owner:
+                future = Future()
+                self.in_flight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            result, latency = future.result()
+            with self.lock:
+                self.saved_seconds += latency
+            return result
+
+        started = time.perf_counter()
+
+        try:
+            result = compute()
+        except Exception as e:
+            with self.lock:
+                self.errors += 1
+                del self.in_flight[key]
+            future.set_exception(e)
+            raise
+
+        latency = time.perf_counter() - started
+        self.cache.put(key, (result, latency))
+
+        with self.lock:
+            self.upstream_seconds += latency
+            del self.in_flight[key]
+
+        future.set_result((result, latency))
+        return result
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self.cache),
+                "max_entries": self.cache.max_entries,
+                "ttl_seconds": self.cache.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "evictions": self.cache.evictions,
+                "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+                "upstream_seconds": round(self.upstream_seconds, 3),
+                "saved_latency_seconds": round(self.saved_seconds, 3)
+            }
+
+
+advisory_cache = AdvisoryCache()
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+ADVISORY_JOB_TTL = int(os.getenv("ADVISORY_JOB_TTL", "900"))          # seconds
+ADVISORY_JOB_LIMIT = int(os.getenv("ADVISORY_JOB_LIMIT", "1000"))     # stored jobs
+
+LOCAL_CALLBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def is_local_callback(url):
+    """
+    Callbacks are only delivered to the local machine.
+    """
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+
+    return parsed.scheme in ("http", "https") and parsed.hostname in LOCAL_CALLBACK_HOSTS
+
+
+# =========================================================
+# DEFERRED ADVISORY JOBS
+# =========================================================
+
+class AdvisoryJobs:
+    """
+    In-memory store of deferred advisory jobs.
+
+    A job is created with the static verdict, then completed once the
+    background advisory finishes. Waiters (poll / SSE) share one event.
+    """
+
+    def __init__(self, limit=ADVISORY_JOB_LIMIT, ttl_seconds=ADVISORY_JOB_TTL):
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self.jobs = OrderedDict()
+
+    def create(self, static_verdict):
+        self.expire()
+
+        job_id = uuid.uuid4().hex
+        self.jobs[job_id] = {
+            "id": job_id,
+            "status": "pending",
+            "created": time.time(),
+            "static": static_verdict,
+            "result": None,
+            "done": asyncio.Event()
+        }
+
+        while len(self.jobs) > self.limit:
+            self.jobs.popitem(last=False)
+
+        return job_id
+
+    def get(self, job_id):
+        self.expire()
+        return self.jobs.get(job_id)
+
+    def complete(self, job_id, status, result):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+
+        job["status"] = status
+        job["result"] = result
+        job["done"].set()
+        return job
+
+    def expire(self):
+        cutoff = time.time() - self.ttl_seconds
+        while self.jobs:
+            oldest = next(iter(self.jobs.values()))
+            if oldest["created"] >= cutoff:
+                break
+            self.jobs.popitem(last=False)
+
+    @staticmethod
+    def public_view(job):
+        return {
+            "advisory_id": job["id"],
+            "status": job["status"],
+            "result": job["result"]
+        }
+
+
+advisory_jobs = AdvisoryJobs()
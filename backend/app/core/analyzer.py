@@ -1,19 +1,39 @@
 import ast
 import builtins
+import re
+import time
+from collections import Counter, defaultdict
+
+from app.core.rule_stats import active_rule_stats, measure
+from app.core.code_metrics import new_scope, parameter_count, file_report
+from app.core.secret_detector import MIN_SECRET_LENGTH, detect_secrets, string_literals
+from app.core.line_index import LineIndex, node_span
+from app.core.baseline import suppression_index, without_suppressed, add_context_hashes
 
 # =========================================================
 # CONFIG
 # =========================================================
 
+# Bump whenever a rule changes: invalidates cached per-file results
+RULES_VERSION = "2026.10.19"
+
 SUSPICIOUS_KEYWORDS = ["password", "secret", "token", "apikey"]
 DANGEROUS_CALLS = ["eval", "exec"]  # strict only
 
+# 'name = "literal"' at the start of a line (not a comment, not '==')
+GENERIC_ASSIGNMENT = re.compile(
+    r"^[^\S\r\n]*(?P<left>[^\s#=][^=\r\n]*)?=(?P<right>[^\r\n]*)", re.M
+)
+
+JS_PROCESS_EXIT = re.compile(r"process\.exit\(", re.I)
+JS_DIVISION_BY_ZERO = re.compile(r"/ 0")
+
 
 # =========================================================
 # GENERIC ANALYZER (SAFE & STRICT)
 # =========================================================
 
-def analyze_generic(code: str):
+def analyze_generic(code: str, lines=None):
     """
     Strict hardcoded secret detection.
     Only flags literal string assignments.
@@ -21,31 +41,30 @@ def analyze_generic(code: str):
 
     issues = []
 
-    for line in code.splitlines():
-        stripped = line.strip()
+    for match in GENERIC_ASSIGNMENT.finditer(code):
+        left = (match.group("left") or "").rstrip().lower()
 
-        # Skip comments
-        if stripped.startswith("#"):
+        # Must contain suspicious variable name
+        if not any(keyword in left for keyword in SUSPICIOUS_KEYWORDS):
             continue
 
-        if "=" in stripped:
-            left, right = stripped.split("=", 1)
-
-            left = left.strip().lower()
-            right = right.strip()
+        # 🔒 ONLY literal string assignment
+        right = match.group("right")
+        if not right.lstrip().startswith(("\"", "'")):
+            continue
 
-            # Must contain suspicious variable name
-            if any(keyword in left for keyword in SUSPICIOUS_KEYWORDS):
+        if lines is None:
+            lines = LineIndex(code)
 
-                # 🔒 ONLY literal string assignment
-                if right.startswith(("\"", "'")):
-                    issues.append({
-                        "severity": "MEDIUM",
-                        "type": "Security",
-                        "message": f"Possible hardcoded secret involving '{left}'",
-                        "impact": "Credentials may be exposed in source code",
-                        "suggestion": "Use environment variables or a secrets manager"
-                    })
+        issues.append({
+            "rule_id": "generic.hardcoded-secret",
+            "severity": "MEDIUM",
+            "type": "Security",
+            "message": f"Possible hardcoded secret involving '{left}'",
+            "impact": "Credentials may be exposed in source code",
+            "suggestion": "Use environment variables or a secrets manager",
+            **lines.span(match.start("left"), match.start("right") + len(right.rstrip()))
+        })
 
     return issues
 
@@ -56,12 +75,27 @@ def analyze_generic(code: str):
 
 class PythonCodeAnalyzer(ast.NodeVisitor):
 
-    def __init__(self):
+    def __init__(self, lines=None):
         self.issues = []
+        self.lines = lines
         self.builtin_names = set(dir(builtins))
 
+        # Metrics are collected in the same traversal as the rules
+        self.module_scope = new_scope("<module>", 1, 1)
+        self.scope = self.module_scope
+        self.function_scopes = []
+        self.names = []             # enclosing class / function names
+        self.class_depth = 0        # > 0 while directly inside a class body
+        self.class_count = 0
+
+        # String literals for the secret detector: (text, location)
+        self.literals = []
+
+    def metrics(self, code):
+        return file_report(code, self.module_scope, self.function_scopes, self.class_count)
+
     # -----------------------------------------------------
-    # Long function detection
+    # Long function detection (+ per-function metrics)
     # -----------------------------------------------------
     def visit_FunctionDef(self, node):
         if hasattr(node, "end_lineno") and node.end_lineno:
@@ -69,15 +103,131 @@ class PythonCodeAnalyzer(ast.NodeVisitor):
 
             if length > 40:
                 self.issues.append({
+                    "rule_id": "python.long-function",
                     "severity": "MEDIUM",
                     "type": "Maintainability",
                     "message": f"Function '{node.name}' is too long ({length} lines)",
                     "impact": "Hard to maintain and test",
-                    "suggestion": "Break the function into smaller functions"
+                    "suggestion": "Break the function into smaller functions",
+                    **node_span(node, self.lines)
                 })
 
+        outer_scope, outer_class_depth = self.scope, self.class_depth
+
+        self.names.append(node.name)
+        self.scope = new_scope(
+            ".".join(self.names), node.lineno, node.end_lineno or node.lineno,
+            parameter_count(node, is_method=self.class_depth > 0)
+        )
+        self.class_depth = 0
+
         self.generic_visit(node)
 
+        self.function_scopes.append(self.scope)
+        self.scope, self.class_depth = outer_scope, outer_class_depth
+        self.names.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        self.class_count += 1
+        self.names.append(node.name)
+        self.class_depth += 1
+        self.generic_visit(node)
+        self.class_depth -= 1
+        self.names.pop()
+
+    # -----------------------------------------------------
+    # Complexity / nesting (decision points and blocks)
+    # -----------------------------------------------------
+    def nested_block(self, node, decisions=0):
+        scope = self.scope
+        scope["complexity"] += decisions
+        scope["depth"] += 1
+        if scope["depth"] > scope["max_nesting"]:
+            scope["max_nesting"] = scope["depth"]
+
+        self.generic_visit(node)
+        scope["depth"] -= 1
+
+    def visit_If(self, node):
+        scope = self.scope
+        scope["complexity"] += 1
+        scope["depth"] += 1
+        if scope["depth"] > scope["max_nesting"]:
+            scope["max_nesting"] = scope["depth"]
+
+        self.visit(node.test)
+        for statement in node.body:
+            self.visit(statement)
+        scope["depth"] -= 1
+
+        # 'elif' stays at the same nesting level as its 'if'
+        if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+            self.visit(node.orelse[0])
+        elif node.orelse:
+            scope["depth"] += 1
+            for statement in node.orelse:
+                self.visit(statement)
+            scope["depth"] -= 1
+
+    def visit_For(self, node):
+        self.nested_block(node, 1)
+
+    visit_AsyncFor = visit_For
+    visit_While = visit_For
+
+    def visit_With(self, node):
+        self.nested_block(node)
+
+    visit_AsyncWith = visit_With
+    visit_Try = visit_With
+    visit_Match = visit_With
+
+    def decision_point(self, node):
+        self.scope["complexity"] += 1
+        self.generic_visit(node)
+
+    visit_ExceptHandler = decision_point
+    visit_IfExp = decision_point
+    visit_Assert = decision_point
+    visit_match_case = decision_point
+
+    def visit_comprehension(self, node):
+        self.scope["complexity"] += 1 + len(node.ifs)
+        self.generic_visit(node)
+
+    # -----------------------------------------------------
+    # Halstead operators / operands
+    # -----------------------------------------------------
+    def visit_BoolOp(self, node):
+        extra = len(node.values) - 1
+        self.scope["complexity"] += extra
+        self.scope["operators"][node.op.__class__] += extra
+        self.generic_visit(node)
+
+    def visit_BinOp(self, node):
+        self.scope["operators"][node.op.__class__] += 1
+        self.generic_visit(node)
+
+    visit_UnaryOp = visit_BinOp
+    visit_AugAssign = visit_BinOp
+
+    def visit_Compare(self, node):
+        operators = self.scope["operators"]
+        for op in node.ops:
+            operators[op.__class__] += 1
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        self.scope["operands"][node.id] += 1
+
+    def visit_Constant(self, node):
+        self.scope["operands"][node.value] += 1
+
+        if isinstance(node.value, str) and len(node.value) >= MIN_SECRET_LENGTH:
+            self.literals.append((node.value, node_span(node, self.lines)))
+
     # -----------------------------------------------------
     # Dangerous calls (STRICT)
     # -----------------------------------------------------
@@ -88,20 +238,24 @@ class PythonCodeAnalyzer(ast.NodeVisitor):
 
             if func_name in DANGEROUS_CALLS:
                 self.issues.append({
+                    "rule_id": "python.dangerous-call",
                     "severity": "CRITICAL",
                     "type": "Security",
                     "message": f"Dangerous function '{func_name}()' detected",
                     "impact": "May allow arbitrary code execution",
-                    "suggestion": "Avoid dynamic execution functions"
+                    "suggestion": "Avoid dynamic execution functions",
+                    **node_span(node, self.lines)
                 })
 
             if func_name == "print":
                 self.issues.append({
+                    "rule_id": "python.print",
                     "severity": "LOW",
                     "type": "Code Smell",
                     "message": "Use of print() detected",
                     "impact": "Not suitable for production logging",
-                    "suggestion": "Use a logging framework instead"
+                    "suggestion": "Use a logging framework instead",
+                    **node_span(node, self.lines)
                 })
 
         # Attribute calls like os.system()
@@ -110,11 +264,13 @@ class PythonCodeAnalyzer(ast.NodeVisitor):
 
             if full_name == "system":
                 self.issues.append({
+                    "rule_id": "python.os-system",
                     "severity": "CRITICAL",
                     "type": "Security",
                     "message": "Dangerous function 'os.system()' detected",
                     "impact": "May allow arbitrary command execution",
-                    "suggestion": "Avoid os.system; use safer subprocess APIs"
+                    "suggestion": "Avoid os.system; use safer subprocess APIs",
+                    **node_span(node, self.lines)
                 })
 
         self.generic_visit(node)
@@ -133,30 +289,128 @@ class PythonCodeAnalyzer(ast.NodeVisitor):
 
                     if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
                         self.issues.append({
+                            "rule_id": "python.hardcoded-secret",
                             "severity": "CRITICAL",
                             "type": "Security",
                             "message": f"Hardcoded sensitive value assigned to '{target.id}'",
                             "impact": "High risk of credential leakage",
-                            "suggestion": "Use environment variables or a secrets manager"
+                            "suggestion": "Use environment variables or a secrets manager",
+                            **node_span(node, self.lines)
                         })
 
         self.generic_visit(node)
 
 
-def analyze_python(code: str):
+class InstrumentedPythonCodeAnalyzer(PythonCodeAnalyzer):
+    """
+    Same rules, plus per-visitor self time and matches.
+
+    Used only while rule stats are collected, so the default visitor
+    carries no timing code at all. Time spent traversing children is
+    not charged to the visitor that triggered the traversal.
+    """
+
+    VISITORS = ["visit_FunctionDef", "visit_AsyncFunctionDef", "visit_Call", "visit_Assign"]
+
+    def __init__(self, lines=None):
+        super().__init__(lines)
+        self.current = None
+        self.mark = time.perf_counter_ns()
+        self.issue_mark = 0
+        self.invocations = Counter()
+        self.elapsed = Counter()
+        self.rules = defaultdict(Counter)
+
+    def switch(self, check):
+        """
+        Charges time / new issues since the last switch to the current check.
+        """
+        now = time.perf_counter_ns()
+
+        if self.current is not None:
+            self.elapsed[self.current] += now - self.mark
+            for issue in self.issues[self.issue_mark:]:
+                self.rules[self.current][issue["rule_id"]] += 1
+
+        self.issue_mark = len(self.issues)
+        previous, self.current, self.mark = self.current, check, now
+        return previous
+
+    def generic_visit(self, node):
+        previous = self.switch(None)
+        super().generic_visit(node)
+        self.switch(previous)
+
+    def record(self, stats, path):
+        self.switch(None)
+        for check, invocations in self.invocations.items():
+            stats.record(
+                check, self.elapsed[check], invocations,
+                rules=self.rules[check], path=path
+            )
+
+
+def _instrumented(name, check):
+    visitor = getattr(PythonCodeAnalyzer, name)
+
+    def visit(self, node):
+        previous = self.switch(check)
+        self.invocations[check] += 1
+        visitor(self, node)
+        self.switch(previous)
+
+    return visit
+
+
+# Rule visitors are reported individually, metric-only visitors together
+for _name in dir(PythonCodeAnalyzer):
+    if _name.startswith("visit_"):
+        if _name in InstrumentedPythonCodeAnalyzer.VISITORS:
+            _check = "PythonCodeAnalyzer." + _name
+        else:
+            _check = "PythonCodeAnalyzer.metrics"
+        setattr(InstrumentedPythonCodeAnalyzer, _name, _instrumented(_name, _check))
+
+
+def analyze_python(code: str, tree=None, stats=None, path=None, metrics=None, lines=None):
+    """
+    'metrics', when given, is filled with the file's code metrics
+    (collected in the same traversal as the rules).
+    """
     try:
-        tree = ast.parse(code)
+        if tree is None:
+            tree = ast.parse(code)
     except SyntaxError as e:
-        return [{
+        issue = {
+            "rule_id": "python.syntax-error",
             "severity": "CRITICAL",
             "type": "Syntax Error",
             "message": f"Python syntax error at line {e.lineno}",
             "impact": "Code will not run",
             "suggestion": "Fix syntax before deployment"
-        }]
+        }
+        for key, value in (("line", e.lineno), ("column", e.offset),
+                           ("end_line", e.end_lineno), ("end_column", e.end_offset)):
+            if value:
+                issue[key] = value
+        return [issue]
+
+    if lines is None:
+        lines = LineIndex(code)
+
+    if stats is None:
+        analyzer = PythonCodeAnalyzer(lines)
+        analyzer.visit(tree)
+    else:
+        analyzer = InstrumentedPythonCodeAnalyzer(lines)
+        analyzer.visit(tree)
+        analyzer.record(stats, path)
+
+    if metrics is not None:
+        metrics.update(analyzer.metrics(code))
 
-    analyzer = PythonCodeAnalyzer()
-    analyzer.visit(tree)
+    # Literals were collected in the same traversal; scored in one batch
+    analyzer.issues.extend(measure(stats, "detect_secrets", path, detect_secrets, analyzer.literals))
 
     return analyzer.issues
 
@@ -165,27 +419,33 @@ def analyze_python(code: str):
 # JAVASCRIPT ANALYZER (SAFE)
 # =========================================================
 
-def analyze_javascript(code: str):
+def analyze_javascript(code: str, lines=None):
 
     issues = []
-    lowered = code.lower()
 
-    if "process.exit(" in lowered:
+    if lines is None:
+        lines = LineIndex(code)
+
+    for match in JS_PROCESS_EXIT.finditer(code):
         issues.append({
+            "rule_id": "javascript.process-exit",
             "severity": "CRITICAL",
             "type": "Stability",
             "message": "process.exit() detected",
             "impact": "Calling process.exit() can crash the server",
-            "suggestion": "Remove process.exit() from request handlers"
+            "suggestion": "Remove process.exit() from request handlers",
+            **lines.span(match.start(), match.end())
         })
 
-    if "/ 0" in code:
+    for match in JS_DIVISION_BY_ZERO.finditer(code):
         issues.append({
+            "rule_id": "javascript.division-by-zero",
             "severity": "LOW",
             "type": "Logic",
             "message": "Division by zero detected",
             "impact": "May result in invalid output",
-            "suggestion": "Validate divisor before division"
+            "suggestion": "Validate divisor before division",
+            **lines.span(match.start(), match.end())
         })
 
     return issues
@@ -195,22 +455,39 @@ def analyze_javascript(code: str):
 # MAIN DISPATCHER
 # =========================================================
 
-def analyze_code(code: str, language: str):
+def analyze_code(code: str, language: str, tree=None, path=None, metrics=None, lines=None,
+                 suppressions=None):
+    """
+    'lines' is the file's LineIndex when the caller already built one;
+    every rule locates its issues through the same index.
+    'suppressions' is the file's inline suppression index (built here
+    when not given); suppressed issues are dropped, the rest get the
+    context hash their baseline fingerprint is built from.
+    """
+
+    # Per-rule counters (None unless the request opted in)
+    stats = active_rule_stats()
+
+    if lines is None:
+        lines = LineIndex(code)
 
     issues = []
 
-    issues.extend(analyze_generic(code))
+    issues.extend(measure(stats, "analyze_generic", path, analyze_generic, code, lines))
 
     language = language.lower()
 
     if language == "python":
-        issues.extend(analyze_python(code))
+        issues.extend(analyze_python(code, tree, stats, path, metrics, lines))
 
     elif language == "javascript":
-        issues.extend(analyze_javascript(code))
+        issues.extend(measure(stats, "analyze_javascript", path, analyze_javascript, code, lines))
+        issues.extend(measure(stats, "detect_secrets", path, detect_secrets, string_literals(code, lines)))
 
     else:
+        issues.extend(measure(stats, "detect_secrets", path, detect_secrets, string_literals(code, lines)))
         issues.append({
+            "rule_id": "generic.unsupported-language",
             "severity": "LOW",
             "type": "Unsupported Language",
             "message": f"No deep analysis available for '{language}'",
@@ -218,4 +495,7 @@ def analyze_code(code: str, language: str):
             "suggestion": "Add a language-specific analyzer plugin"
         })
 
-    return issues
+    if suppressions is None:
+        suppressions = suppression_index(code, lines)
+
+    return add_context_hashes(without_suppressed(issues, suppressions), lines)
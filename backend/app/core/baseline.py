@@ -0,0 +1,298 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
+import numpy as np
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Read at first use: .env is loaded after the routers are imported
+def _baseline_dir():
+    return os.getenv("BASELINE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "quality-gate", "baselines"
+    )
+
+
+BASELINE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,99}$")
+
+# Bump when the fingerprint recipe changes (old baselines stop matching)
+FINGERPRINT_VERSION = "1"
+
+# '# quality-gate: ignore' or '// quality-gate: ignore[rule-a, rule-b]'
+SUPPRESSION_MARKER = "quality-gate:"
+SUPPRESSION = re.compile(r"quality-gate:\s*ignore(?:\[([^\]\r\n]*)\])?")
+COMMENT_LEADERS = ("#", "//", "/*", "--")
+
+# Marker without a rule list: every rule on the line
+ALL_RULES = "*"
+
+
+class BaselineError(ValueError):
+    pass
+
+
+# =========================================================
+# INLINE SUPPRESSIONS
+# =========================================================
+
+def suppression_index(code, lines):
+    """
+    {line: [rule ids] or "*"} from 'quality-gate: ignore[...]' comments,
+    built with one scan per file (none when the marker never occurs).
+    A comment on a line of its own applies to the next line.
+    """
+    if SUPPRESSION_MARKER not in code:
+        return {}
+
+    index = {}
+
+    for match in SUPPRESSION.finditer(code):
+        line, column = lines.position(match.start())
+
+        prefix = lines.line_text(line)[:column - 1].strip()
+        if prefix in COMMENT_LEADERS:
+            line += 1
+
+        rules = [rule.strip() for rule in (match.group(1) or "").split(",") if rule.strip()]
+
+        if not rules or index.get(line) == ALL_RULES:
+            index[line] = ALL_RULES
+        else:
+            index.setdefault(line, []).extend(rules)
+
+    return index
+
+
+def is_suppressed(issue, index):
+    if not index:
+        return False
+
+    rules = index.get(issue.get("line"))
+    return rules is not None and (rules == ALL_RULES or issue.get("rule_id") in rules)
+
+
+def without_suppressed(issues, index):
+    if not index:
+        return issues
+    return [issue for issue in issues if not is_suppressed(issue, index)]
+
+
+# =========================================================
+# FINGERPRINTS
+# =========================================================
+
+def _hash64(text):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).hexdigest()
+
+
+def add_context_hashes(issues, lines):
+    """
+    Path-independent part of each issue's fingerprint: rule id, the
+    source line it starts on without whitespace (so moving or
+    reformatting code keeps it) and its ordinal among identical
+    (rule, line text) pairs in the file. Per-file results stay
+    cacheable by content.
+    """
+    seen = {}
+
+    for issue in issues:
+        line = issue.get("line")
+        if line and line <= len(lines):
+            context = "".join(lines.line_text(line).split())
+        else:
+            context = " ".join((issue.get("message") or "").split())
+
+        key = (issue.get("rule_id"), context)
+        ordinal = seen.get(key, 0)
+        seen[key] = ordinal + 1
+
+        issue["context_hash"] = _hash64(f"{FINGERPRINT_VERSION}\0{key[0]}\0{context}\0{ordinal}")
+
+    return issues
+
+
+def fingerprint(issue, path=None, ordinal=0):
+    """
+    Stable 64-bit fingerprint (16 hex chars): rule id, path and the
+    normalized code context. Issues without a context hash (cross-file
+    checks) use their message, which names the symbols involved, plus
+    their ordinal among identical messages.
+    """
+    context = issue.get("context_hash")
+    if context is None:
+        context = " ".join((issue.get("message") or "").split()) + f"\0{ordinal}"
+
+    path = path if path is not None else issue.get("path")
+    return _hash64(f"{FINGERPRINT_VERSION}\0{issue.get('rule_id')}\0{path or '<code>'}\0{context}")
+
+
+def fingerprint_issues(issues):
+    """
+    Sets issue["fingerprint"] (and drops the context hash); returns the
+    fingerprints as a uint64 array in issue order.
+    """
+    values = np.empty(len(issues), dtype=np.uint64)
+    seen = {}
+
+    for position, issue in enumerate(issues):
+        ordinal = 0
+        if "context_hash" not in issue:
+            key = (issue.get("rule_id"), issue.get("path"), issue.get("message"))
+            ordinal = seen.get(key, 0)
+            seen[key] = ordinal + 1
+
+        issue["fingerprint"] = fingerprint(issue, ordinal=ordinal)
+        issue.pop("context_hash", None)
+        values[position] = int(issue["fingerprint"], 16)
+
+    return values
+
+
+def parse_fingerprints(values):
+    try:
+        return np.unique(np.fromiter((int(value, 16) for value in values), dtype=np.uint64))
+    except (TypeError, ValueError, OverflowError):
+        raise BaselineError("Fingerprints must be 16-character hex strings")
+
+
+# =========================================================
+# BASELINE STORE
+# =========================================================
+
+class Baseline:
+    """
+    Sorted, unique uint64 fingerprints; membership is a vectorized
+    binary search, so a 100k-entry baseline matches in microseconds
+    per issue and loads as one array read.
+    """
+
+    __slots__ = ("name", "fingerprints", "revision")
+
+    def __init__(self, name, fingerprints):
+        self.name = name
+        self.fingerprints = fingerprints
+        self.revision = hashlib.sha256(fingerprints.tobytes()).hexdigest()[:16]
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def contains(self, values):
+        """
+        bool array: which of 'values' (uint64) are in the baseline.
+        """
+        if not len(self.fingerprints) or not len(values):
+            return np.zeros(len(values), dtype=bool)
+
+        positions = np.searchsorted(self.fingerprints, values)
+        positions[positions == len(self.fingerprints)] = 0
+        return self.fingerprints[positions] == values
+
+    def describe(self):
+        return {"name": self.name, "size": len(self), "revision": self.revision}
+
+
+class BaselineStore:
+    """
+    One baseline per project name, stored as raw little-endian uint64
+    files (written atomically) and kept in memory once loaded.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.loaded = {}
+        self.lock = threading.Lock()
+
+    def _path(self, name):
+        if not BASELINE_NAME.match(name or ""):
+            raise BaselineError("Baseline names are 1-100 characters: letters, digits, '.', '_' or '-'")
+        return os.path.join(self.directory, f"{name}.fp")
+
+    def get(self, name):
+        """
+        The baseline, or None when none is stored under 'name'.
+        """
+        path = self._path(name)
+
+        with self.lock:
+            baseline = self.loaded.get(name)
+            if baseline is None:
+                try:
+                    fingerprints = np.fromfile(path, dtype="<u8").astype(np.uint64)
+                except (FileNotFoundError, ValueError):
+                    return None
+                baseline = self.loaded[name] = Baseline(name, fingerprints)
+
+        return baseline
+
+    def save(self, name, fingerprints, merge=False):
+        path = self._path(name)
+        fingerprints = np.unique(np.asarray(fingerprints, dtype=np.uint64))
+
+        if merge:
+            existing = self.get(name)
+            if existing is not None:
+                fingerprints = np.union1d(existing.fingerprints, fingerprints)
+
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "wb") as output:
+            output.write(fingerprints.astype("<u8").tobytes())
+        os.replace(temp, path)
+
+        baseline = Baseline(name, fingerprints)
+        with self.lock:
+            self.loaded[name] = baseline
+        return baseline
+
+    def delete(self, name):
+        path = self._path(name)
+        with self.lock:
+            self.loaded.pop(name, None)
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def names(self):
+        try:
+            return sorted(entry[:-3] for entry in os.listdir(self.directory) if entry.endswith(".fp"))
+        except FileNotFoundError:
+            return []
+
+
+_store = None
+
+
+def baseline_store():
+    """
+    Process-wide store under BASELINE_DIR (created on first use).
+    """
+    global _store
+    if _store is None:
+        _store = BaselineStore(_baseline_dir())
+    return _store
+
+
+def apply_baseline(issues, baseline=None):
+    """
+    Fingerprints every issue and drops the ones in 'baseline'.
+    Returns (new issues, their fingerprints, suppressed count).
+    """
+    fingerprints = fingerprint_issues(issues)
+
+    if baseline is None:
+        return issues, fingerprints, 0
+
+    known = baseline.contains(fingerprints)
+    suppressed = int(known.sum())
+
+    if not suppressed:
+        return issues, fingerprints, 0
+
+    kept = [issue for issue, matched in zip(issues, known.tolist()) if not matched]
+    return kept, fingerprints[~known], suppressed
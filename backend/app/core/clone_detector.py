@@ -0,0 +1,476 @@
+import ast
+import hashlib
+import json
+from collections import defaultdict
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.core.line_index import node_span
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+CLONE_INDEX_VERSION = 3
+
+MIN_TOKENS = 30          # ignore trivial functions (getters, stubs)
+KGRAM = 9                # k-gram length over normalized AST tokens
+WINDOW = 4               # winnowing window
+NUM_PERM = 32            # MinHash signature length
+BANDS = 8                # LSH bands (NUM_PERM / BANDS rows each)
+SIMILARITY_THRESHOLD = 0.8
+
+MASK64 = (1 << 64) - 1
+
+# k-gram rolling hash base (FNV-64 prime)
+KGRAM_BASE = 0x100000001B3
+
+
+def _stable_id(name):
+    """
+    32-bit id from a name: the same on every interpreter and process
+    (hash() is salted, and dir(ast) differs between Python versions).
+    """
+    return int.from_bytes(hashlib.blake2b(name.encode("ascii"), digest_size=4).digest(), "big")
+
+
+_TOKEN_IDS = {
+    node_type: _stable_id(name)
+    for name, node_type in vars(ast).items()
+    if isinstance(node_type, type) and issubclass(node_type, ast.AST)
+}
+_LITERAL_IDS = {
+    literal: _stable_id("literal:" + literal.__name__)
+    for literal in [str, bytes, int, float, complex, bool, type(None)]
+}
+
+
+def _splitmix64(value):
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def _splitmix64_array(values):
+    """
+    _splitmix64 over a uint64 array (NumPy wraps mod 2^64).
+    """
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+# Weight of each k-gram position: hash = sum(token[j] * BASE^(KGRAM-1-j))
+_KGRAM_POWERS = np.array(
+    [pow(KGRAM_BASE, KGRAM - 1 - offset, 1 << 64) for offset in range(KGRAM)],
+    dtype=np.uint64
+)
+
+# MinHash permutations h → a*h + b (mod 2^64)
+_PERMUTATIONS = [
+    (_splitmix64(2 * i + 1) | 1, _splitmix64(2 * i + 2))
+    for i in range(NUM_PERM)
+]
+_PERMUTATION_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)
+_PERMUTATION_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)
+
+
+# =========================================================
+# NORMALIZED AST FINGERPRINTS
+# =========================================================
+
+def normalized_tokens(node):
+    """
+    Pre-order node-type sequence of a function body.
+    Identifiers and literal values are dropped, literal types kept,
+    so renamed copies produce the same sequence.
+    """
+    tokens = []
+    append = tokens.append
+    stack = list(reversed(node.body))
+
+    while stack:
+        current = stack.pop()
+
+        if isinstance(current, ast.expr_context):
+            continue
+
+        append(_TOKEN_IDS.get(type(current), 0))
+
+        if isinstance(current, ast.Constant):
+            append(_LITERAL_IDS.get(type(current.value), 0))
+
+        children = []
+        for field in current._fields:
+            value = getattr(current, field, None)
+            if isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, ast.AST))
+            elif isinstance(value, ast.AST):
+                children.append(value)
+        children.reverse()
+        stack.extend(children)
+
+    return tokens
+
+
+def winnow(tokens):
+    """
+    k-gram hashes reduced by winnowing (min of each window), as a sorted
+    unique uint64 array. The k-gram hash is polynomial (mod 2^64), so it
+    does not depend on the interpreter's hash(); all k-grams are hashed
+    at once, one multiply-add per k-gram position.
+    """
+    if len(tokens) < KGRAM:
+        return np.empty(0, dtype=np.uint64)
+
+    tokens = np.asarray(tokens, dtype=np.uint64)
+    count = len(tokens) - KGRAM + 1
+
+    values = np.zeros(count, dtype=np.uint64)
+    for offset, power in enumerate(_KGRAM_POWERS):
+        values += tokens[offset:offset + count] * power
+
+    hashes = _splitmix64_array(values)
+
+    if count <= WINDOW:
+        return hashes.min(keepdims=True)
+
+    return np.unique(sliding_window_view(hashes, WINDOW).min(axis=1))
+
+
+def minhash(fingerprints):
+    """
+    NUM_PERM minimums of a*h + b over the fingerprints (one matrix op).
+    """
+    hashes = np.asarray(fingerprints, dtype=np.uint64)
+    return (np.multiply.outer(hashes, _PERMUTATION_A) + _PERMUTATION_B).min(axis=0).tolist()
+
+
+def function_fingerprint(node):
+    """
+    Returns {"exact": str, "signature": [int]} or None for tiny bodies.
+    """
+    tokens = normalized_tokens(node)
+
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    exact = hashlib.sha1(
+        ",".join(map(str, tokens)).encode("ascii")
+    ).hexdigest()
+
+    return {
+        "exact": exact,
+        "signature": minhash(winnow(tokens))
+    }
+
+
+def extract_functions(code, tree=None):
+    """
+    Yields (qualified_name, line, node) for every function in a module.
+    """
+    if tree is None:
+        tree = ast.parse(code)
+    stack = [(tree, "")]
+
+    while stack:
+        parent, prefix = stack.pop()
+
+        for child in ast.iter_child_nodes(parent):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = prefix + child.name
+                yield qualname, child.lineno, child
+                stack.append((child, qualname + "."))
+            elif isinstance(child, ast.ClassDef):
+                stack.append((child, prefix + child.name + "."))
+
+
+def file_fingerprints(code, tree=None, lines=None):
+    """
+    [(qualified_name, location, fingerprint)] for one file (picklable).
+    Raises SyntaxError when the file cannot be parsed.
+    """
+    fingerprints = []
+
+    for name, _, node in extract_functions(code, tree):
+        fingerprint = function_fingerprint(node)
+        if fingerprint is not None:
+            fingerprints.append((name, node_span(node, lines), fingerprint))
+
+    return fingerprints
+
+
+def code_hash(code):
+    return hashlib.sha1(code.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+# =========================================================
+# LSH INDEX
+# =========================================================
+
+class CloneIndex:
+    """
+    Locality-sensitive hashing index over per-function MinHash signatures.
+
+    - Exact (renamed) clones share the normalized-AST hash
+    - Near-duplicates share at least one LSH band
+    - Files can be added / replaced / removed incrementally
+    """
+
+    def __init__(self):
+        self.entries = {}                    # id → entry
+        self.by_path = defaultdict(list)     # path → [id]
+        self.file_hashes = {}                # path → content hash
+        self.exact = defaultdict(set)        # exact hash → {id}
+        self.buckets = defaultdict(set)      # (band, band values) → {id}
+        self.next_id = 0
+
+    # -----------------------------------------------------
+    # Incremental updates
+    # -----------------------------------------------------
+    def add_file(self, path, code, tree=None, lines=None):
+        """
+        Indexes one file. Unchanged files are skipped.
+        Returns False when the file could not be parsed.
+        """
+        content_hash = code_hash(code)
+
+        if self.file_hashes.get(path) == content_hash:
+            return True
+
+        try:
+            fingerprints = file_fingerprints(code, tree, lines)
+        except SyntaxError:
+            self.remove_file(path)
+            return False
+
+        self.add_fingerprints(path, content_hash, fingerprints)
+        return True
+
+    def add_fingerprints(self, path, content_hash, fingerprints):
+        """
+        Indexes precomputed file_fingerprints() output (e.g. from a worker).
+        """
+        if self.file_hashes.get(path) == content_hash:
+            return
+
+        self.remove_file(path)
+        self.file_hashes[path] = content_hash
+
+        for name, location, fingerprint in fingerprints:
+            self._insert({
+                "path": path,
+                "name": name,
+                "location": location,
+                "exact": fingerprint["exact"],
+                "signature": fingerprint["signature"]
+            })
+
+    def remove_file(self, path):
+        for entry_id in self.by_path.pop(path, []):
+            entry = self.entries.pop(entry_id)
+
+            self.exact[entry["exact"]].discard(entry_id)
+            if not self.exact[entry["exact"]]:
+                del self.exact[entry["exact"]]
+
+            for band_key in self._band_keys(entry["signature"]):
+                bucket = self.buckets[band_key]
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self.buckets[band_key]
+
+        self.file_hashes.pop(path, None)
+
+    def _insert(self, entry):
+        entry_id = self.next_id
+        self.next_id += 1
+
+        self.entries[entry_id] = entry
+        self.by_path[entry["path"]].append(entry_id)
+        self.exact[entry["exact"]].add(entry_id)
+
+        for band_key in self._band_keys(entry["signature"]):
+            self.buckets[band_key].add(entry_id)
+
+    @staticmethod
+    def _band_keys(signature):
+        rows = NUM_PERM // BANDS
+        return [
+            (band, tuple(signature[band * rows:(band + 1) * rows]))
+            for band in range(BANDS)
+        ]
+
+    # -----------------------------------------------------
+    # Clone classes
+    # -----------------------------------------------------
+    def clone_groups(self):
+        """
+        Returns lists of entry ids linked by clone matches.
+
+        Each bucket is linked as a star around its first member,
+        so the work is linear in the number of bucket memberships.
+        Groups are transitive: two members need not match each other
+        (see _matched_original).
+        """
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        def union(a, b):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        for members in self.exact.values():
+            if len(members) > 1:
+                ordered = sorted(members)
+                for other in ordered[1:]:
+                    union(ordered[0], other)
+
+        for members in self.buckets.values():
+            if len(members) < 2:
+                continue
+
+            ordered = sorted(members)
+            head = self.entries[ordered[0]]["signature"]
+
+            for other in ordered[1:]:
+                if find(other) == find(ordered[0]):
+                    continue
+                if similarity(head, self.entries[other]["signature"]) >= SIMILARITY_THRESHOLD:
+                    union(ordered[0], other)
+
+        groups = defaultdict(list)
+        for entry_id in parent:
+            groups[find(entry_id)].append(entry_id)
+
+        return [sorted(group) for group in groups.values() if len(group) > 1]
+
+    # -----------------------------------------------------
+    # Persistence
+    # -----------------------------------------------------
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({
+                "version": CLONE_INDEX_VERSION,
+                "params": [KGRAM, WINDOW, NUM_PERM, BANDS],
+                "files": self.file_hashes,
+                "entries": list(self.entries.values())
+            }, handle)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+
+        # Incompatible parameters → start from an empty index
+        if (
+            data.get("version") != CLONE_INDEX_VERSION
+            or data.get("params") != [KGRAM, WINDOW, NUM_PERM, BANDS]
+        ):
+            return index
+
+        index.file_hashes = dict(data.get("files", {}))
+        for entry in data.get("entries", []):
+            index._insert(entry)
+
+        return index
+
+
+def similarity(signature_a, signature_b):
+    """
+    Estimated Jaccard similarity of two MinHash signatures.
+    """
+    same = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return same / NUM_PERM
+
+
+# =========================================================
+# PROJECT-LEVEL ISSUES
+# =========================================================
+
+def _matched_original(index, group, position, first_exact):
+    """
+    The earliest group member that group[position] matches directly:
+    the same normalized AST, else a similar signature. Every member but
+    the first has one, since each union links an entry to a smaller id.
+    'first_exact': exact hash → earliest member with it.
+    """
+    entry = index.entries[group[position]]
+
+    original_id = first_exact[entry["exact"]]
+    if original_id != group[position]:
+        return original_id, True
+
+    for original_id in group[:position]:
+        if similarity(index.entries[original_id]["signature"], entry["signature"]) >= SIMILARITY_THRESHOLD:
+            return original_id, False
+
+    return None, False
+
+
+def clone_issues(index):
+    """
+    Input: populated CloneIndex
+    Output: list of 'Duplicate Code' issues, each naming a function the
+    reported one matches directly (not just through the group)
+    """
+
+    issues = []
+
+    for group in index.clone_groups():
+        first_exact = {}
+        for entry_id in group:
+            first_exact.setdefault(index.entries[entry_id]["exact"], entry_id)
+
+        for position in range(1, len(group)):
+            original_id, identical = _matched_original(index, group, position, first_exact)
+            if original_id is None:
+                continue
+
+            entry = index.entries[group[position]]
+            original = index.entries[original_id]
+            kind = "identical to" if identical else "a near-duplicate of"
+
+            issues.append({
+                "rule_id": "project.duplicate-code",
+                "severity": "MEDIUM",
+                "type": "Duplicate Code",
+                "message": (
+                    f"Function '{entry['name']}' is {kind} "
+                    f"'{original['name']}' in {original['path']}"
+                ),
+                "impact": "Copy-pasted logic must be fixed in several places",
+                "suggestion": "Extract the shared logic into one function",
+                "path": entry["path"],
+                **entry["location"]
+            })
+
+    return issues
+
+
+def detect_clones(files, index=None):
+    """
+    Input: list of ProjectFile (optionally an existing CloneIndex)
+    Output: list of 'Duplicate Code' issues
+    """
+
+    if index is None:
+        index = CloneIndex()
+
+    for file in files:
+        if file.path.endswith(".py"):
+            index.add_file(file.path, file.code)
+
+    return clone_issues(index)
@@ -0,0 +1,118 @@
+import math
+from collections import Counter
+
+# =========================================================
+# CODE METRICS (filled by PythonCodeAnalyzer's traversal)
+# =========================================================
+#
+# A "scope" is the module or one function. The analyzer updates the
+# innermost scope while it walks the tree for the rules; nothing here
+# walks the AST again.
+
+
+def new_scope(name, line, end_line, params=0):
+    return {
+        "name": name,
+        "line": line,
+        "end_line": end_line,
+        "params": params,
+        "complexity": 1,
+        "depth": 0,
+        "max_nesting": 0,
+        "operators": Counter(),
+        "operands": Counter()
+    }
+
+
+def parameter_count(node, is_method=False):
+    args = node.args
+    count = len(args.posonlyargs) + len(args.args) + len(args.kwonlyargs)
+    count += bool(args.vararg) + bool(args.kwarg)
+
+    # 'self' / 'cls' are not real inputs
+    positional = args.posonlyargs + args.args
+    if is_method and positional and positional[0].arg in ("self", "cls"):
+        count -= 1
+
+    return count
+
+
+def halstead(operators, operands):
+    distinct_operators = len(operators)
+    distinct_operands = len(operands)
+    total_operators = sum(operators.values())
+    total_operands = sum(operands.values())
+
+    vocabulary = distinct_operators + distinct_operands
+    length = total_operators + total_operands
+    volume = length * math.log2(vocabulary) if vocabulary > 1 else 0
+    difficulty = (
+        (distinct_operators / 2) * (total_operands / distinct_operands)
+        if distinct_operands else 0
+    )
+
+    return {
+        "distinct_operators": distinct_operators,
+        "distinct_operands": distinct_operands,
+        "total_operators": total_operators,
+        "total_operands": total_operands,
+        "volume": round(volume, 2),
+        "difficulty": round(difficulty, 2),
+        "effort": round(difficulty * volume, 2)
+    }
+
+
+def function_report(scope):
+    return {
+        "name": scope["name"],
+        "line": scope["line"],
+        "length": scope["end_line"] - scope["line"] + 1,
+        "params": scope["params"],
+        "complexity": scope["complexity"],
+        "max_nesting": scope["max_nesting"],
+        "halstead": halstead(scope["operators"], scope["operands"])
+    }
+
+
+def file_report(code, module_scope, function_scopes, class_count):
+    """
+    Per-file size metrics plus the per-function list.
+    """
+    lines = code.splitlines()
+    blank = 0
+    comments = 0
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blank += 1
+        elif stripped.startswith("#"):
+            comments += 1
+
+    operators = Counter(module_scope["operators"])
+    operands = Counter(module_scope["operands"])
+    for scope in function_scopes:
+        operators.update(scope["operators"])
+        operands.update(scope["operands"])
+
+    functions = sorted(
+        (function_report(scope) for scope in function_scopes),
+        key=lambda f: f["line"]
+    )
+    complexities = [f["complexity"] for f in functions]
+
+    return {
+        "lines": len(lines),
+        "sloc": len(lines) - blank - comments,
+        "comment_lines": comments,
+        "function_count": len(functions),
+        "class_count": class_count,
+        "module_complexity": module_scope["complexity"],
+        "max_complexity": max(complexities, default=0),
+        "average_complexity": round(sum(complexities) / len(complexities), 2) if complexities else 0,
+        "max_nesting": max(
+            [module_scope["max_nesting"]] + [f["max_nesting"] for f in functions]
+        ),
+        "halstead": halstead(operators, operands),
+        "functions": functions
+    }
@@ -1,3 +1,7 @@
+import os
+
+from app.core.line_index import location_of
+
 # =========================================================
 # DEDUPLICATION LAYER
 # =========================================================
@@ -22,7 +26,7 @@ def normalize(value: str):
 def extract_target(issue: dict):
     """
     Identify the logical target of an issue.
-    Used for deduplication.
+    Used for grouping.
     """
     msg = normalize(issue.get("message", ""))
 
@@ -35,6 +39,10 @@ def extract_target(issue: dict):
     if "print" in msg or "debug" in msg:
         return "print"
 
+    # Source → sink flows (kept apart from syntactic matches)
+    if "untrusted input" in msg:
+        return "tainted_flow"
+
     # Dangerous execution
     if any(k in msg for k in ["system", "exec", "eval"]):
         return "dynamic_execution"
@@ -42,57 +50,80 @@ def extract_target(issue: dict):
     return None
 
 
-def deduplicate_issues(issues: list):
+def group_key(issue: dict):
+    """
+    Logical identity of an issue: (type, target or message).
+    ALL LOW-severity print/debug issues share one key.
+    """
+    target = extract_target(issue)
+
+    if normalize(issue.get("severity")) == "low" and target == "print":
+        return ("low_print_issue",)
+
+    return (normalize(issue.get("type")), target or normalize(issue.get("message", "")))
+
+
+# =========================================================
+# GROUPED OCCURRENCES (PATH-AWARE)
+# =========================================================
+
+# Occurrences listed per group; 'count' keeps the full total
+MAX_OCCURRENCES = int(os.getenv("GROUP_MAX_OCCURRENCES", "100"))
+
+
+def _is_stronger(issue, existing):
+    new_sev = SEVERITY_RANK.get((issue.get("severity") or "").upper(), 0)
+    existing_sev = SEVERITY_RANK.get((existing.get("severity") or "").upper(), 0)
+
+    if new_sev != existing_sev:
+        return new_sev > existing_sev
+
+    return (issue.get("confidence", 0) or 0) > (existing.get("confidence", 0) or 0)
+
+
+def group_issues(issues, max_occurrences=MAX_OCCURRENCES):
     """
-    Deduplicate issues while preserving the strongest signal.
+    One group per logical issue (group_key), the strongest one kept, with
+    where it occurs instead of dropping the other copies:
+
+        {...strongest issue..., "count": 40,
+         "occurrences": [{"path": "a.py", "line": 3}, ...]}
 
-    Rules:
-    - CRITICAL / MEDIUM issues are NEVER removed
-    - LOW print/debug issues are merged into one
-    - Stronger severity/confidence always wins
+    Single pass over any iterable (raw issues can be a generator).
+    Memory is bounded by groups × max_occurrences, not by input size.
+    Identical (path, line) occurrences — e.g. the generic and Python
+    analyzers flagging the same secret — are counted once (exactly while
+    the group lists fewer than max_occurrences).
     """
-    deduped = {}
+    groups = {}
 
     for issue in issues:
-        # Safety guard
         if not isinstance(issue, dict):
             continue
 
-        severity = normalize(issue.get("severity"))
-        issue_type = normalize(issue.get("type"))
-        target = extract_target(issue)
-        message_key = normalize(issue.get("message", ""))
+        key = group_key(issue)
 
-        # 🔥 SPECIAL RULE:
-        # Merge ALL LOW-severity print/debug issues
-        if severity == "low" and target == "print":
-            key = ("low_print_issue",)
-        else:
-            key = (issue_type, target or message_key)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"issue": issue, "count": 0, "seen": set(), "occurrences": []}
+        elif _is_stronger(issue, group["issue"]):
+            group["issue"] = issue
 
-        if key not in deduped:
-            deduped[key] = issue
-            continue
+        occurrence = (issue.get("path"), issue.get("line"))
 
-        existing = deduped[key]
-
-        # Compare severity
-        existing_sev = SEVERITY_RANK.get(
-            existing.get("severity", "").upper(), 0
-        )
-        new_sev = SEVERITY_RANK.get(
-            issue.get("severity", "").upper(), 0
-        )
+        if occurrence in group["seen"]:
+            continue
 
-        # Compare confidence
-        existing_conf = existing.get("confidence", 0) or 0
-        new_conf = issue.get("confidence", 0) or 0
+        group["count"] += 1
 
-        # Keep stronger issue
-        if (
-            new_sev > existing_sev
-            or (new_sev == existing_sev and new_conf > existing_conf)
-        ):
-            deduped[key] = issue
+        if len(group["occurrences"]) < max_occurrences:
+            group["seen"].add(occurrence)
+            entry = dict(location_of(issue), path=occurrence[0], line=occurrence[1])
+            if issue.get("fingerprint"):
+                entry["fingerprint"] = issue["fingerprint"]
+            group["occurrences"].append(entry)
 
-    return list(deduped.values())
+    return [
+        dict(group["issue"], count=group["count"], occurrences=group["occurrences"])
+        for group in groups.values()
+    ]
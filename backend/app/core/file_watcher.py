@@ -0,0 +1,185 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+IGNORED_DIRECTORIES = {
+    ".git", ".hg", ".svn", "__pycache__", "node_modules",
+    ".venv", "venv", ".mypy_cache", ".pytest_cache", ".tox", "dist", "build"
+}
+
+# inotify flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def walk_files(root):
+    """
+    Yields every file under 'root', skipping ignored directories.
+    """
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = [d for d in subdirectories if d not in IGNORED_DIRECTORIES]
+        for name in files:
+            yield os.path.join(directory, name)
+
+
+# =========================================================
+# INOTIFY (LINUX)
+# =========================================================
+
+class InotifyWatcher:
+    """
+    Recursive inotify watcher using libc directly (no extra dependency).
+
+    read_changes() returns the set of changed file paths, or None when
+    the kernel queue overflowed and a full rescan is required.
+    """
+
+    def __init__(self, root):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root = root
+        self.directories = {}    # watch descriptor → directory
+
+        for directory, subdirectories, _ in os.walk(root):
+            subdirectories[:] = [d for d in subdirectories if d not in IGNORED_DIRECTORIES]
+            self.add_watch(directory)
+
+    def add_watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.directories[wd] = directory
+
+    def fileno(self):
+        return self.fd
+
+    def read_changes(self):
+        changed = set()
+
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+
+                if mask & IN_IGNORED:
+                    self.directories.pop(wd, None)
+                    continue
+
+                directory = self.directories.get(wd)
+                if directory is None or not name:
+                    continue
+
+                path = os.path.join(directory, os.fsdecode(name))
+
+                if mask & IN_ISDIR:
+                    if os.path.basename(path) in IGNORED_DIRECTORIES:
+                        continue
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # New directory: watch it and report what is inside
+                        for sub_directory, subdirectories, _ in os.walk(path):
+                            subdirectories[:] = [
+                                d for d in subdirectories if d not in IGNORED_DIRECTORIES
+                            ]
+                            self.add_watch(sub_directory)
+                        changed.update(walk_files(path))
+                    else:
+                        return None
+                    continue
+
+                changed.add(path)
+
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+# =========================================================
+# POLLING FALLBACK (NON-LINUX)
+# =========================================================
+
+class PollingWatcher:
+    """
+    mtime/size snapshot diff; used where inotify is unavailable.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        for path in walk_files(self.root):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def fileno(self):
+        return None
+
+    def read_changes(self):
+        current = self.scan()
+        changed = {
+            path for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(root):
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError):
+        return PollingWatcher(root)
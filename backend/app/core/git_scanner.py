@@ -0,0 +1,314 @@
+import ast
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from app.core.analyzer import analyze_code, RULES_VERSION
+from app.core.leak_index import leak_index_identity
+from app.core.language_detector import HEAD_BYTES, detect_language, language_for_path
+from app.core.line_index import LineIndex
+from app.core.baseline import suppression_index, is_suppressed
+from app.core.project_parser import new_project_data, extract_file_symbols, merge_file_symbols
+from app.core.project_issue_detector import detect_project_issues
+
+
+class GitScanError(Exception):
+    pass
+
+
+def git(repo, *args, input_bytes=None):
+    try:
+        completed = subprocess.run(
+            ["git", "-C", repo, *args],
+            input=input_bytes,
+            capture_output=True,
+            check=True
+        )
+    except FileNotFoundError:
+        raise GitScanError("git executable not found")
+    except subprocess.CalledProcessError as e:
+        raise GitScanError(e.stderr.decode("utf-8", "replace").strip() or str(e))
+
+    return completed.stdout
+
+
+# =========================================================
+# REPOSITORY ACCESS (PLAIN GIT, OFFLINE)
+# =========================================================
+
+class Repository:
+    """
+    A local repository path, or a bundle file cloned into a temp dir.
+    """
+
+    def __init__(self, path):
+        self.temp_dir = None
+
+        if os.path.isfile(path):
+            self.temp_dir = tempfile.mkdtemp(prefix="quality-gate-bundle-")
+            try:
+                subprocess.run(
+                    ["git", "clone", "--quiet", "--bare", path, self.temp_dir],
+                    capture_output=True,
+                    check=True
+                )
+            except subprocess.CalledProcessError as e:
+                self.close()
+                raise GitScanError(e.stderr.decode("utf-8", "replace").strip())
+            self.path = self.temp_dir
+        else:
+            self.path = path
+
+    def close(self):
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def list_blobs(self, revision):
+        """
+        {path: blob_sha} for every file in the revision's tree.
+        Only tree objects are read, never blob contents.
+        """
+        output = git(self.path, "ls-tree", "-r", "-z", "--full-tree", revision)
+        blobs = {}
+
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            meta, _, path = record.partition(b"\t")
+            _, kind, sha = meta.split()
+            if kind == b"blob":
+                blobs[path.decode("utf-8", "surrogateescape")] = sha.decode("ascii")
+
+        return blobs
+
+    def read_blobs(self, shas):
+        """
+        {sha: bytes} via one 'git cat-file --batch' process.
+        """
+        if not shas:
+            return {}
+
+        ordered = sorted(set(shas))
+        output = git(
+            self.path, "cat-file", "--batch",
+            input_bytes=("\n".join(ordered) + "\n").encode("ascii")
+        )
+
+        contents = {}
+        offset = 0
+
+        for sha in ordered:
+            header_end = output.index(b"\n", offset)
+            header = output[offset:header_end].split()
+            if len(header) < 3 or header[1] != b"blob":
+                raise GitScanError(f"Cannot read blob {sha}")
+            size = int(header[2])
+            start = header_end + 1
+            contents[sha] = output[start:start + size]
+            offset = start + size + 1
+
+        return contents
+
+
+# =========================================================
+# PER-BLOB RESULT CACHE
+# =========================================================
+
+class BlobCache:
+    """
+    Per-file results keyed by blob SHA (+ language, rules version and
+    the leaked-credential index in use, the inputs a per-file result
+    depends on). Kept in memory and, when 'directory' is given, on disk.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.memory = {}
+
+    def key(self, sha, language):
+        return f"{sha}-{language}-{RULES_VERSION}-{leak_index_identity()}"
+
+    def file_path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, sha, language):
+        key = self.key(sha, language)
+
+        if key in self.memory:
+            return self.memory[key]
+
+        if self.directory:
+            try:
+                with open(self.file_path(key), "r", encoding="utf-8") as handle:
+                    entry = json.load(handle)
+            except (OSError, ValueError):
+                return None
+            self.memory[key] = entry
+            return entry
+
+        return None
+
+    def put(self, sha, language, entry):
+        key = self.key(sha, language)
+        self.memory[key] = entry
+
+        if self.directory:
+            target = self.file_path(key)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            temp = target + ".tmp"
+            with open(temp, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(temp, target)
+
+
+def blob_kind(path):
+    """
+    Cache key language: from the path alone, except that extensionless
+    files are keyed apart (their shebang decides the language).
+    """
+    language = language_for_path(path)
+
+    if language is None or os.path.splitext(path)[1]:
+        return language
+
+    return language + ".script"
+
+
+def analyze_blob(path, content):
+    """
+    Path-independent per-file result: issues + symbol contribution.
+    Binary blobs yield nothing.
+    """
+    language = detect_language(path, content[:HEAD_BYTES])
+
+    if language is None:
+        return {"issues": [], "symbols": None, "suppressions": []}
+
+    code = content.decode("utf-8", "replace")
+    tree = None
+
+    if language == "python":
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            tree = None
+
+    lines = LineIndex(code)
+    suppressions = suppression_index(code, lines)
+    issues = analyze_code(code, language, tree=tree, lines=lines, suppressions=suppressions)
+    symbols = extract_file_symbols(path, tree, lines) if tree is not None else None
+
+    # [line, rules] pairs: the entry is stored as JSON (no int keys)
+    return {"issues": issues, "symbols": symbols, "suppressions": sorted(suppressions.items())}
+
+
+# =========================================================
+# REVISION-RANGE SCAN
+# =========================================================
+
+def scan_revision_range(repo_path, head="HEAD", base=None, cache=None):
+    """
+    Reviews 'head' of a local repository (or bundle).
+
+    - Only files whose blob SHA differs from 'base' are reported
+      (every file when 'base' is None)
+    - Per-file results and symbol contributions are cached by blob SHA;
+      a cached blob is never read or parsed again
+    - detect_project_issues runs over the merged symbol table of the
+      whole 'head' tree
+
+    Returns {"raw_issues", "changed_files", "stats"}.
+    """
+
+    if cache is None:
+        cache = BlobCache()
+
+    with Repository(repo_path) as repo:
+        # Known non-source blobs (docs, lockfiles, binary extensions) are
+        # never read; the rest are classified from their content
+        head_blobs = {
+            path: sha for path, sha in repo.list_blobs(head).items()
+            if language_for_path(path)
+        }
+
+        base_blobs = {}
+        if base:
+            base_blobs = repo.list_blobs(base)
+
+        changed = {
+            path for path, sha in head_blobs.items()
+            if base_blobs.get(path) != sha
+        }
+
+        # Blobs whose results are not cached yet (read once, in one batch)
+        missing = {
+            sha for path, sha in head_blobs.items()
+            if cache.get(sha, blob_kind(path)) is None
+        }
+        contents = repo.read_blobs(missing)
+
+    results = {}
+    parsed = 0
+
+    for path, sha in head_blobs.items():
+        kind = blob_kind(path)
+        entry = cache.get(sha, kind)
+
+        if entry is None:
+            entry = analyze_blob(path, contents[sha])
+            cache.put(sha, kind, entry)
+            parsed += 1
+
+        results[path] = entry
+
+    # -----------------------------------
+    # File-level issues (changed files only)
+    # -----------------------------------
+    raw_issues = []
+
+    for path in sorted(changed):
+        for issue in results[path]["issues"]:
+            issue = dict(issue)
+            issue["path"] = path
+            raw_issues.append(issue)
+
+    # -----------------------------------
+    # Cross-file issues over the full tree
+    # -----------------------------------
+    project_data = new_project_data()
+
+    for path in sorted(results):
+        symbols = results[path]["symbols"]
+        if symbols is not None:
+            merge_file_symbols(project_data, path, symbols)
+
+    # Inline 'quality-gate: ignore' comments of the file an issue points at
+    suppressions = {
+        path: dict(entry["suppressions"])
+        for path, entry in results.items() if entry.get("suppressions")
+    }
+
+    for issue in detect_project_issues(project_data):
+        if not is_suppressed(issue, suppressions.get(issue.get("path"))):
+            raw_issues.append(issue)
+
+    return {
+        "raw_issues": raw_issues,
+        "changed_files": sorted(changed),
+        "stats": {
+            "files": len(head_blobs),
+            "changed": len(changed),
+            "blobs_read": len(contents),
+            "blobs_parsed": parsed,
+            "cache_hits": len(head_blobs) - parsed
+        }
+    }
@@ -1,35 +1,14 @@
-import os
 import json
 import re
-from groq import Groq
 
+from app.core.advisory_cache import advisory_cache, advisory_fingerprint
+from app.core.advisory_backends import get_advisory_backend
 
-def generate_groq_advisory(
-    mode="single",
-    code=None,
-    project_summary=None,
-    language="python",
-    issues=None
-):
 
-    api_key = os.getenv("GROQ_API_KEY")
-
-    if not api_key or not api_key.strip():
-        return {
-            "advisory": "GROQ_API_KEY not configured.",
-            "risk_modifier": 0,
-            "readiness_score": 0
-        }
+def build_prompt(mode, code=None, project_summary=None, language="python"):
 
-    try:
-        client = Groq(api_key=api_key.strip())
-
-        # ===============================
-        # Build Prompt
-        # ===============================
-
-        if mode == "single":
-            prompt = f"""
+    if mode == "single":
+        return f"""
 You are a strict senior code reviewer.
 
 Analyze this {language} code.
@@ -45,8 +24,8 @@ Return ONLY valid JSON:
 Code:
 {code}
 """
-        else:
-            prompt = f"""
+
+    return f"""
 You are a senior software architect.
 
 Analyze this project summary.
@@ -64,68 +43,100 @@ Return ONLY valid JSON:
 }}
 """
 
-        # ===============================
-        # Call Groq
-        # ===============================
-
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": "Return strictly JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-        )
 
-        # 🔒 SAFE RESPONSE CHECK
-        if not response or not response.choices:
-            raise ValueError("Empty response from Groq")
+def parse_advisory(content, mode):
+    """
+    Extracts and clamps the advisory JSON from raw model output.
+    Raises ValueError when no usable JSON is present.
+    """
 
-        content = response.choices[0].message.content
+    if not content or not content.strip():
+        raise ValueError("Groq returned empty content")
 
-        if not content or not content.strip():
-            raise ValueError("Groq returned empty content")
+    content = content.strip()
 
-        content = content.strip()
+    # 🔒 Extract first JSON block safely (non-greedy)
+    json_match = re.search(r"\{.*?\}", content, re.DOTALL)
 
-        # 🔒 Extract first JSON block safely (non-greedy)
-        json_match = re.search(r"\{.*?\}", content, re.DOTALL)
+    if not json_match:
+        raise ValueError("No JSON found in Groq response")
 
-        if not json_match:
-            raise ValueError("No JSON found in Groq response")
+    json_block = json_match.group(0)
 
-        json_block = json_match.group(0)
+    parsed = json.loads(json_block)
 
-        parsed = json.loads(json_block)
+    # 🔒 Safe int conversion
+    try:
+        risk_modifier = int(parsed.get("risk_modifier", 0))
+    except:
+        risk_modifier = 0
+
+    try:
+        readiness_score = int(parsed.get("readiness_score", 0))
+    except:
+        readiness_score = 0
 
-        # 🔒 Safe int conversion
-        try:
-            risk_modifier = int(parsed.get("risk_modifier", 0))
-        except:
-            risk_modifier = 0
+    # Clamp safely
+    if mode == "project":
+        risk_modifier = max(0, min(risk_modifier, 5))
+    else:
+        risk_modifier = max(0, min(risk_modifier, 10))
 
-        try:
-            readiness_score = int(parsed.get("readiness_score", 0))
-        except:
-            readiness_score = 0
+    readiness_score = max(0, min(readiness_score, 100))
 
-        # Clamp safely
-        if mode == "project":
-            risk_modifier = max(0, min(risk_modifier, 5))
-        else:
-            risk_modifier = max(0, min(risk_modifier, 10))
+    return {
+        "advisory": parsed.get("advisory", ""),
+        "risk_modifier": risk_modifier,
+        "readiness_score": readiness_score
+    }
 
-        readiness_score = max(0, min(readiness_score, 100))
 
+def generate_groq_advisory(
+    mode="single",
+    code=None,
+    project_summary=None,
+    language="python",
+    issues=None,
+    files=None
+):
+
+    try:
+        backend = get_advisory_backend()
+    except ValueError as e:
         return {
-            "advisory": parsed.get("advisory", ""),
-            "risk_modifier": risk_modifier,
-            "readiness_score": readiness_score
+            "advisory": f"Advisory backend error: {str(e)}",
+            "risk_modifier": 0,
+            "readiness_score": 0,
+            "error": True
         }
 
-    except Exception as e:
+    if not backend.is_configured():
         return {
-            "advisory": f"Groq error: {str(e)}",
+            "advisory": backend.unconfigured_message,
             "risk_modifier": 0,
             "readiness_score": 0
         }
+
+    try:
+        prompt = build_prompt(mode, code, project_summary, language)
+
+        # Same normalized code (or project files) + mode + model → cached / coalesced
+        key = advisory_fingerprint(
+            mode, language, backend.model,
+            code=code, project_summary=project_summary, files=files
+        )
+
+        result = advisory_cache.get_or_compute(
+            key,
+            lambda: parse_advisory(backend.complete(prompt, mode), mode)
+        )
+
+        return dict(result)
+
+    except Exception as e:
+        return {
+            "advisory": f"{backend.name.capitalize()} error: {str(e)}",
+            "risk_modifier": 0,
+            "readiness_score": 0,
+            "error": True
+        }
@@ -0,0 +1,351 @@
+import os
+from collections import Counter, deque
+
+from app.core.line_index import LOCATION_KEYS
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Layers, top to bottom: a module may import its own or lower layers only.
+# e.g. IMPORT_LAYERS="app.api,app.core,app.models"
+IMPORT_LAYERS = [
+    layer.strip()
+    for layer in os.getenv("IMPORT_LAYERS", "").split(",")
+    if layer.strip()
+]
+
+
+# =========================================================
+# MODULE NAMES
+# =========================================================
+
+def module_name(path):
+    """
+    'app/core/x.py' → ('app.core.x', False); 'app/core/__init__.py' →
+    ('app.core', True). Second value: the module is a package.
+    """
+    parts = os.path.splitext(path.replace("\\", "/"))[0].strip("/").split("/")
+    parts = [part for part in parts if part not in ("", ".")]
+
+    if parts and parts[-1] == "__init__":
+        return ".".join(parts[:-1]), True
+
+    return ".".join(parts), False
+
+
+def resolve_import(module, is_package, level, target):
+    """
+    Absolute module for an import statement in 'module'.
+    level 0 = absolute; 'from . import x' is level 1 with an empty target.
+    Returns None when a relative import climbs above the top package.
+    """
+    if level == 0:
+        return target
+
+    package = module.split(".") if is_package else module.split(".")[:-1]
+
+    if level - 1 > len(package):
+        return None
+
+    base = package[:len(package) - (level - 1)]
+    if target:
+        base.append(target)
+
+    return ".".join(base)
+
+
+# =========================================================
+# GRAPH
+# =========================================================
+
+class ModuleResolver:
+    """
+    Import target → project module id. Matched exactly, relative to a
+    source root (the directory above each top-level package), or by a
+    unique dotted suffix of two or more segments, so 'app.core.x' finds
+    'backend/app/core/x.py'. A single-segment name such as 'json' only
+    matches through a source root: anything else is external.
+    """
+
+    def __init__(self, modules):
+        self.names = sorted(modules)
+        self.paths = [modules[name] for name in self.names]
+        self.ids = {name: position for position, name in enumerate(self.names)}
+
+        packages = {name for name, path in modules.items() if module_name(path)[1]}
+        roots = {
+            package.rpartition(".")[0] for package in packages
+            if package.rpartition(".")[0] not in packages
+        }
+        roots.discard("")
+
+        rooted = {}
+        suffixes = {}
+        for name, position in self.ids.items():
+            parts = name.split(".")
+            for start in range(1, len(parts)):
+                suffix = ".".join(parts[start:])
+                if ".".join(parts[:start]) in roots:
+                    rooted[suffix] = -1 if suffix in rooted else position
+                if start < len(parts) - 1:
+                    suffixes[suffix] = -1 if suffix in suffixes else position
+        self.rooted = rooted
+        self.suffixes = suffixes
+
+    def lookup(self, name):
+        position = self.ids.get(name)
+        if position is None:
+            position = self.rooted.get(name)
+        if position is None:
+            position = self.suffixes.get(name, -1)
+        return None if position == -1 else position
+
+
+class ImportGraph(ModuleResolver):
+    """
+    Modules as integer ids with adjacency lists (edges: importer →
+    imported). Imports given with a span (third item: line, column,
+    end line, end column) keep the first one per edge, so issues point
+    at the import statement.
+    """
+
+    def __init__(self, modules, module_imports):
+        super().__init__(modules)
+        self.adjacency = [[] for _ in self.names]
+        self.edge_locations = {}
+
+        for name, imports in module_imports.items():
+            source = self.ids.get(name)
+            if source is None:
+                continue
+
+            targets = set()
+            for base, names, *span in imports:
+                found = self._targets(base, names)
+                targets.update(found)
+
+                if span and span[0]:
+                    for target in found:
+                        self.edge_locations.setdefault((source, target), span[0])
+
+            targets.discard(source)
+            self.adjacency[source] = sorted(targets)
+
+    def location(self, source, target):
+        """
+        Location fields of the import behind an edge ({} when unknown).
+        """
+        span = self.edge_locations.get((source, target))
+        return dict(zip(LOCATION_KEYS, span)) if span else {}
+
+    def _targets(self, base, names):
+        """
+        'from base import a, b': submodules base.a / base.b when they are
+        modules, otherwise base itself. 'import a.b.c': the longest
+        prefix that is a project module.
+        """
+        found = []
+        needs_base = not names
+
+        for name in names:
+            position = self.lookup(f"{base}.{name}" if base else name)
+            if position is None:
+                needs_base = True
+            else:
+                found.append(position)
+
+        if needs_base and base:
+            parts = base.split(".")
+            while parts:
+                position = self.lookup(".".join(parts))
+                if position is not None:
+                    found.append(position)
+                    break
+                parts.pop()
+
+        return found
+
+    def edge_count(self):
+        return sum(len(edges) for edges in self.adjacency)
+
+
+def strongly_connected_components(adjacency):
+    """
+    Tarjan's algorithm, iterative (no recursion limit on deep chains).
+    O(V + E). Returns each node's component id; ids follow reverse
+    topological order. Flat ints, not one list per component: on large
+    graphs those allocations cost more (via the GC) than the search.
+    """
+    count = len(adjacency)
+    index = [-1] * count
+    low = [0] * count
+    next_edge = [0] * count
+    on_stack = [False] * count
+    stack = []
+    component = [-1] * count
+    components = 0
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [root]
+
+        while work:
+            node = work[-1]
+            edges = adjacency[node]
+            edge = next_edge[node]
+
+            if edge < len(edges):
+                next_edge[node] = edge + 1
+                target = edges[edge]
+
+                if index[target] == -1:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append(target)
+                elif on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component[member] = components
+                    if member == node:
+                        break
+                components += 1
+
+    return component
+
+
+def cyclic_components(adjacency):
+    """
+    Components with more than one module ([[node ids]]), i.e. cycles.
+    """
+    labels = strongly_connected_components(adjacency)
+    sizes = Counter(labels)
+
+    members = {label: [] for label, size in sizes.items() if size > 1}
+    for node, label in enumerate(labels):
+        if label in members:
+            members[label].append(node)
+
+    return list(members.values())
+
+
+def shortest_cycle(adjacency, start, members):
+    """
+    start → ... → start inside one component (BFS), for the message.
+    """
+    members = set(members)
+    parents = {start: None}
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        for target in adjacency[node]:
+            if target == start:
+                cycle = [node]
+                while parents[cycle[-1]] is not None:
+                    cycle.append(parents[cycle[-1]])
+                return list(reversed(cycle)) + [start]
+            if target in members and target not in parents:
+                parents[target] = node
+                queue.append(target)
+
+    return [start, start]
+
+
+def layer_of(name, layers):
+    """
+    Index of the first layer that 'name' is in (dotted-segment match,
+    so 'app.core' also matches 'backend.app.core.x'), or None.
+    """
+    padded = f".{name}."
+    for position, layer in enumerate(layers):
+        if f".{layer}." in padded:
+            return position
+    return None
+
+
+# =========================================================
+# PROJECT ISSUES
+# =========================================================
+
+def import_graph_issues(modules, module_imports, layers=None):
+    """
+    Circular imports (one issue per strongly connected component) and,
+    when layers are configured, imports from a lower into a higher layer.
+    modules: name → path; module_imports: name → [(absolute base, names)
+    or (absolute base, names, span)].
+    """
+    layers = IMPORT_LAYERS if layers is None else layers
+
+    if not modules:
+        return []
+
+    graph = ImportGraph(modules, module_imports)
+    issues = []
+
+    for component in cyclic_components(graph.adjacency):
+        start = min(component, key=lambda member: graph.names[member])
+        members = shortest_cycle(graph.adjacency, start, component)
+        cycle = " → ".join(graph.names[member] for member in members)
+
+        message = f"Circular import: {cycle}"
+        if len(component) > len(cycle.split(" → ")) - 1:
+            message += f" ({len(component)} modules in the cycle)"
+
+        issues.append({
+            "rule_id": "project.import-cycle",
+            "severity": "MEDIUM",
+            "type": "Architecture",
+            "message": message,
+            "impact": "Import order becomes fragile; partially initialized modules fail at runtime",
+            "suggestion": "Move shared code into a lower-level module or import lazily",
+            "path": graph.paths[start],
+            **graph.location(start, members[1])
+        })
+
+    if layers:
+        module_layers = [layer_of(name, layers) for name in graph.names]
+
+        for source, targets in enumerate(graph.adjacency):
+            source_layer = module_layers[source]
+            if source_layer is None:
+                continue
+
+            for target in targets:
+                target_layer = module_layers[target]
+                if target_layer is not None and target_layer < source_layer:
+                    issues.append({
+                        "rule_id": "project.layer-violation",
+                        "severity": "MEDIUM",
+                        "type": "Architecture",
+                        "message": (
+                            f"Layer violation: '{graph.names[source]}' ({layers[source_layer]}) "
+                            f"imports '{graph.names[target]}' ({layers[target_layer]})"
+                        ),
+                        "impact": "Lower layers depending on higher ones erodes the architecture",
+                        "suggestion": f"Keep '{layers[source_layer]}' independent of '{layers[target_layer]}'",
+                        "path": graph.paths[source],
+                        **graph.location(source, target)
+                    })
+
+    return issues
@@ -0,0 +1,164 @@
+import os
+import re
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Languages with a dedicated analyzer
+SOURCE_EXTENSIONS = {
+    ".py": "python",
+    ".pyw": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+}
+
+# Other source languages: generic rules + secret scanner
+GENERIC_EXTENSIONS = {
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".mts": "typescript",
+    ".cts": "typescript",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".scala": "scala",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".swift": "swift",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".ps1": "powershell",
+    ".sql": "sql",
+}
+
+# Any other text file (configs, templates, unknown extensions)
+GENERIC_LANGUAGE = "generic"
+
+# Never analyzed: docs, lockfiles, images, archives, compiled output
+NON_SOURCE_EXTENSIONS = frozenset({
+    ".md", ".markdown", ".rst", ".txt", ".adoc",
+    ".lock", ".sum", ".map",
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".svg",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".tar", ".whl", ".egg",
+    ".jar", ".war", ".class", ".pyc", ".pyo", ".so", ".dll", ".dylib", ".exe", ".o", ".a",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".mp3", ".mp4", ".mov", ".avi", ".wav", ".db", ".sqlite", ".bin",
+})
+
+NON_SOURCE_FILES = frozenset({
+    "package-lock.json", "npm-shrinkwrap.json", "pnpm-lock.yaml",
+    "license", "licence", "copying", "notice", "authors", "codeowners",
+    ".gitignore", ".gitattributes", ".dockerignore", ".editorconfig",
+})
+
+SHEBANG_INTERPRETERS = {
+    "python": "python",
+    "node": "javascript",
+    "nodejs": "javascript",
+    "sh": "shell",
+    "bash": "shell",
+    "zsh": "shell",
+    "ruby": "ruby",
+    "php": "php",
+}
+
+# "#!/usr/bin/env -S python3 -u" → "python3"
+SHEBANG = re.compile(r"^#!\s*(?:\S*/)?(?:env\s+(?:-\S+\s+)*)?([A-Za-z]+)")
+
+# Enough bytes for any realistic shebang line
+HEAD_BYTES = 128
+
+
+def language_for_path(path):
+    """
+    Language from the file name alone (no content needed); None for
+    known non-source files. Shebang and binary checks need the content.
+    """
+    name = os.path.basename(path).lower()
+
+    if name in NON_SOURCE_FILES:
+        return None
+
+    extension = os.path.splitext(name)[1]
+
+    if extension in NON_SOURCE_EXTENSIONS:
+        return None
+
+    return SOURCE_EXTENSIONS.get(extension) or GENERIC_EXTENSIONS.get(extension) or GENERIC_LANGUAGE
+
+
+def is_binary(head):
+    """
+    NUL in the first bytes ('head' may be str or bytes).
+    """
+    return (b"\0" if isinstance(head, bytes) else "\0") in head[:HEAD_BYTES]
+
+
+def language_for_shebang(head):
+    """
+    Language from the first line ('head' may be str or bytes).
+    """
+    if isinstance(head, bytes):
+        head = head[:HEAD_BYTES].decode("latin-1")
+
+    if not head.startswith("#!"):
+        return None
+
+    match = SHEBANG.match(head.split("\n", 1)[0])
+    if not match:
+        return None
+
+    return SHEBANG_INTERPRETERS.get(match.group(1).lower())
+
+
+def detect_language(path, head=None):
+    """
+    File name first; extensionless files (scripts) by shebang. Text
+    files in no known language get the generic rules.
+    Returns None for non-source files (docs, lockfiles, binaries).
+    """
+    language = language_for_path(path)
+
+    if language is None or (head and is_binary(head)):
+        return None
+
+    if head and not os.path.splitext(path)[1]:
+        return language_for_shebang(head) or language
+
+    return language
+
+
+def read_head(path):
+    """
+    First bytes of a file, for shebang detection without reading it all.
+    """
+    try:
+        with open(path, "rb") as handle:
+            return handle.read(HEAD_BYTES)
+    except OSError:
+        return b""
+
+
+def detect_file_language(path):
+    """
+    detect_language() for a file on disk; only files whose name is not
+    enough (extensionless, or no known language) are opened (first
+    HEAD_BYTES), nothing is decoded.
+    """
+    language = language_for_path(path)
+
+    if language is None or (language != GENERIC_LANGUAGE and os.path.splitext(path)[1]):
+        return language
+
+    return detect_language(path, read_head(path))
@@ -0,0 +1,251 @@
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Path to an index built by scripts/build_leak_index.py (unset = disabled)
+LEAKED_CREDENTIALS_INDEX = os.getenv("LEAKED_CREDENTIALS_INDEX")
+
+# Digests sorted in memory per run while building (32 bytes each)
+BUILD_CHUNK_RECORDS = 4_000_000
+
+# File layout (little-endian):
+#   header   magic, count, prefix_offset, digest_offset
+#   digests  count × 32-byte SHA-256, sorted, unique
+#   prefixes count × uint64 (first 8 digest bytes, big-endian value)
+# The prefix array is what gets binary-searched; it is contiguous and
+# native-width, so NumPy searches the mapping in place without copying.
+MAGIC = b"QGLEAKS1"
+HEADER = struct.Struct("<8sQQQ")
+DIGEST_SIZE = 32
+
+
+def credential_digest(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+
+
+def digest_prefixes(digests):
+    """
+    Sort keys (uint64) of a bytes blob of concatenated 32-byte digests.
+    """
+    words = np.frombuffer(digests, dtype=">u8").reshape(-1, DIGEST_SIZE // 8)
+    return words[:, 0].astype("<u8")
+
+
+# =========================================================
+# READ SIDE (MEMORY-MAPPED, SHARED ACROSS PROCESSES)
+# =========================================================
+
+class LeakIndex:
+    """
+    Read-only membership test against a sorted SHA-256 file.
+
+    The file is mapped, not loaded: resident memory is only the pages a
+    lookup touches (about log2(n) prefix pages + one digest page), and
+    every worker process shares them through the page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, "rb")
+        self.map = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, prefix_offset, self.digest_offset = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a leaked-credential index")
+
+        self.prefixes = np.ndarray(
+            (self.count,), dtype="<u8", buffer=self.map, offset=prefix_offset
+        )
+
+        # Which index answered: part of every cache key over secret findings
+        stat = os.fstat(self.handle.fileno())
+        self.identity = hashlib.blake2b(
+            f"{self.count}:{stat.st_size}:{stat.st_mtime_ns}".encode("ascii"), digest_size=6
+        ).hexdigest()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.prefixes = None
+        self.map.close()
+        self.handle.close()
+
+    def contains_digests(self, digests):
+        """
+        [32-byte digest] → [bool], one vectorized search per batch.
+        """
+        if not digests or not self.count:
+            return [False] * len(digests)
+
+        query = digest_prefixes(b"".join(digests))
+        positions = np.searchsorted(self.prefixes, query).tolist()
+
+        found = []
+        for digest, prefix, position in zip(digests, query.tolist(), positions):
+            hit = False
+
+            # Equal prefixes are adjacent; almost always zero or one
+            while position < self.count and self.prefixes[position] == prefix:
+                start = self.digest_offset + position * DIGEST_SIZE
+                if self.map[start:start + DIGEST_SIZE] == digest:
+                    hit = True
+                    break
+                position += 1
+
+            found.append(hit)
+
+        return found
+
+    def contains_many(self, texts):
+        return self.contains_digests([credential_digest(text) for text in texts])
+
+    def __contains__(self, text):
+        return self.contains_many([text])[0]
+
+
+_index = None
+_index_loaded = False
+
+
+def leak_index():
+    """
+    Process-wide index from LEAKED_CREDENTIALS_INDEX, opened on first
+    use; None when unset or unreadable.
+    """
+    global _index, _index_loaded
+
+    # Reviews run in worker threads: publish the index before the flag
+    if not _index_loaded:
+        if LEAKED_CREDENTIALS_INDEX:
+            try:
+                _index = LeakIndex(LEAKED_CREDENTIALS_INDEX)
+            except (OSError, ValueError):
+                _index = None
+        _index_loaded = True
+
+    return _index
+
+
+def leak_index_identity():
+    """
+    Short id of the index in use ('none' when disabled).
+    """
+    index = leak_index()
+    return index.identity if index is not None else "none"
+
+
+# =========================================================
+# BUILD SIDE (EXTERNAL SORT)
+# =========================================================
+
+def parse_digest(line, raw=False):
+    """
+    One input line → digest: a hex SHA-256, or (raw=True) the leaked
+    credential itself. Blank lines and '#' comments → None.
+    """
+    line = line.rstrip("\r\n")
+
+    if raw:
+        return credential_digest(line) if line else None
+
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+
+    digest = bytes.fromhex(line)
+    if len(digest) != DIGEST_SIZE:
+        raise ValueError(f"Not a SHA-256 hex digest: {line[:80]}")
+    return digest
+
+
+def _write_run(buffer, directory):
+    records = np.unique(np.frombuffer(bytes(buffer), dtype=f"S{DIGEST_SIZE}"))
+    handle = tempfile.NamedTemporaryFile(dir=directory, suffix=".run", delete=False)
+    with handle:
+        # tobytes() keeps the fixed width (S32 only strips on item access)
+        handle.write(records.tobytes())
+    return handle.name
+
+
+def _read_run(path):
+    with open(path, "rb") as handle:
+        while True:
+            block = handle.read(DIGEST_SIZE * 8192)
+            if not block:
+                return
+            for start in range(0, len(block), DIGEST_SIZE):
+                yield block[start:start + DIGEST_SIZE]
+
+
+def build_index(digests, output, chunk_records=BUILD_CHUNK_RECORDS):
+    """
+    Writes an index from any iterable of 32-byte digests (unsorted,
+    duplicates allowed). Runs of 'chunk_records' are sorted in memory,
+    then merged, so inputs larger than memory are fine.
+    Returns the number of unique digests.
+    """
+    directory = os.path.dirname(os.path.abspath(output))
+    runs = []
+    buffer = bytearray()
+
+    try:
+        for digest in digests:
+            buffer += digest
+            if len(buffer) >= chunk_records * DIGEST_SIZE:
+                runs.append(_write_run(buffer, directory))
+                buffer = bytearray()
+
+        if buffer or not runs:
+            runs.append(_write_run(buffer, directory))
+
+        count = 0
+        with open(output, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, 0, 0, 0))
+            digest_offset = handle.tell()
+
+            previous = None
+            pending = []
+            for digest in heapq.merge(*(_read_run(run) for run in runs)):
+                if digest == previous:
+                    continue
+                previous = digest
+                pending.append(digest)
+                if len(pending) == 65536:
+                    handle.write(b"".join(pending))
+                    count += len(pending)
+                    pending = []
+
+            handle.write(b"".join(pending))
+            count += len(pending)
+
+        # Prefix array after the digests, read back in blocks
+        with open(output, "r+b") as handle:
+            handle.seek(0, os.SEEK_END)
+            prefix_offset = handle.tell()
+
+            with open(output, "rb") as digests_in:
+                digests_in.seek(digest_offset)
+                remaining = count
+                while remaining:
+                    block = digests_in.read(DIGEST_SIZE * min(remaining, 1 << 20))
+                    handle.write(digest_prefixes(block).tobytes())
+                    remaining -= len(block) // DIGEST_SIZE
+
+            handle.seek(0)
+            handle.write(HEADER.pack(MAGIC, count, prefix_offset, digest_offset))
+
+        return count
+    finally:
+        for run in runs:
+            os.unlink(run)
@@ -0,0 +1,109 @@
+import re
+from bisect import bisect_right
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Line breaks as the Python tokenizer counts them (ast line numbers)
+NEWLINE = re.compile(r"\r\n|\r|\n")
+
+# Position fields an issue (or occurrence) may carry; 1-based,
+# columns in characters, end column exclusive (as in SARIF)
+LOCATION_KEYS = ("line", "column", "end_line", "end_column")
+
+
+def location_of(issue):
+    """
+    The position fields present on an issue or occurrence.
+    """
+    return {key: issue[key] for key in LOCATION_KEYS if issue.get(key) is not None}
+
+
+class LineIndex:
+    """
+    Start offset of every line of one file, built once per file and
+    shared by every rule. Offsets become (line, column) with a binary
+    search, so no rule re-splits the source to find a position.
+    """
+
+    __slots__ = ("text", "starts", "ascii")
+
+    def __init__(self, text):
+        self.text = text
+        self.starts = [0]
+        self.starts.extend(match.end() for match in NEWLINE.finditer(text))
+
+        # AST columns are UTF-8 byte offsets; equal to characters here
+        self.ascii = text.isascii()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def position(self, offset):
+        """
+        Character offset → (line, column), both 1-based.
+        """
+        row = bisect_right(self.starts, offset) - 1
+        return row + 1, offset - self.starts[row] + 1
+
+    def span(self, start, end):
+        """
+        Location fields for the character range [start, end).
+        """
+        line, column = self.position(start)
+        end_line, end_column = self.position(max(start, end))
+        return {"line": line, "column": column, "end_line": end_line, "end_column": end_column}
+
+    def segment(self, line, end_line):
+        """
+        Source of lines line..end_line (inclusive), sliced by offset.
+        """
+        start = self.starts[line - 1]
+        end = self.starts[end_line] if end_line < len(self.starts) else len(self.text)
+        return self.text[start:end]
+
+    def line_text(self, line):
+        return self.segment(line, line)
+
+    def _column(self, line, byte_offset):
+        if self.ascii:
+            return byte_offset + 1
+        text = self.line_text(line)
+        if text.isascii():
+            return byte_offset + 1
+        return len(text.encode("utf-8")[:byte_offset].decode("utf-8", "ignore")) + 1
+
+    def node_span(self, node):
+        """
+        Location fields for an AST node (byte columns → characters).
+        """
+        line = node.lineno
+        end_line = getattr(node, "end_lineno", None) or line
+        end_offset = getattr(node, "end_col_offset", None)
+        if end_offset is None:
+            end_offset = node.col_offset
+
+        return {
+            "line": line,
+            "column": self._column(line, node.col_offset),
+            "end_line": end_line,
+            "end_column": self._column(end_line, end_offset)
+        }
+
+
+def node_span(node, lines=None):
+    """
+    LineIndex.node_span, or the raw AST columns (exact for ASCII
+    sources) when the caller has no index for the file.
+    """
+    if lines is not None:
+        return lines.node_span(node)
+
+    end_offset = getattr(node, "end_col_offset", None)
+    return {
+        "line": node.lineno,
+        "column": node.col_offset + 1,
+        "end_line": getattr(node, "end_lineno", None) or node.lineno,
+        "end_column": (node.col_offset if end_offset is None else end_offset) + 1
+    }
@@ -0,0 +1,142 @@
+import gc
+import os
+import resource
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Per-request ceiling in MB (0 = disabled)
+REVIEW_MEMORY_CEILING_MB = float(os.getenv("REVIEW_MEMORY_CEILING_MB", "0"))
+
+# Sample memory for every request, not only when asked for
+MEMORY_PROFILING = os.getenv("MEMORY_PROFILING", "0") == "1"
+
+MB = 1024 * 1024
+
+
+class MemoryCeilingExceeded(Exception):
+    pass
+
+
+def current_rss():
+    """
+    Resident set size in bytes (Linux /proc, falls back to peak RSS).
+    """
+    try:
+        with open("/proc/self/statm", "r") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# =========================================================
+# PER-REQUEST TRACKER
+# =========================================================
+
+class MemoryTracker:
+    """
+    Samples memory per pipeline stage and enforces the request ceiling.
+
+    - profiling=True uses tracemalloc (precise, slower) + RSS
+    - otherwise only RSS is read, and only when a ceiling is set
+    - tracemalloc is process-wide: concurrent requests share the numbers
+    """
+
+    def __init__(self, profiling=False, ceiling_mb=REVIEW_MEMORY_CEILING_MB):
+        self.profiling = profiling or MEMORY_PROFILING
+        self.ceiling = int(ceiling_mb * MB) if ceiling_mb else 0
+        self.enabled = self.profiling or bool(self.ceiling)
+        self.stages = []
+        self.strategy = "default"
+        self.peak = 0
+        self.started_tracing = False
+
+        if self.profiling and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+        self.baseline = self.usage() if self.enabled else 0
+
+    def usage(self):
+        if self.profiling:
+            return tracemalloc.get_traced_memory()[0]
+        return current_rss()
+
+    def request_usage(self):
+        return max(0, self.usage() - self.baseline)
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        if self.profiling:
+            tracemalloc.reset_peak()
+
+        before = self.request_usage()
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            after = self.request_usage()
+
+            if self.profiling:
+                stage_peak = max(0, tracemalloc.get_traced_memory()[1] - self.baseline)
+            else:
+                stage_peak = max(before, after)
+
+            self.peak = max(self.peak, stage_peak)
+            self.stages.append({
+                "stage": name,
+                "seconds": round(time.perf_counter() - started, 4),
+                "delta_mb": round((after - before) / MB, 2),
+                "peak_mb": round(stage_peak / MB, 2),
+                "rss_mb": round(current_rss() / MB, 1)
+            })
+
+    def over_ceiling(self):
+        return bool(self.ceiling) and self.request_usage() > self.ceiling
+
+    def enforce(self, on_pressure=None):
+        """
+        Called between units of work. The first time the ceiling is
+        crossed 'on_pressure' switches to the low-memory strategy;
+        crossing it again afterwards fails the request.
+        """
+        if not self.ceiling or not self.over_ceiling():
+            return
+
+        if self.strategy == "default" and on_pressure is not None:
+            self.strategy = "low-memory"
+            on_pressure()
+            gc.collect()
+
+            if not self.over_ceiling():
+                return
+
+        raise MemoryCeilingExceeded(
+            f"Review exceeded the memory ceiling of "
+            f"{self.ceiling / MB:.0f} MB ({self.request_usage() / MB:.0f} MB in use). "
+            f"Split the project into smaller reviews."
+        )
+
+    def report(self):
+        return {
+            "peak_mb": round(self.peak / MB, 2),
+            "ceiling_mb": round(self.ceiling / MB, 2) if self.ceiling else None,
+            "strategy": self.strategy,
+            "source": "tracemalloc" if self.profiling else "rss",
+            "stages": self.stages
+        }
+
+    def close(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
@@ -0,0 +1,48 @@
+from app.core.deduplicator import group_issues
+from app.core.ai_reasoner import enrich_issue
+from app.core.scorer import calculate_risk
+from app.core.policy import default_policy
+from app.core.baseline import apply_baseline
+
+
+def static_verdict(raw_issues, context="deployment", analysis_mode="project", baseline=None):
+    """
+    Steps 1b-8 of the review pipeline without the LLM advisory:
+    baseline → group → enrich → static / structural score → decision
+    (default policy).
+
+    Used by local tooling (git scanning, daemon) that has no advisory.
+    """
+
+    raw_issues, _, baseline_matches = apply_baseline(raw_issues, baseline)
+
+    deduped_issues = group_issues(raw_issues)
+
+    enriched_issues = [
+        enrich_issue(issue, context)
+        for issue in deduped_issues
+    ]
+
+    static_score, metrics = calculate_risk(enriched_issues)
+
+    outcome = default_policy().evaluate(enriched_issues, static_score, analysis_mode)
+
+    result = {
+        "mode": analysis_mode,
+        "risk_breakdown": {
+            "static_risk": static_score,
+            "structural_risk": outcome["risk_breakdown"]["structural_risk"],
+            "ai_modifier": 0
+        },
+        "final_score": outcome["final_score"],
+        "decision": outcome["decision"],
+        "decision_trace": outcome["decision_trace"],
+        "summary": f"{len(enriched_issues)} issue(s) detected",
+        "metrics": metrics,
+        "issues": enriched_issues
+    }
+
+    if baseline is not None:
+        result["baseline"] = dict(baseline.describe(), suppressed=baseline_matches)
+
+    return result
@@ -0,0 +1,529 @@
+import copy
+import fnmatch
+import hashlib
+import json
+import os
+import re
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# JSON file of named policies (unset = built-in default only):
+#   {"default": "strict",
+#    "policies": {"strict": {"extends": "default", "thresholds": {"block": 50}}}}
+QUALITY_POLICY_FILE = os.getenv("QUALITY_POLICY_FILE")
+
+DEFAULT_POLICY_NAME = "default"
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+RULE_DECISIONS = ("BLOCK", "WARN")
+
+# The gate make_decision used to hard-code, plus the composite weights
+# and structural score that used to live in review_code
+DEFAULT_POLICY = {
+    "description": "Built-in gate: critical security blocks, other critical/security issues warn",
+    "weights": {"static": 0.5, "structural": 0.3, "advisory": 0.2},
+    "structural": {"per_issue": 5, "max": 40},
+    "thresholds": {"block": 70, "warn": 30},
+    "rules": [
+        {
+            "name": "critical-security",
+            "severity": ["CRITICAL"],
+            "type": ["Security"],
+            "decision": "BLOCK",
+            "trace": "Critical security issue: {message}"
+        },
+        {
+            "name": "critical",
+            "severity": ["CRITICAL"],
+            "decision": "WARN",
+            "trace": "Critical issue detected: {message}"
+        },
+        {
+            "name": "security",
+            "type": ["Security"],
+            "decision": "WARN",
+            "trace": "Non-critical security issues detected"
+        }
+    ],
+    "trace": {
+        "block": "Overall risk score is high",
+        "warn": "Moderate risk issues detected",
+        "pass": "No high-risk issues detected"
+    }
+}
+
+POLICY_KEYS = {"description", "extends", "weights", "structural", "thresholds", "rules", "trace"}
+RULE_KEYS = {"name", "severity", "type", "rule_id", "path", "max", "decision", "trace"}
+MERGED_KEYS = ("weights", "structural", "thresholds", "trace")
+
+
+class PolicyError(ValueError):
+    pass
+
+
+# =========================================================
+# VALIDATION
+# =========================================================
+
+def _number(value, where, minimum=0, maximum=None):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise PolicyError(f"{where}: must be a number")
+    if value < minimum or (maximum is not None and value > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f">= {minimum}"
+        raise PolicyError(f"{where}: must be {bounds}")
+    return value
+
+
+def _strings(value, where):
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not value or not all(isinstance(v, str) and v for v in value):
+        raise PolicyError(f"{where}: must be a non-empty string or list of strings")
+    return value
+
+
+def _template(value, where):
+    if not isinstance(value, str):
+        raise PolicyError(f"{where}: must be a string")
+    try:
+        value.format(message="", count=0, max=0, name="", score=0)
+    except (KeyError, IndexError, ValueError) as e:
+        raise PolicyError(f"{where}: invalid template ({e})")
+    return value
+
+
+def resolve_policy(name, specs, seen=()):
+    """
+    Spec with 'extends' applied (default: the built-in policy).
+    weights / structural / thresholds / trace merge key by key; rules
+    and everything else replace the parent's.
+    """
+    if name == DEFAULT_POLICY_NAME and name not in specs:
+        return copy.deepcopy(DEFAULT_POLICY)
+
+    if name in seen:
+        raise PolicyError(f"policies.{name}: 'extends' cycle ({' → '.join(seen + (name,))})")
+
+    spec = specs.get(name)
+    if not isinstance(spec, dict):
+        raise PolicyError(f"policies.{name}: unknown policy" if spec is None else f"policies.{name}: must be an object")
+
+    unknown = set(spec) - POLICY_KEYS
+    if unknown:
+        raise PolicyError(f"policies.{name}: unknown keys {sorted(unknown)}")
+
+    # Every policy starts from the built-in one unless it extends another
+    parent = spec.get("extends")
+    if parent is None:
+        resolved = copy.deepcopy(DEFAULT_POLICY)
+    else:
+        resolved = resolve_policy(parent, specs, seen + (name,))
+
+    for key, value in spec.items():
+        if key == "extends":
+            continue
+        if key in MERGED_KEYS and isinstance(value, dict) and isinstance(resolved.get(key), dict):
+            resolved[key] = dict(resolved[key], **value)
+        else:
+            resolved[key] = copy.deepcopy(value)
+
+    return resolved
+
+
+# =========================================================
+# COMPILED POLICIES
+# =========================================================
+
+class RuleMatcher:
+    """
+    One issue filter. Severity / type are set lookups; rule_id and path
+    globs are one compiled regex each. Identical filters in different
+    policies share a matcher, so a what-if over many policies still
+    tests each distinct filter once per issue.
+    """
+
+    __slots__ = ("severities", "types", "rule_ids", "paths")
+
+    def __init__(self, severities, types, rule_ids, paths):
+        self.severities = frozenset(severities) if severities else None
+        self.types = frozenset(types) if types else None
+        self.rule_ids = _glob_regex(rule_ids)
+        self.paths = _glob_regex(paths)
+
+    def key(self):
+        return (
+            self.severities, self.types,
+            self.rule_ids.pattern if self.rule_ids else None,
+            self.paths.pattern if self.paths else None
+        )
+
+    def matches_kind(self, severity, issue_type):
+        return (
+            (self.severities is None or severity in self.severities)
+            and (self.types is None or issue_type in self.types)
+        )
+
+    def matches_rest(self, issue):
+        if self.rule_ids is not None and not self.rule_ids.match(issue.get("rule_id") or ""):
+            return False
+
+        if self.paths is not None:
+            # Grouped issues: any occurrence in scope counts
+            paths = [o.get("path") for o in issue.get("occurrences") or ()] or [issue.get("path")]
+            if not any(path and self.paths.match(path) for path in paths):
+                return False
+
+        return True
+
+
+def _glob_regex(patterns):
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+class CompiledRule:
+    __slots__ = ("name", "matcher", "max", "decision", "trace")
+
+    def __init__(self, name, matcher, maximum, decision, trace):
+        self.name = name
+        self.matcher = matcher
+        self.max = maximum
+        self.decision = decision
+        self.trace = trace
+
+
+class Policy:
+    """
+    A validated policy. Rules are checked in order after one counting
+    pass: the first whose match count exceeds its 'max' decides (so
+    the default reproduces make_decision's early returns), else the
+    final score against the block / warn thresholds.
+    """
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        where = f"policies.{name}"
+
+        unknown = set(spec) - POLICY_KEYS
+        if unknown:
+            raise PolicyError(f"{where}: unknown keys {sorted(unknown)}")
+
+        self.description = spec.get("description", "")
+
+        weights = spec.get("weights", {})
+        if not isinstance(weights, dict) or set(weights) - {"static", "structural", "advisory"}:
+            raise PolicyError(f"{where}.weights: expected static / structural / advisory")
+        self.weights = {
+            key: _number(weights.get(key, 0), f"{where}.weights.{key}")
+            for key in ("static", "structural", "advisory")
+        }
+
+        structural = spec.get("structural", {})
+        if not isinstance(structural, dict) or set(structural) - {"per_issue", "max"}:
+            raise PolicyError(f"{where}.structural: expected per_issue / max")
+        self.per_issue = _number(structural.get("per_issue", 0), f"{where}.structural.per_issue")
+        self.structural_max = _number(structural.get("max", 100), f"{where}.structural.max", 0, 100)
+
+        thresholds = spec.get("thresholds", {})
+        if not isinstance(thresholds, dict) or set(thresholds) - {"block", "warn"}:
+            raise PolicyError(f"{where}.thresholds: expected block / warn")
+        self.block_at = _number(thresholds.get("block", 101), f"{where}.thresholds.block", 0, 101)
+        self.warn_at = _number(thresholds.get("warn", 101), f"{where}.thresholds.warn", 0, 101)
+        if self.warn_at > self.block_at:
+            raise PolicyError(f"{where}.thresholds: warn must not exceed block")
+
+        trace = spec.get("trace", {})
+        if not isinstance(trace, dict) or set(trace) - {"block", "warn", "pass"}:
+            raise PolicyError(f"{where}.trace: expected block / warn / pass")
+        self.score_trace = {
+            decision: _template(trace.get(decision.lower(), default), f"{where}.trace.{decision.lower()}")
+            for decision, default in (
+                ("BLOCK", "Final score {score} >= {max}"),
+                ("WARN", "Final score {score} >= {max}"),
+                ("PASS", "Final score {score} below thresholds")
+            )
+        }
+
+        rules = spec.get("rules", [])
+        if not isinstance(rules, list):
+            raise PolicyError(f"{where}.rules: must be a list")
+
+        self.rules = []
+        names = set()
+        for position, rule in enumerate(rules):
+            self.rules.append(self._compile_rule(rule, f"{where}.rules[{position}]", names))
+
+    @staticmethod
+    def _compile_rule(rule, where, names):
+        if not isinstance(rule, dict):
+            raise PolicyError(f"{where}: must be an object")
+
+        unknown = set(rule) - RULE_KEYS
+        if unknown:
+            raise PolicyError(f"{where}: unknown keys {sorted(unknown)}")
+
+        name = rule.get("name")
+        if not isinstance(name, str) or not name:
+            raise PolicyError(f"{where}.name: required")
+        if name in names:
+            raise PolicyError(f"{where}.name: duplicate rule '{name}'")
+        names.add(name)
+
+        severities = _strings(rule["severity"], f"{where}.severity") if "severity" in rule else None
+        for severity in severities or ():
+            if severity not in SEVERITIES:
+                raise PolicyError(f"{where}.severity: '{severity}' is not one of {list(SEVERITIES)}")
+
+        types = _strings(rule["type"], f"{where}.type") if "type" in rule else None
+        rule_ids = _strings(rule["rule_id"], f"{where}.rule_id") if "rule_id" in rule else None
+        paths = _strings(rule["path"], f"{where}.path") if "path" in rule else None
+
+        maximum = rule.get("max", 0)
+        if isinstance(maximum, bool) or not isinstance(maximum, int) or maximum < 0:
+            raise PolicyError(f"{where}.max: must be an integer >= 0")
+
+        decision = rule.get("decision")
+        if decision not in RULE_DECISIONS:
+            raise PolicyError(f"{where}.decision: must be one of {list(RULE_DECISIONS)}")
+
+        trace = _template(
+            rule.get("trace", "Rule '{name}': {count} issue(s), at most {max} allowed"),
+            f"{where}.trace"
+        )
+
+        return CompiledRule(name, RuleMatcher(severities, types, rule_ids, paths), maximum, decision, trace)
+
+    # --------------------------------------------------
+    # Scores
+    # --------------------------------------------------
+    def structural_score(self, issue_count, analysis_mode):
+        if analysis_mode != "project":
+            return 0
+        return min(self.structural_max, int(issue_count * self.per_issue))
+
+    def final_score(self, static_score, structural_score, advisory_modifier):
+        score = int(
+            self.weights["static"] * static_score
+            + self.weights["structural"] * structural_score
+            + self.weights["advisory"] * advisory_modifier
+        )
+        return max(0, min(score, 100))
+
+    def evaluate(self, issues, static_score, analysis_mode="project", advisory_modifier=0):
+        """
+        Scores with this policy's weights, then decides.
+        """
+        return PolicySet([self]).evaluate(issues, static_score, analysis_mode, advisory_modifier)[self.name]
+
+    def decide(self, final_score, issues):
+        """
+        Decision for an already computed final score.
+        """
+        policies = PolicySet([self])
+        counts, first, issue_count = policies.count(issues)
+        return policies.decide(self, counts, first, issue_count, final_score)
+
+    def describe(self):
+        return {"name": self.name, "description": self.description, **self.spec}
+
+
+class PolicySet:
+    """
+    Several policies evaluated against one review in a single pass over
+    its issues (what-if reports).
+    """
+
+    def __init__(self, policies):
+        self.policies = list(policies)
+        self.matchers = []
+        self.slots = {}          # policy name → [matcher index per rule]
+        shared = {}
+
+        for policy in self.policies:
+            slots = []
+            for rule in policy.rules:
+                key = rule.matcher.key()
+                if key not in shared:
+                    shared[key] = len(self.matchers)
+                    self.matchers.append(rule.matcher)
+                slots.append(shared[key])
+            self.slots[policy.name] = slots
+
+        # (severity, type) → matchers passing those filters, filled lazily
+        self.by_kind = {}
+
+    def count(self, issues):
+        """
+        One pass: per matcher, matching issues and the first match.
+        """
+        counts = [0] * len(self.matchers)
+        first = [None] * len(self.matchers)
+        issue_count = 0
+
+        for issue in issues:
+            issue_count += 1
+            kind = (issue.get("severity"), issue.get("type"))
+
+            candidates = self.by_kind.get(kind)
+            if candidates is None:
+                candidates = self.by_kind[kind] = [
+                    position for position, matcher in enumerate(self.matchers)
+                    if matcher.matches_kind(*kind)
+                ]
+
+            for position in candidates:
+                if self.matchers[position].matches_rest(issue):
+                    if counts[position] == 0:
+                        first[position] = issue
+                    counts[position] += 1
+
+        return counts, first, issue_count
+
+    def evaluate(self, issues, static_score, analysis_mode="project", advisory_modifier=0):
+        """
+        {policy name: outcome} — scores (each policy's own weights),
+        decision and trace per policy.
+        """
+        counts, first, issue_count = self.count(issues)
+        outcomes = {}
+
+        for policy in self.policies:
+            structural = policy.structural_score(issue_count, analysis_mode)
+            final_score = policy.final_score(static_score, structural, advisory_modifier)
+
+            outcome = self.decide(policy, counts, first, issue_count, final_score)
+            outcome["risk_breakdown"] = {
+                "static_risk": static_score,
+                "structural_risk": structural,
+                "ai_modifier": advisory_modifier
+            }
+            outcomes[policy.name] = outcome
+
+        return outcomes
+
+    def decide(self, policy, counts, first, issue_count, final_score):
+        decision = None
+        reason = None
+        rule_trace = []
+
+        for rule, position in zip(policy.rules, self.slots[policy.name]):
+            count = counts[position]
+            triggered = count > rule.max
+            rule_trace.append({
+                "rule": rule.name,
+                "matched": count,
+                "max": rule.max,
+                "triggered": triggered,
+                "decision": rule.decision
+            })
+
+            if triggered and decision is None:
+                decision = rule.decision
+                example = first[position] or {}
+                reason = rule.trace.format(
+                    message=example.get("message"), count=count, max=rule.max,
+                    name=rule.name, score=final_score
+                )
+
+        if decision is None:
+            if final_score >= policy.block_at:
+                decision, limit = "BLOCK", policy.block_at
+            elif final_score >= policy.warn_at:
+                decision, limit = "WARN", policy.warn_at
+            else:
+                decision, limit = "PASS", policy.warn_at
+            reason = policy.score_trace[decision].format(
+                message="", count=issue_count, max=limit, name=policy.name, score=final_score
+            )
+
+        return {
+            "policy": policy.name,
+            "decision": decision,
+            "decision_trace": [reason],
+            "final_score": final_score,
+            "trace": {
+                "rules": rule_trace,
+                "score": {
+                    "final_score": final_score,
+                    "block": policy.block_at,
+                    "warn": policy.warn_at
+                }
+            }
+        }
+
+
+# =========================================================
+# REGISTRY
+# =========================================================
+
+class PolicyRegistry:
+    """
+    Every configured policy, validated and compiled once at load.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        if not isinstance(config, dict) or set(config) - {"default", "policies"}:
+            raise PolicyError("policy file: expected {'default': ..., 'policies': {...}}")
+
+        specs = config.get("policies", {})
+        if not isinstance(specs, dict):
+            raise PolicyError("policies: must be an object")
+
+        self.policies = {}
+        for name in [DEFAULT_POLICY_NAME] + sorted(set(specs) - {DEFAULT_POLICY_NAME}):
+            self.policies[name] = Policy(name, resolve_policy(name, specs))
+
+        self.default = config.get("default", DEFAULT_POLICY_NAME)
+        if self.default not in self.policies:
+            raise PolicyError(f"default: unknown policy '{self.default}'")
+
+        # Part of the response-cache fingerprint: new policies, new answers
+        canonical = json.dumps([self.default, {n: p.spec for n, p in self.policies.items()}], sort_keys=True)
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def names(self):
+        return list(self.policies)
+
+    def get(self, name=None):
+        """
+        Named (or default) policy; KeyError for unknown names.
+        """
+        return self.policies[name or self.default]
+
+    def policy_set(self, names):
+        return PolicySet(self.policies[name] for name in names)
+
+
+def load_policies(path):
+    try:
+        with open(path, encoding="utf-8") as handle:
+            config = json.load(handle)
+    except (OSError, ValueError) as e:
+        raise PolicyError(f"{path}: {e}")
+    return PolicyRegistry(config)
+
+
+_registry = None
+
+
+def policy_registry():
+    """
+    Process-wide registry from QUALITY_POLICY_FILE, loaded on first use.
+    An invalid file raises PolicyError rather than silently gating with
+    the default.
+    """
+    global _registry
+
+    if _registry is None:
+        _registry = load_policies(QUALITY_POLICY_FILE) if QUALITY_POLICY_FILE else PolicyRegistry()
+
+    return _registry
+
+
+def default_policy():
+    return policy_registry().get()
@@ -1,44 +1,220 @@
+import ast
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
 from app.core.analyzer import analyze_code
-from app.core.project_parser import parse_project_files
+from app.core.language_detector import detect_language
+from app.core.line_index import LineIndex
+from app.core.baseline import suppression_index, is_suppressed
+from app.core.project_parser import new_project_data, extract_file_symbols, merge_file_symbols
 from app.core.project_issue_detector import detect_project_issues
+from app.core.taint_analyzer import summarize_file, add_file_summaries, find_taint_issues
+from app.core.clone_detector import CloneIndex, clone_issues, code_hash, file_fingerprints
+from app.core.rule_stats import active_rule_stats, measure
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Worker processes for per-file analysis (default: one per CPU;
+# 0 or 1 = analyze in-process)
+REVIEW_WORKERS = int(os.getenv("REVIEW_WORKERS") or os.cpu_count() or 1)
+
+# Smaller projects are not worth the inter-process transfer
+REVIEW_PARALLEL_MIN_FILES = int(os.getenv("REVIEW_PARALLEL_MIN_FILES", "64"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
 
+def _worker_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=REVIEW_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
 
-def analyze_project(files, language):
+
+# =========================================================
+# PER-FILE PASS (IN-PROCESS OR IN A WORKER)
+# =========================================================
+
+def analyze_source_file(path, code, language):
+    """
+    Everything that needs the file's AST, in one parse:
+    issues + metrics, symbol contribution, taint summaries and clone
+    fingerprints. The result is picklable, so it can come from a worker.
+    """
+    tree = None
+
+    if language == "python":
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            tree = None
+
+    # One line index per file, shared by every rule that reports a position
+    lines = LineIndex(code)
+
+    # Inline 'quality-gate: ignore' comments (also applied to
+    # project-level issues that point into this file)
+    suppressions = suppression_index(code, lines)
+
+    metrics = {}
+    result = {
+        "issues": analyze_code(
+            code, language, tree=tree, path=path, metrics=metrics,
+            lines=lines, suppressions=suppressions
+        ),
+        "metrics": metrics,
+        "suppressions": suppressions,
+        "symbols": None,
+        "taint": None,
+        "clones": None
+    }
+
+    if tree is not None:
+        result["symbols"] = extract_file_symbols(path, tree, lines)
+        result["taint"] = summarize_file(path, code, tree, lines)
+        result["clones"] = (code_hash(code), file_fingerprints(code, tree, lines))
+
+    return result
+
+
+def analyze_project(files, memory=None):
     """
     STEP 3:
-    - File-level analysis (existing)
+    - Per-file language detection (extension, then shebang)
+    - File-level analysis routed to that language's analyzer
     - Project-level parsing (AST)
     - Cross-file issue detection
+
+    Files no analyzer supports (docs, lockfiles, ...) are skipped before
+    any analysis. Files are streamed: each one is parsed once, every
+    per-file pass reuses that tree, and the tree is dropped before the
+    next file. Large projects are spread over REVIEW_WORKERS processes.
+
+    'memory' is an optional MemoryTracker. Under memory pressure the
+    low-memory strategy drops the clone index (one signature per
+    function, the only structure here that grows with the code rather
+    than with the findings) and stops filling it. Source text is not
+    released: the request holds it until the response is sent.
     """
 
     project_results = []
+    project_data = new_project_data()
+    taint_functions = {}
+    state = {"clones": CloneIndex()}
+    skipped = []
+    languages = Counter()
+    suppressions = {}
+
+    def switch_to_low_memory():
+        state["clones"] = None
 
     # -----------------------------------
-    # File-level analysis (existing)
+    # Route by detected language
     # -----------------------------------
+    routed = []
+
     for file in files:
-        issues = analyze_code(file.code, language)
+        language = detect_language(file.path, file.code[:128])
+
+        if language is None:
+            skipped.append(file.path)
+            continue
+
+        languages[language] += 1
+        routed.append((file.path, file.code, language))
+
+    stats = active_rule_stats()
+
+    # Rule stats are per process: instrumented requests stay in-process
+    parallel = (
+        REVIEW_WORKERS > 1
+        and len(routed) >= REVIEW_PARALLEL_MIN_FILES
+        and stats is None
+    )
+
+    if parallel:
+        per_file = _worker_pool().map(analyze_source_file, *zip(*routed), chunksize=16)
+    else:
+        per_file = (analyze_source_file(*entry) for entry in routed)
+
+    for position, result in enumerate(per_file):
+        path, _, language = routed[position]
+
+        # -----------------------------------
+        # File-level analysis (existing)
+        # -----------------------------------
         project_results.append({
-            "path": file.path,
-            "issues": issues
+            "path": path,
+            "language": language,
+            "issues": result["issues"],
+            "metrics": result["metrics"]
         })
 
+        # -----------------------------------
+        # Project-level symbols (STEP 2)
+        # -----------------------------------
+        if result["suppressions"]:
+            suppressions[path] = result["suppressions"]
+
+        if result["symbols"] is not None:
+            merge_file_symbols(project_data, path, result["symbols"])
+
+        # -----------------------------------
+        # Taint summaries + clone fingerprints
+        # -----------------------------------
+        if result["taint"] is not None:
+            add_file_summaries(taint_functions, path, result["taint"])
+
+        if result["clones"] is not None and state["clones"] is not None:
+            state["clones"].add_fingerprints(path, *result["clones"])
+
+        del result
+
+        if memory is not None:
+            memory.enforce(on_pressure=switch_to_low_memory)
+
+    # -----------------------------------
+    # Cross-file issue detection (STEP 3)
+    # -----------------------------------
+    project_issues = measure(stats, "detect_project_issues", None, detect_project_issues, project_data)
+
     # -----------------------------------
-    # Project-level AST parsing (STEP 2)
+    # Interprocedural taint tracking
     # -----------------------------------
-    project_data = parse_project_files(files)
+    project_issues.extend(
+        measure(stats, "find_taint_issues", None, find_taint_issues, taint_functions, project_data)
+    )
 
     # -----------------------------------
-    # Cross-file issue detection (STEP 3)
+    # Copy-paste detection (AST fingerprints + LSH)
     # -----------------------------------
-    project_issues = detect_project_issues(project_data)
+    if state["clones"] is not None:
+        project_issues.extend(measure(stats, "clone_issues", None, clone_issues, state["clones"]))
+
+    if suppressions:
+        project_issues = [
+            issue for issue in project_issues
+            if not is_suppressed(issue, suppressions.get(issue.get("path")))
+        ]
 
     # -----------------------------------
     # Attach project-level issues
     # -----------------------------------
     project_results.append({
         "path": "__project__",
-        "issues": project_issues
+        "issues": project_issues,
+        "languages": dict(languages),
+        "skipped_files": skipped
     })
 
     return project_results
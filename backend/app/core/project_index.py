@@ -0,0 +1,256 @@
+import ast
+import hashlib
+import os
+import threading
+
+from app.core.analyzer import analyze_code
+from app.core.file_watcher import walk_files
+from app.core.language_detector import detect_file_language
+from app.core.line_index import LineIndex
+from app.core.baseline import suppression_index, is_suppressed
+from app.core.pipeline import static_verdict
+from app.core.project_parser import new_project_data, extract_file_symbols, merge_file_symbols
+from app.core.project_issue_detector import detect_project_issues
+from app.core.taint_analyzer import add_taint_summaries, find_taint_issues
+from app.core.clone_detector import CloneIndex, clone_issues
+
+
+class ProjectIndex:
+    """
+    Warm, incrementally updated view of a project directory.
+
+    Per file: content hash, file-level issues, symbol contribution and
+    taint summaries. Cross-file results are cached and recomputed only
+    when an input they depend on changed:
+
+    - detect_project_issues → symbol contributions (definitions / calls)
+    - taint issues          → taint summaries or symbol contributions
+    - clone issues          → any re-indexed .py file
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.lock = threading.RLock()
+
+        self.files = {}                 # relative path → entry
+        self.taint_functions = {}       # (path, qualname) → summary info
+        self.clones = CloneIndex()
+
+        self.project_data = new_project_data()
+        self.cached = {"project": [], "taint": [], "clones": []}
+        self.dirty = {"symbols": True, "taint": True, "clones": True}
+
+        self.version = 0
+        self.verdicts = {}              # (version, context) → result
+        self.stats = {"updates": 0, "reanalyzed": 0, "project_recomputes": 0}
+
+    # -----------------------------------------------------
+    # File updates
+    # -----------------------------------------------------
+    def relative(self, path):
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+
+    def scan(self):
+        """
+        Full walk (startup, or after a watcher overflow). Files that
+        disappeared are dropped; unchanged files are not re-read.
+        """
+        with self.lock:
+            present = set(walk_files(self.root))
+            gone = {
+                os.path.join(self.root, path) for path in self.files
+            } - present
+            return self.update(present | gone)
+
+    def update(self, paths):
+        """
+        Re-indexes the given absolute paths. Returns the relative paths
+        whose analysis actually changed.
+        """
+        changed = []
+
+        with self.lock:
+            for path in paths:
+                rel = self.relative(path)
+                if rel.startswith("../"):
+                    continue
+
+                # Unsupported files are never read or decoded
+                language = detect_file_language(path)
+
+                if language is None:
+                    if self._remove_file(rel):
+                        changed.append(rel)
+                    continue
+
+                if self._update_file(path, rel, language):
+                    changed.append(rel)
+
+            if changed:
+                self.version += 1
+                self.verdicts.clear()
+                self.stats["updates"] += 1
+
+        return sorted(changed)
+
+    def _update_file(self, path, rel, language):
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return self._remove_file(rel)
+
+        old = self.files.get(rel)
+        if old is not None and old["signature"] == signature:
+            return False
+
+        try:
+            with open(path, "rb") as handle:
+                content = handle.read()
+        except OSError:
+            return self._remove_file(rel)
+
+        content_hash = hashlib.sha1(content).hexdigest()
+        if old is not None and old["hash"] == content_hash:
+            old["signature"] = signature    # touched, not modified
+            return False
+
+        self.stats["reanalyzed"] += 1
+        code = content.decode("utf-8", "replace")
+
+        # Parse once; every per-file pass reuses the tree
+        tree = None
+        if language == "python":
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                tree = None
+
+        lines = LineIndex(code)
+        symbols = extract_file_symbols(rel, tree, lines) if tree is not None else None
+        suppressions = suppression_index(code, lines)
+
+        self.files[rel] = {
+            "signature": signature,
+            "hash": content_hash,
+            "language": language,
+            "issues": analyze_code(code, language, tree=tree, lines=lines, suppressions=suppressions),
+            "symbols": symbols,
+            "suppressions": suppressions
+        }
+
+        if old is None or old["symbols"] != symbols:
+            self.dirty["symbols"] = True
+
+        if language == "python":
+            self._drop_taint(rel)
+            if tree is not None:
+                add_taint_summaries(self.taint_functions, rel, code, tree, lines)
+            self.dirty["taint"] = True
+
+            self.clones.add_file(rel, code, tree, lines)
+            self.dirty["clones"] = True
+
+        return True
+
+    def _remove_file(self, rel):
+        if self.files.pop(rel, None) is None:
+            return False
+
+        self._drop_taint(rel)
+        self.clones.remove_file(rel)
+        self.dirty.update(symbols=True, taint=True, clones=True)
+
+        return True
+
+    def _drop_taint(self, rel):
+        for key in [k for k in self.taint_functions if k[0] == rel]:
+            del self.taint_functions[key]
+
+    # -----------------------------------------------------
+    # Cross-file results (recomputed only when dirty)
+    # -----------------------------------------------------
+    def project_issues(self):
+        with self.lock:
+            if self.dirty["symbols"]:
+                self.project_data = new_project_data()
+                for rel in sorted(self.files):
+                    symbols = self.files[rel]["symbols"]
+                    if symbols is not None:
+                        merge_file_symbols(self.project_data, rel, symbols)
+
+                self.cached["project"] = detect_project_issues(self.project_data)
+                self.stats["project_recomputes"] += 1
+                self.dirty["taint"] = True
+                self.dirty["symbols"] = False
+
+            if self.dirty["taint"]:
+                self.cached["taint"] = find_taint_issues(self.taint_functions, self.project_data)
+                self.dirty["taint"] = False
+
+            if self.dirty["clones"]:
+                self.cached["clones"] = clone_issues(self.clones)
+                self.dirty["clones"] = False
+
+            # Inline 'quality-gate: ignore' comments of the file an issue
+            # points at (applied on read: editing a comment re-indexes
+            # only that file)
+            return [
+                issue
+                for issue in self.cached["project"] + self.cached["taint"] + self.cached["clones"]
+                if not is_suppressed(issue, self._suppressions(issue.get("path")))
+            ]
+
+    def _suppressions(self, rel):
+        entry = self.files.get(rel)
+        return entry["suppressions"] if entry is not None else None
+
+    def raw_issues(self):
+        with self.lock:
+            raw_issues = []
+
+            for rel in sorted(self.files):
+                for issue in self.files[rel]["issues"]:
+                    issue = dict(issue)
+                    issue["path"] = rel
+                    raw_issues.append(issue)
+
+            raw_issues.extend(dict(issue) for issue in self.project_issues())
+
+            return raw_issues
+
+    # -----------------------------------------------------
+    # Queries
+    # -----------------------------------------------------
+    def review(self, context="deployment"):
+        """
+        Static verdict for the whole tree; cached until the next change.
+        """
+        with self.lock:
+            key = (self.version, context)
+
+            if key not in self.verdicts:
+                self.verdicts[key] = static_verdict(self.raw_issues(), context, "project")
+
+            return self.verdicts[key]
+
+    def file_issues(self, path):
+        with self.lock:
+            rel = self.relative(os.path.join(self.root, path))
+            entry = self.files.get(rel)
+            if entry is None:
+                return None
+
+            project = [i for i in self.project_issues() if i.get("path") == rel]
+            return [dict(issue, path=rel) for issue in entry["issues"]] + project
+
+    def status(self):
+        with self.lock:
+            return {
+                "root": self.root,
+                "files": len(self.files),
+                "version": self.version,
+                "functions": len(self.taint_functions),
+                **self.stats
+            }
+
@@ -1,89 +1,68 @@
-import builtins
+from app.core.import_graph import import_graph_issues
 
 
 def detect_project_issues(project_data):
     """
-    Input: project_data from parse_project_files()
+    Input: SymbolTable from parse_project_files()
     Output: list of project-level issues
     """
 
     issues = []
 
-    definitions = project_data.get("definitions", {})
-    class_definitions = project_data.get("class_definitions", {})
-    calls = project_data.get("calls", {})
-    imported_symbols = project_data.get("imports", set())
-
-    # Real Python builtins
-    PYTHON_BUILTINS = set(dir(builtins))
-
     # ==================================================
     # 1. Function used but not defined (CRITICAL)
     # ==================================================
-    for func_name, call_files in calls.items():
-
-        if not func_name:
-            continue
-
-        # Ignore builtins
-        if func_name in PYTHON_BUILTINS:
-            continue
-
-        # Ignore imported names
-        if func_name in imported_symbols:
-            continue
-
-        # Ignore project classes
-        if func_name in class_definitions:
-            continue
-
-        # Ignore capitalized framework classes
-        if func_name[0].isupper():
-            continue
-
-        # Real missing internal function
-        if func_name not in definitions:
-            for file in call_files:
-                issues.append({
-                    "severity": "CRITICAL",
-                    "type": "Project Consistency",
-                    "message": f"Function '{func_name}' is used but not defined in project",
-                    "impact": "Will cause runtime failure",
-                    "suggestion": f"Define '{func_name}' or remove its usage",
-                    "path": file
-                })
+    # Per file: builtins, capitalized (framework) classes, project
+    # classes and every name the file binds (defs, imports, params,
+    # assignments) are skipped; star imports skip the file.
+    for func_name, file, location in project_data.undefined_calls():
+        issues.append({
+            "rule_id": "project.undefined-function",
+            "severity": "CRITICAL",
+            "type": "Project Consistency",
+            "message": f"Function '{func_name}' is used but not defined in project",
+            "impact": "Will cause runtime failure",
+            "suggestion": f"Define '{func_name}' or remove its usage",
+            "path": file,
+            **location
+        })
 
     # ==================================================
     # 2. Dead Code Detection
     # ==================================================
-    for func_name, def_files in definitions.items():
-
-        if func_name.startswith("_"):
-            continue
-
-        if func_name not in calls:
-            for file in def_files:
-                issues.append({
-                    "severity": "LOW",
-                    "type": "Dead Code",
-                    "message": f"Function '{func_name}' is defined but never used",
-                    "impact": "Increases maintenance burden",
-                    "suggestion": f"Remove '{func_name}' or use it",
-                    "path": file
-                })
+    for qualname, file, location in project_data.unused_definitions():
+        issues.append({
+            "rule_id": "project.dead-code",
+            "severity": "LOW",
+            "type": "Dead Code",
+            "message": f"Function '{qualname}' is defined but never used",
+            "impact": "Increases maintenance burden",
+            "suggestion": f"Remove '{qualname}' or use it",
+            "path": file,
+            **location
+        })
 
     # ==================================================
     # 3. Duplicate Definitions
     # ==================================================
-    for func_name, def_files in definitions.items():
-        if len(def_files) > 1:
+    # One issue per definition site; grouping turns them into one
+    # issue with an occurrence per file.
+    for func_name, sites in project_data.duplicate_functions().items():
+        for file, location in sites:
             issues.append({
+                "rule_id": "project.duplicate-definition",
                 "severity": "MEDIUM",
                 "type": "Duplicate Definition",
                 "message": f"Function '{func_name}' is defined in multiple files",
                 "impact": "May cause ambiguity or unexpected behavior",
                 "suggestion": "Keep a single source of truth",
-                "path": ", ".join(def_files)
+                "path": file,
+                **location
             })
 
+    # ==================================================
+    # 4. Import cycles / layer violations
+    # ==================================================
+    issues.extend(import_graph_issues(project_data.modules, project_data.module_imports))
+
     return issues
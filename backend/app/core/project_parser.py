@@ -1,27 +1,91 @@
 import ast
-from collections import defaultdict
+
+from app.core.line_index import LOCATION_KEYS, LineIndex, node_span
+from app.core.symbol_table import CLASS, DECORATED, FUNCTION, METHOD, NESTED, SymbolTable
+
+
+def span_values(node, lines):
+    """
+    [line, column, end_line, end_column] of a node (compact, cacheable).
+    """
+    span = node_span(node, lines)
+    return [span[key] for key in LOCATION_KEYS]
 
 
 class ProjectASTParser(ast.NodeVisitor):
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, lines=None):
         self.file_path = file_path
-        self.defined_functions = set()
-        self.defined_classes = set()
-        self.called_functions = set()
-        self.imported_names = set()
+        self.lines = lines
+
+        # [qualified name within the module, kind, flags, *span]
+        self.definitions = []
+
+        # name → span of its first call
+        self.called_functions = {}
+        self.referenced_names = set()
+        self.attribute_names = set()
+        self.bound_names = set()
+        self.star_import = False
+
+        # from-imports in any scope: [level, module, name]
+        self.import_bindings = []
+
+        # Module-level imports only: [level, module, [names], *span]
+        self.module_imports = []
+        self.scope_depth = 0
+
+        # Enclosing classes / functions: [(name, is_class)]
+        self.scope = []
 
     # --------------------------------------------------
-    # Function definitions
+    # Function / class definitions
     # --------------------------------------------------
     def visit_FunctionDef(self, node):
-        self.defined_functions.add(node.name)
+        in_class = bool(self.scope) and self.scope[-1][1]
+        self.define(node, METHOD if in_class else FUNCTION)
+
+        # Imports inside functions run lazily; they do not form cycles
+        self.scope_depth += 1
+        self.visit_body(node, is_class=False)
+        self.scope_depth -= 1
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        self.define(node, CLASS)
+        self.visit_body(node, is_class=True)
+
+    def define(self, node, kind):
+        flags = DECORATED if node.decorator_list else 0
+        if any(not is_class for _, is_class in self.scope):
+            flags |= NESTED
+
+        qualname = ".".join([name for name, _ in self.scope] + [node.name])
+        self.definitions.append([qualname, kind, flags] + span_values(node, self.lines))
+        self.bound_names.add(node.name)
+
+    def visit_body(self, node, is_class):
+        self.scope.append((node.name, is_class))
         self.generic_visit(node)
+        self.scope.pop()
 
     # --------------------------------------------------
-    # Class definitions
+    # if TYPE_CHECKING: imports never run
     # --------------------------------------------------
-    def visit_ClassDef(self, node):
-        self.defined_classes.add(node.name)
+    def visit_If(self, node):
+        test = node.test
+        name = test.id if isinstance(test, ast.Name) else getattr(test, "attr", None)
+
+        if name == "TYPE_CHECKING":
+            self.visit(test)
+            self.scope_depth += 1
+            for child in node.body:
+                self.visit(child)
+            self.scope_depth -= 1
+            for child in node.orelse:
+                self.visit(child)
+            return
+
         self.generic_visit(node)
 
     # --------------------------------------------------
@@ -41,21 +105,59 @@ class ProjectASTParser(ast.NodeVisitor):
             etc.
         """
 
-        if isinstance(node.func, ast.Name):
-            self.called_functions.add(node.func.id)
+        if isinstance(node.func, ast.Name) and node.func.id not in self.called_functions:
+            self.called_functions[node.func.id] = span_values(node, self.lines)
 
         # Completely ignore Attribute calls
         # That eliminates fake CRITICALs
 
         self.generic_visit(node)
 
+    # --------------------------------------------------
+    # Names read / bound in this file
+    # --------------------------------------------------
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self.referenced_names.add(node.id)
+        else:
+            self.bound_names.add(node.id)
+
+    def visit_Attribute(self, node):
+        # obj.method / module.func: may reach any definition of that name
+        self.attribute_names.add(node.attr)
+        self.generic_visit(node)
+
+    def visit_arg(self, node):
+        self.bound_names.add(node.arg)
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            self.bound_names.add(node.name)
+        self.generic_visit(node)
+
+    def visit_Global(self, node):
+        self.bound_names.update(node.names)
+
+    visit_Nonlocal = visit_Global
+
+    def visit_MatchAs(self, node):
+        if node.name:
+            self.bound_names.add(node.name)
+        self.generic_visit(node)
+
+    visit_MatchStar = visit_MatchAs
+
     # --------------------------------------------------
     # import x
     # --------------------------------------------------
     def visit_Import(self, node):
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name.split(".")[0]
-            self.imported_names.add(name)
+            self.bound_names.add(name)
+
+            if self.scope_depth == 0:
+                self.module_imports.append([0, alias.name, []] + span_values(node, self.lines))
         self.generic_visit(node)
 
     # --------------------------------------------------
@@ -63,23 +165,67 @@ class ProjectASTParser(ast.NodeVisitor):
     # --------------------------------------------------
     def visit_ImportFrom(self, node):
         for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
-            self.imported_names.add(name)
+            if alias.name == "*":
+                self.star_import = True
+                continue
+
+            self.bound_names.add(alias.asname if alias.asname else alias.name)
+            self.import_bindings.append([node.level, node.module or "", alias.name])
+
+        if self.scope_depth == 0:
+            names = sorted(alias.name for alias in node.names if alias.name != "*")
+            self.module_imports.append([node.level, node.module or "", names] + span_values(node, self.lines))
         self.generic_visit(node)
 
 
+def new_project_data():
+    return SymbolTable()
+
+
+def extract_file_symbols(path, tree, lines=None):
+    """
+    One file's symbol contribution (JSON-serializable, cacheable).
+    Names stay module-relative and imports unresolved, so the result
+    does not depend on 'path'. Definitions, first call sites and
+    module imports carry [line, column, end_line, end_column] ('lines':
+    the file's LineIndex, for character columns).
+    """
+    parser = ProjectASTParser(path, lines)
+    parser.visit(tree)
+
+    return {
+        "definitions": sorted(parser.definitions),
+        "calls": sorted([name] + span for name, span in parser.called_functions.items()),
+        "references": sorted(parser.referenced_names),
+        "attributes": sorted(parser.attribute_names),
+        "bound": sorted(parser.bound_names),
+        "star_import": parser.star_import,
+        "import_bindings": sorted(parser.import_bindings),
+        "module_imports": sorted(parser.module_imports)
+    }
+
+
+def merge_file_symbols(project_data, path, symbols):
+    """
+    Adds one file's symbol contribution to the project symbol table.
+    """
+    project_data.add_file(path, symbols)
+
+
+def add_file_symbols(project_data, path, tree, lines=None):
+    """
+    Adds one parsed file's contribution to the symbol table.
+    """
+    merge_file_symbols(project_data, path, extract_file_symbols(path, tree, lines))
+
+
 def parse_project_files(files):
     """
     Input: list of ProjectFile
-    Output: project-level symbol table
+    Output: project-level symbol table (SymbolTable)
     """
 
-    project_data = {
-        "definitions": defaultdict(list),
-        "class_definitions": defaultdict(list),
-        "calls": defaultdict(list),
-        "imports": set()   # GLOBAL set now
-    }
+    project_data = new_project_data()
 
     for file in files:
         try:
@@ -87,22 +233,6 @@ def parse_project_files(files):
         except SyntaxError:
             continue
 
-        parser = ProjectASTParser(file.path)
-        parser.visit(tree)
-
-        # Functions
-        for fn in parser.defined_functions:
-            project_data["definitions"][fn].append(file.path)
-
-        # Classes
-        for cls in parser.defined_classes:
-            project_data["class_definitions"][cls].append(file.path)
-
-        # Calls
-        for fn in parser.called_functions:
-            project_data["calls"][fn].append(file.path)
-
-        # Imports (GLOBAL)
-        project_data["imports"].update(parser.imported_names)
+        add_file_symbols(project_data, file.path, tree, LineIndex(file.code))
 
     return project_data
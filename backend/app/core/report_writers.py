@@ -0,0 +1,296 @@
+import json
+from xml.sax.saxutils import escape, quoteattr
+
+from app.core.response_cache import ANALYZER_VERSION
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+REPORT_FORMATS = ("json", "sarif", "junit")
+
+MEDIA_TYPES = {
+    "sarif": "application/sarif+json",
+    "junit": "application/xml"
+}
+
+# Chunks handed to the transport (one per issue is too chatty)
+WRITE_BUFFER_BYTES = 64 * 1024
+
+TOOL_NAME = "AI Code Quality Gate"
+TOOL_URI = "https://github.com/Punyashree-4143/AI-Based-Code-Quality-and-Security-Analysis-System"
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+SARIF_LEVELS = {
+    "CRITICAL": "error",
+    "HIGH": "error",
+    "MEDIUM": "warning",
+    "LOW": "note"
+}
+
+# GitHub code scanning reads rule property 'security-severity' (0-10)
+SECURITY_SEVERITY = {
+    "CRITICAL": "9.5",
+    "HIGH": "8.0",
+    "MEDIUM": "5.5",
+    "LOW": "2.0"
+}
+
+SEVERITY_ORDER = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# partialFingerprints key for the baseline fingerprint (app.core.baseline)
+FINGERPRINT_KEY = "qualityGate/v1"
+
+
+def buffered(chunks, size=WRITE_BUFFER_BYTES):
+    """
+    Joins small string chunks into writes of about 'size' characters.
+    """
+    pending = []
+    pending_size = 0
+
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= size:
+            yield "".join(pending)
+            pending = []
+            pending_size = 0
+
+    if pending:
+        yield "".join(pending)
+
+
+def locations(issue):
+    """
+    Every listed occurrence of an issue group ({path, line, ...}).
+    """
+    occurrences = issue.get("occurrences") or [issue]
+    return [
+        {key: occurrence.get(key) for key in ("path", "line", "column", "end_line", "end_column", "fingerprint")}
+        for occurrence in occurrences
+    ]
+
+
+def _rule_id(issue):
+    return issue.get("rule_id") or "quality-gate.unclassified"
+
+
+# =========================================================
+# SARIF 2.1.0
+# =========================================================
+
+def _sarif_rules(issues):
+    """
+    rule id → descriptor; one cheap pass, since the driver's rule list
+    precedes the results. Severity is the strongest seen for the rule.
+    """
+    rules = {}
+
+    for issue in issues:
+        rule_id = _rule_id(issue)
+        severity = (issue.get("severity") or "LOW").upper()
+        known = rules.get(rule_id)
+
+        if known is None:
+            rules[rule_id] = {"issue": issue, "severity": severity}
+        elif SEVERITY_ORDER.index(severity if severity in SEVERITY_ORDER else "LOW") > \
+                SEVERITY_ORDER.index(known["severity"] if known["severity"] in SEVERITY_ORDER else "LOW"):
+            known["severity"] = severity
+
+    descriptors = []
+    for rule_id, seen in rules.items():
+        issue = seen["issue"]
+        properties = {"tags": [issue.get("type") or "Quality"], "problem.severity": SARIF_LEVELS.get(seen["severity"], "note")}
+        if "security" in (issue.get("type") or "").lower():
+            properties["tags"].append("security")
+            properties["security-severity"] = SECURITY_SEVERITY.get(seen["severity"], "2.0")
+
+        descriptor = {
+            "id": rule_id,
+            "name": rule_id.rsplit(".", 1)[-1],
+            "shortDescription": {"text": issue.get("type") or rule_id},
+            "defaultConfiguration": {"level": SARIF_LEVELS.get(seen["severity"], "note")},
+            "properties": properties
+        }
+        if issue.get("suggestion"):
+            descriptor["help"] = {"text": issue["suggestion"]}
+
+        descriptors.append(descriptor)
+
+    return descriptors
+
+
+def _sarif_region(location):
+    region = {}
+    if location.get("line"):
+        region["startLine"] = location["line"]
+        if location.get("column"):
+            region["startColumn"] = location["column"]
+        if location.get("end_line"):
+            region["endLine"] = location["end_line"]
+        if location.get("end_column"):
+            region["endColumn"] = location["end_column"]
+    return region
+
+
+def sarif_chunks(result):
+    """
+    A review result as SARIF 2.1.0, yielded piece by piece: the header
+    with the rule table, then one result object per issue occurrence.
+    Only one issue is serialized at a time.
+    """
+    issues = result.get("issues") or []
+    rules = _sarif_rules(issues)
+    rule_index = {rule["id"]: position for position, rule in enumerate(rules)}
+
+    driver = {
+        "name": TOOL_NAME,
+        "informationUri": TOOL_URI,
+        "version": ANALYZER_VERSION,
+        "rules": rules
+    }
+
+    yield '{"$schema":' + json.dumps(SARIF_SCHEMA) + ',"version":"2.1.0","runs":[{'
+    yield '"tool":{"driver":' + json.dumps(driver) + '},'
+    yield '"results":['
+
+    first = True
+    for issue in issues:
+        rule_id = _rule_id(issue)
+        severity = (issue.get("severity") or "LOW").upper()
+
+        text = issue.get("message") or rule_id
+        if issue.get("impact"):
+            text = f"{text} ({issue['impact']})"
+
+        for location in locations(issue):
+            physical = {"artifactLocation": {"uri": location.get("path") or "<code>"}}
+            region = _sarif_region(location)
+            if region:
+                physical["region"] = region
+
+            entry = {
+                "ruleId": rule_id,
+                "ruleIndex": rule_index[rule_id],
+                "level": SARIF_LEVELS.get(severity, "note"),
+                "message": {"text": text},
+                "locations": [{"physicalLocation": physical}],
+                "properties": {"severity": severity, "type": issue.get("type")}
+            }
+            if issue.get("confidence") is not None:
+                entry["properties"]["confidence"] = issue["confidence"]
+            if location.get("fingerprint"):
+                entry["partialFingerprints"] = {FINGERPRINT_KEY: location["fingerprint"]}
+
+            yield ("" if first else ",") + json.dumps(entry)
+            first = False
+
+    invocation = {
+        "executionSuccessful": True,
+        "properties": {
+            "decision": result.get("decision"),
+            "final_score": result.get("final_score"),
+            "decision_trace": result.get("decision_trace", []),
+            "review_id": result.get("review_id")
+        }
+    }
+    yield '],"invocations":[' + json.dumps(invocation) + ']}]}'
+
+
+# =========================================================
+# JUNIT XML
+# =========================================================
+
+def _classname(path):
+    if not path:
+        return "code"
+    stem = path.rsplit(".", 1)[0] if "." in path.rsplit("/", 1)[-1] else path
+    return stem.replace("\\", "/").strip("/").replace("/", ".")
+
+
+def junit_chunks(result):
+    """
+    A review result as JUnit XML: one failing test case per issue
+    occurrence plus a 'decision' case that fails on BLOCK.
+    """
+    issues = result.get("issues") or []
+    decision = result.get("decision") or "PASS"
+
+    occurrences = sum(len(issue.get("occurrences") or [issue]) for issue in issues)
+    tests = occurrences + 1
+    failures = occurrences + (decision == "BLOCK")
+
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield (
+        f'<testsuites name={quoteattr(TOOL_NAME)} tests="{tests}" failures="{failures}" errors="0">\n'
+        f'  <testsuite name="quality-gate" tests="{tests}" failures="{failures}" errors="0" skipped="0">\n'
+        '    <properties>\n'
+    )
+
+    properties = {
+        "decision": decision,
+        "final_score": result.get("final_score"),
+        "policy": (result.get("policy") or {}).get("name"),
+        "analyzer_version": ANALYZER_VERSION,
+        "review_id": result.get("review_id")
+    }
+    for name, value in properties.items():
+        if value is not None:
+            yield f'      <property name={quoteattr(name)} value={quoteattr(str(value))}/>\n'
+    yield '    </properties>\n'
+
+    trace = escape("\n".join(result.get("decision_trace") or []))
+    yield '    <testcase classname="quality-gate" name="decision">'
+    if decision == "BLOCK":
+        yield f'<failure message="Quality gate blocked" type="BLOCK">{trace}</failure>'
+    yield '</testcase>\n'
+
+    for issue in issues:
+        rule_id = _rule_id(issue)
+        severity = issue.get("severity") or "LOW"
+        message = issue.get("message") or rule_id
+
+        details = "\n".join(
+            f"{label}: {issue[key]}"
+            for label, key in (("Type", "type"), ("Impact", "impact"), ("Suggestion", "suggestion"))
+            if issue.get(key)
+        )
+
+        for location in locations(issue):
+            path = location.get("path")
+            line = location.get("line")
+            name = f"{rule_id} (line {line})" if line else rule_id
+
+            attributes = f'classname={quoteattr(_classname(path))} name={quoteattr(name)}'
+            if path:
+                attributes += f' file={quoteattr(path)}'
+            if line:
+                attributes += f' line="{int(line)}"'
+
+            yield (
+                f'    <testcase {attributes}>'
+                f'<failure message={quoteattr(message)} type={quoteattr(severity)}>{escape(details)}</failure>'
+                '</testcase>\n'
+            )
+
+    yield '  </testsuite>\n</testsuites>\n'
+
+
+WRITERS = {
+    "sarif": sarif_chunks,
+    "junit": junit_chunks
+}
+
+
+def report_chunks(result, report_format):
+    """
+    Buffered chunks of 'result' in a non-JSON report format.
+    """
+    return buffered(WRITERS[report_format](result))
+
+
+def write_report(result, report_format, handle):
+    for chunk in report_chunks(result, report_format):
+        handle.write(chunk)
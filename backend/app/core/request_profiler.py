@@ -0,0 +1,294 @@
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Read at use time: .env is loaded after the routers are imported
+def _env(name, default):
+    return os.getenv(name, default)
+
+
+PROFILE_KINDS = ("cprofile", "sampling")
+PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+TOP_FUNCTIONS = 20
+
+
+class ProfilingDenied(Exception):
+    """
+    Carries the HTTP status to return (403 / 422 / 429).
+    """
+
+    def __init__(self, status_code, detail, retry_after=None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+# =========================================================
+# RATE LIMITING
+# =========================================================
+
+class TokenBucket:
+    """
+    'rate' tokens per second, at most 'burst' stored.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """
+        Returns 0 when a token was taken, else seconds until one is available.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+
+            return (1 - self.tokens) / self.rate if self.rate > 0 else 3600
+
+
+# =========================================================
+# SAMPLING PROFILER (COLLAPSED STACKS)
+# =========================================================
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's stack every 'interval' seconds from a helper
+    thread. Output is the collapsed-stack format used by flamegraph.pl
+    and speedscope ("root;child;leaf count").
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def collapsed(self):
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+    def top(self):
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+
+        total = sum(leaves.values()) or 1
+        return [
+            {"function": name, "samples": count, "percent": round(100 * count / total, 1)}
+            for name, count in leaves.most_common(TOP_FUNCTIONS)
+        ]
+
+
+# =========================================================
+# PROFILE SESSIONS
+# =========================================================
+
+class ProfileSession:
+    """
+    One profiled request. stop() is idempotent, saves the profile and
+    releases the single profiling slot.
+    """
+
+    def __init__(self, owner, kind):
+        self.owner = owner
+        self.kind = kind
+        self.profile_id = uuid.uuid4().hex
+        self.summary = None
+        self.started = time.perf_counter()
+
+        if kind == "cprofile":
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        else:
+            self.profiler = SamplingProfiler(
+                threading.get_ident(),
+                float(_env("PROFILE_SAMPLE_INTERVAL", "0.001"))
+            )
+            self.profiler.start()
+
+    def stop(self):
+        if self.summary is not None:
+            return self.summary
+
+        try:
+            if self.kind == "cprofile":
+                self.profiler.disable()
+                path = self.owner.output_path(self.profile_id, ".pstats")
+                self.profiler.dump_stats(path)
+                top = cprofile_top(self.profiler)
+            else:
+                self.profiler.stop()
+                path = self.owner.output_path(self.profile_id, ".folded")
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(self.profiler.collapsed())
+                top = self.profiler.top()
+
+            self.summary = {
+                "profile_id": self.profile_id,
+                "kind": self.kind,
+                "duration_ms": round((time.perf_counter() - self.started) * 1000, 3),
+                "download_url": f"/api/v1/profiles/{self.profile_id}",
+                "top": top
+            }
+        finally:
+            self.owner.release()
+
+        self.owner.prune()
+        return self.summary
+
+
+def cprofile_top(profiler):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+
+    return [
+        {
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3)
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in rows[:TOP_FUNCTIONS]
+    ]
+
+
+class RequestProfiler:
+    """
+    Guards profiling: a shared-secret token (PROFILE_TOKEN), a token
+    bucket (PROFILE_RATE per minute, PROFILE_BURST) and at most one
+    profiled request at a time. Profiles are written to PROFILE_DIR;
+    only the newest PROFILE_KEEP files are kept.
+    """
+
+    def __init__(self, token=None, directory=None, rate_per_minute=None, burst=None, keep=None):
+        self.token = token
+        self.directory = directory
+        self.keep = keep
+        self.slot = threading.Lock()
+        self.bucket = TokenBucket(
+            float(rate_per_minute if rate_per_minute is not None else _env("PROFILE_RATE", "6")) / 60,
+            float(burst if burst is not None else _env("PROFILE_BURST", "2"))
+        )
+
+    def expected_token(self):
+        return self.token if self.token is not None else _env("PROFILE_TOKEN", "")
+
+    def profile_dir(self):
+        directory = self.directory or _env(
+            "PROFILE_DIR", os.path.join(tempfile.gettempdir(), "quality-gate-profiles")
+        )
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def output_path(self, profile_id, suffix):
+        return os.path.join(self.profile_dir(), profile_id + suffix)
+
+    def authorized(self, token):
+        expected = self.expected_token()
+        return bool(expected) and hmac.compare_digest(expected, token or "")
+
+    def start(self, kind, token):
+        if not self.authorized(token):
+            raise ProfilingDenied(403, "Profiling requires a valid X-Profile-Token")
+
+        if kind not in PROFILE_KINDS:
+            raise ProfilingDenied(422, f"'profile' must be one of {', '.join(PROFILE_KINDS)}")
+
+        wait = self.bucket.take()
+        if wait:
+            raise ProfilingDenied(429, "Profiling rate limit exceeded", retry_after=wait)
+
+        if not self.slot.acquire(blocking=False):
+            raise ProfilingDenied(429, "Another request is being profiled", retry_after=1)
+
+        try:
+            return ProfileSession(self, kind)
+        except Exception:
+            self.slot.release()
+            raise
+
+    def release(self):
+        self.slot.release()
+
+    def find(self, profile_id):
+        """
+        Path of a saved profile, or None.
+        """
+        if not PROFILE_ID.match(profile_id or ""):
+            return None
+
+        for suffix in (".pstats", ".folded"):
+            path = self.output_path(profile_id, suffix)
+            if os.path.exists(path):
+                return path
+
+        return None
+
+    def prune(self):
+        keep = int(self.keep if self.keep is not None else _env("PROFILE_KEEP", "20"))
+        directory = self.profile_dir()
+
+        profiles = sorted(
+            (entry for entry in os.scandir(directory)
+             if entry.name.endswith((".pstats", ".folded"))),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True
+        )
+
+        for entry in profiles[keep:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+request_profiler = RequestProfiler()
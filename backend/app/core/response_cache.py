@@ -0,0 +1,157 @@
+import hashlib
+import os
+import threading
+
+from app.core.advisory_cache import TTLCache
+from app.core.analyzer import RULES_VERSION
+from app.core.clone_detector import CLONE_INDEX_VERSION
+from app.core.import_graph import IMPORT_LAYERS
+from app.core.leak_index import leak_index_identity
+from app.core.policy import policy_registry
+from app.core.taint_analyzer import TAINT_RULES_VERSION
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+REVIEW_CACHE_TTL = int(os.getenv("REVIEW_CACHE_TTL", "600"))       # seconds
+REVIEW_CACHE_SIZE = int(os.getenv("REVIEW_CACHE_SIZE", "256"))     # responses (0 = disabled)
+
+# Versions of every rule set a review runs (reported in SARIF / JUnit)
+ANALYZER_VERSION = f"{RULES_VERSION}+taint{TAINT_RULES_VERSION}+clones{CLONE_INDEX_VERSION}"
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def cache_version():
+    """
+    ANALYZER_VERSION plus the run-time rule inputs: the leaked-credential
+    index in use and IMPORT_LAYERS. Any change yields new fingerprints,
+    so stale responses are never served.
+    """
+    return f"{ANALYZER_VERSION}+leaks{leak_index_identity()}+layers{','.join(IMPORT_LAYERS)}"
+
+
+def request_fingerprint(payload, version=None, baseline=None):
+    """
+    Canonical review fingerprint (under cache_version() unless 'version'
+    is given): language, context, advisory mode,
+    policies (configuration version, requested policy and what-ifs),
+    the baseline revision and the code (single-file) or sorted
+    (path, content hash) pairs (project).
+    File order and JSON formatting do not matter.
+    """
+    parts = [
+        version if version is not None else cache_version(),
+        payload.language.lower(),
+        payload.context or "",
+        (payload.advisory_mode or "inline").lower(),
+        policy_registry().version,
+        payload.policy or "",
+        ",".join(payload.what_if or ()),
+        f"{baseline.name}@{baseline.revision}" if baseline is not None else ""
+    ]
+
+    if payload.files:
+        parts.append("files")
+        for path, content_hash in sorted((f.path, _digest(f.code)) for f in payload.files):
+            parts.extend((path, content_hash))
+    else:
+        parts.extend(("code", _digest(payload.code or "")))
+
+    return _digest("\0".join(parts))
+
+
+def etag_for(fingerprint, representation="json"):
+    """
+    One tag per representation: the same review as SARIF or JUnit must
+    not be revalidated against the JSON body.
+    """
+    if representation == "json":
+        return f'"{fingerprint[:32]}"'
+    return f'"{fingerprint[:32]}-{representation}"'
+
+
+def etag_matches(if_none_match, etag):
+    """
+    If-None-Match: list of (weak or strong) tags, or '*'.
+    """
+    if not if_none_match:
+        return False
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+
+    return False
+
+
+# =========================================================
+# RESPONSE CACHE
+# =========================================================
+
+class ResponseCache:
+    """
+    Bounded cache of complete review responses by request fingerprint,
+    each with its issue fingerprints (to restore the stored review).
+    """
+
+    def __init__(self, max_entries=REVIEW_CACHE_SIZE, ttl_seconds=REVIEW_CACHE_TTL):
+        self.cache = TTLCache(max_entries, ttl_seconds)
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    @property
+    def enabled(self):
+        return self.cache.max_entries > 0
+
+    def get(self, fingerprint):
+        """
+        (result, issue fingerprints) or None.
+        """
+        entry = self.cache.get(fingerprint) if self.enabled else None
+
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return entry
+
+    def put(self, fingerprint, result, issue_fingerprints=None):
+        if self.enabled:
+            self.cache.put(fingerprint, (result, issue_fingerprints))
+
+    def record_not_modified(self):
+        with self.lock:
+            self.not_modified += 1
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "analyzer_version": cache_version(),
+                "entries": len(self.cache),
+                "max_entries": self.cache.max_entries,
+                "ttl_seconds": self.cache.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "evictions": self.cache.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+response_cache = ResponseCache()
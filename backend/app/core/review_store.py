@@ -0,0 +1,279 @@
+import base64
+import heapq
+import os
+import time
+import uuid
+from bisect import bisect_left
+from collections import OrderedDict
+
+from app.core.deduplicator import SEVERITY_RANK
+from app.core.line_index import location_of
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+REVIEW_STORE_TTL = int(os.getenv("REVIEW_STORE_TTL", "3600"))       # seconds
+REVIEW_STORE_LIMIT = int(os.getenv("REVIEW_STORE_LIMIT", "200"))     # stored reviews
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Confidence index granularity (0.1 → 10 buckets)
+CONFIDENCE_BUCKETS = 10
+
+PATH_END = chr(0x10FFFF)
+
+
+class InvalidQuery(ValueError):
+    pass
+
+
+def encode_cursor(review_id, position):
+    raw = f"{review_id}:{position}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(review_id, cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        owner, position = base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        position = int(position)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidQuery("Malformed cursor")
+
+    if owner != review_id or position < 0:
+        raise InvalidQuery("Cursor belongs to another review")
+
+    return position
+
+
+def confidence_bucket(confidence):
+    return min(CONFIDENCE_BUCKETS - 1, int((confidence or 0) * CONFIDENCE_BUCKETS))
+
+
+# =========================================================
+# INDEXED ISSUE LIST
+# =========================================================
+
+class IssueIndex:
+    """
+    A review's issues flattened to one entry per (issue group, path),
+    sorted by path, so a path prefix is one contiguous position range.
+
+    Severity, type and confidence-bucket indexes are ascending position
+    lists. A query walks the smallest candidate set (bisected to the
+    path range and the cursor) and checks the remaining filters per
+    entry, so a page costs about page size / selectivity of the other
+    filters — never the size of the review.
+    """
+
+    def __init__(self, issues):
+        entries = []
+
+        for issue in issues:
+            occurrences = issue.get("occurrences") or [
+                dict(location_of(issue), path=issue.get("path"), line=issue.get("line"))
+            ]
+
+            by_path = OrderedDict()
+            for occurrence in occurrences:
+                by_path.setdefault(occurrence["path"] or "", []).append(occurrence)
+
+            for path, occurrences in by_path.items():
+                entries.append(dict(issue, path=path, occurrences=occurrences))
+
+        entries.sort(key=lambda e: (
+            e["path"],
+            -SEVERITY_RANK.get((e.get("severity") or "").upper(), 0),
+            e["occurrences"][0].get("line") or 0
+        ))
+
+        self.entries = entries
+        self.paths = [entry["path"] for entry in entries]
+        self.by_severity = {}
+        self.by_type = {}
+        self.by_confidence = [[] for _ in range(CONFIDENCE_BUCKETS)]
+
+        for position, entry in enumerate(entries):
+            self.by_severity.setdefault((entry.get("severity") or "").upper(), []).append(position)
+            self.by_type.setdefault((entry.get("type") or "").lower(), []).append(position)
+            self.by_confidence[confidence_bucket(entry.get("confidence"))].append(position)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def path_range(self, prefix):
+        if not prefix:
+            return 0, len(self.entries)
+        return bisect_left(self.paths, prefix), bisect_left(self.paths, prefix + PATH_END)
+
+    @staticmethod
+    def _window(lists, start, end):
+        """
+        Merged positions in [start, end) from ascending lists,
+        with an upper-bound size estimate.
+        """
+        slices = []
+        size = 0
+
+        for positions in lists:
+            lo = bisect_left(positions, start)
+            hi = bisect_left(positions, end)
+            if lo < hi:
+                slices.append(positions[i] for i in range(lo, hi))
+                size += hi - lo
+
+        return heapq.merge(*slices), size
+
+    def query(self, severity=None, issue_type=None, path_prefix=None,
+              min_confidence=None, after=0, limit=PAGE_SIZE):
+        """
+        Returns (entries, next_position or None).
+        """
+        start, end = self.path_range(path_prefix)
+        start = max(start, after)
+
+        candidates = [(iter(range(start, end)), max(0, end - start))]
+
+        if severity:
+            candidates.append(self._window(
+                [self.by_severity.get(s, []) for s in severity], start, end
+            ))
+        if issue_type:
+            candidates.append(self._window(
+                [self.by_type.get(t, []) for t in issue_type], start, end
+            ))
+        if min_confidence:
+            candidates.append(self._window(
+                self.by_confidence[confidence_bucket(min_confidence):], start, end
+            ))
+
+        positions, _ = min(candidates, key=lambda candidate: candidate[1])
+
+        page = []
+        for position in positions:
+            entry = self.entries[position]
+
+            if severity and (entry.get("severity") or "").upper() not in severity:
+                continue
+            if issue_type and (entry.get("type") or "").lower() not in issue_type:
+                continue
+            if min_confidence and (entry.get("confidence") or 0) < min_confidence:
+                continue
+
+            if len(page) == limit:
+                return page, position
+
+            page.append(entry)
+
+        return page, None
+
+
+# =========================================================
+# REVIEW STORE
+# =========================================================
+
+class ReviewStore:
+    """
+    In-memory store of completed reviews (bounded, expiring), so clients
+    can page through filtered issues instead of parsing the full result.
+    """
+
+    def __init__(self, limit=REVIEW_STORE_LIMIT, ttl_seconds=REVIEW_STORE_TTL):
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self.reviews = OrderedDict()
+
+    def save(self, result, fingerprints=None):
+        """
+        'fingerprints' (uint64 array) covers every reported issue
+        occurrence, including the ones grouping does not list.
+        """
+        self.expire()
+        return self._store(uuid.uuid4().hex, result, fingerprints)
+
+    def restore(self, result, fingerprints=None):
+        """
+        Keeps a cached response's review_id resolvable: refreshes the
+        stored review, or stores it again under the same id when it has
+        expired or been evicted (the response cache may outlive it).
+        """
+        self.expire()
+        review_id = result["review_id"]
+
+        review = self.reviews.get(review_id)
+        if review is None:
+            return self._store(review_id, result, fingerprints)
+
+        review["created"] = time.time()
+        self.reviews.move_to_end(review_id)
+        return review_id
+
+    def _store(self, review_id, result, fingerprints):
+        summary = {
+            key: value for key, value in result.items()
+            if key not in ("issues", "review_id")
+        }
+
+        self.reviews[review_id] = {
+            "id": review_id,
+            "created": time.time(),
+            "summary": summary,
+            "issues": list(result.get("issues", [])),   # groups, for policy what-ifs
+            "index": IssueIndex(result.get("issues", [])),
+            "fingerprints": fingerprints if fingerprints is not None else ()
+        }
+
+        while len(self.reviews) > self.limit:
+            self.reviews.popitem(last=False)
+
+        return review_id
+
+    def get(self, review_id):
+        self.expire()
+        return self.reviews.get(review_id)
+
+    def issues(self, review_id, severity=None, issue_type=None, path_prefix=None,
+               min_confidence=None, cursor=None, limit=PAGE_SIZE):
+        """
+        One page of filtered issues, or None for an unknown review.
+        'severity' / 'issue_type' are comma-separated lists.
+        """
+        review = self.get(review_id)
+        if review is None:
+            return None
+
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise InvalidQuery(f"'limit' must be between 1 and {MAX_PAGE_SIZE}")
+
+        after = decode_cursor(review_id, cursor) if cursor else 0
+
+        severities = {s.strip().upper() for s in severity.split(",") if s.strip()} if severity else None
+        types = {t.strip().lower() for t in issue_type.split(",") if t.strip()} if issue_type else None
+
+        page, next_position = review["index"].query(
+            severity=severities,
+            issue_type=types,
+            path_prefix=path_prefix,
+            min_confidence=min_confidence,
+            after=after,
+            limit=limit
+        )
+
+        return {
+            "review_id": review_id,
+            "issues": page,
+            "next_cursor": encode_cursor(review_id, next_position) if next_position is not None else None
+        }
+
+    def expire(self):
+        cutoff = time.time() - self.ttl_seconds
+        while self.reviews:
+            oldest = next(iter(self.reviews.values()))
+            if oldest["created"] >= cutoff:
+                break
+            self.reviews.popitem(last=False)
+
+
+review_store = ReviewStore()
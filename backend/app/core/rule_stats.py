@@ -0,0 +1,152 @@
+import heapq
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+SLOWEST_FILES = 5
+
+# Collect on every request (process-wide totals only) instead of opt-in
+RULE_STATS_ALWAYS = os.getenv("RULE_STATS", "0") == "1"
+
+# Set only while a request collects stats; None means "disabled"
+_active = ContextVar("rule_stats", default=None)
+
+
+class RuleStats:
+    """
+    Per-check counters: invocations, matches (by rule_id), cumulative
+    time and the slowest files.
+
+    A "check" is the unit that costs time (an analyzer function or a
+    PythonCodeAnalyzer visitor); one check may report several rule_ids.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checks = {}
+
+    def _row(self, check):
+        row = self.checks.get(check)
+        if row is None:
+            row = self.checks[check] = {
+                "invocations": 0,
+                "time_ns": 0,
+                "rules": Counter(),
+                "slowest": []       # min-heap of (time_ns, path)
+            }
+        return row
+
+    def record(self, check, elapsed_ns, invocations=1, rules=None, path=None):
+        with self.lock:
+            row = self._row(check)
+            row["invocations"] += invocations
+            row["time_ns"] += elapsed_ns
+
+            if rules:
+                row["rules"].update(rules)
+
+            if path is not None:
+                self._keep_slowest(row, (elapsed_ns, path))
+
+    @staticmethod
+    def _keep_slowest(row, entry):
+        if len(row["slowest"]) < SLOWEST_FILES:
+            heapq.heappush(row["slowest"], entry)
+        elif entry > row["slowest"][0]:
+            heapq.heapreplace(row["slowest"], entry)
+
+    def merge(self, other):
+        with other.lock:
+            rows = [
+                (check, row["invocations"], row["time_ns"], Counter(row["rules"]), list(row["slowest"]))
+                for check, row in other.checks.items()
+            ]
+
+        with self.lock:
+            for check, invocations, time_ns, rules, slowest in rows:
+                row = self._row(check)
+                row["invocations"] += invocations
+                row["time_ns"] += time_ns
+                row["rules"].update(rules)
+                for entry in slowest:
+                    self._keep_slowest(row, entry)
+
+    def reset(self):
+        with self.lock:
+            self.checks = {}
+
+    def report(self):
+        """
+        Rows sorted by cumulative time (slowest check first).
+        """
+        with self.lock:
+            rows = []
+
+            for check, row in self.checks.items():
+                invocations = row["invocations"]
+                rows.append({
+                    "check": check,
+                    "invocations": invocations,
+                    "matches": sum(row["rules"].values()),
+                    "rules": dict(sorted(row["rules"].items())),
+                    "time_ms": round(row["time_ns"] / 1e6, 3),
+                    "mean_us": round(row["time_ns"] / invocations / 1e3, 3) if invocations else 0,
+                    "slowest_files": [
+                        {"path": path, "time_ms": round(elapsed_ns / 1e6, 3)}
+                        for elapsed_ns, path in sorted(row["slowest"], reverse=True)
+                    ]
+                })
+
+        rows.sort(key=lambda r: (-r["time_ms"], r["check"]))
+        return rows
+
+
+# Process-wide totals (every collected request is merged in)
+process_rule_stats = RuleStats()
+
+
+def active_rule_stats():
+    return _active.get()
+
+
+@contextmanager
+def collect_rule_stats():
+    """
+    Enables instrumentation for the current context (request).
+    """
+    stats = RuleStats()
+    token = _active.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+        process_rule_stats.merge(stats)
+
+
+def measure(stats, check, path, func, *args, **kwargs):
+    """
+    Calls func; when 'stats' is set, records its time and the rule_ids
+    of the issues it returned.
+    """
+    if stats is None:
+        return func(*args, **kwargs)
+
+    start = time.perf_counter_ns()
+    issues = func(*args, **kwargs)
+    elapsed = time.perf_counter_ns() - start
+
+    stats.record(
+        check, elapsed,
+        rules=Counter(issue.get("rule_id", "unknown") for issue in issues),
+        path=path
+    )
+
+    return issues
@@ -7,6 +7,10 @@ SEVERITY_WEIGHTS = {
 
 
 def calculate_risk(issues):
+    """
+    Works on grouped issues (group_issues): each group is weighted once,
+    like the deduplicated issue it replaces, whatever its 'count'.
+    """
     print("---- DEBUG SCORER START ----")
     print("Total issues received:", len(issues))
 
@@ -0,0 +1,231 @@
+import re
+
+import numpy as np
+
+from app.core.leak_index import leak_index
+from app.core.line_index import LineIndex
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+# Literals outside this range are not entropy-scored (providers still are)
+MIN_SECRET_LENGTH = 16
+MAX_SCORED_LENGTH = 256
+
+# Shannon entropy thresholds (bits per character)
+BASE64_ENTROPY = 4.0      # mixed-case + digits, e.g. API keys
+HEX_ENTROPY = 3.0         # 0-9a-f, max log2(16) = 4
+HEX_MIN_LENGTH = 32
+
+# Class switches per character: random base64 ≈ 0.65, CamelCaseWords ≈ 0.3
+MIN_CLASS_SWITCH_RATE = 0.45
+
+# Provider formats: a match is a secret whatever its entropy
+PROVIDER_PATTERNS = [
+    ("AWS access key ID", re.compile(r"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b")),
+    ("GitHub token", re.compile(r"\bgh[pousr]_[A-Za-z0-9]{36}\b")),
+    ("GitHub fine-grained token", re.compile(r"\bgithub_pat_[A-Za-z0-9_]{82}\b")),
+    ("Slack token", re.compile(r"\bxox[abprs]-[0-9A-Za-z-]{10,}")),
+    ("Stripe secret key", re.compile(r"\b[sr]k_live_[0-9A-Za-z]{24,}\b")),
+    ("Google API key", re.compile(r"\bAIza[0-9A-Za-z_-]{35}")),
+    ("Private key", re.compile(r"-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP )?PRIVATE KEY")),
+    ("JSON Web Token", re.compile(r"\beyJ[A-Za-z0-9_-]{8,}\.eyJ[A-Za-z0-9_-]{8,}\.[A-Za-z0-9_-]{8,}")),
+]
+
+# Literal prefixes of PROVIDER_PATTERNS: one cheap search per literal,
+# the full patterns only run on hits
+PROVIDER_HINT = re.compile(r"AKIA|ASIA|gh[pousr]_|github_pat_|xox|_live_|AIza|-----BEGIN|eyJ")
+
+# Quoted string tokens for languages without an AST here
+STRING_TOKEN = re.compile(r"""(["'`])((?:\\.|(?!\1)[^\\\n])*)\1""")
+
+# Character classes: lower, upper, digit, base64 symbol, other
+LOWER, UPPER, DIGIT, SYMBOL, OTHER = range(5)
+
+CLASS_TABLE = np.full(256, OTHER, dtype=np.int64)
+CLASS_TABLE[ord("a"):ord("z") + 1] = LOWER
+CLASS_TABLE[ord("A"):ord("Z") + 1] = UPPER
+CLASS_TABLE[ord("0"):ord("9") + 1] = DIGIT
+for _symbol in "+/=-_":
+    CLASS_TABLE[ord(_symbol)] = SYMBOL
+
+HEX_TABLE = np.zeros(256, dtype=np.int64)
+for _char in "0123456789abcdefABCDEF":
+    HEX_TABLE[ord(_char)] = 1
+
+
+# =========================================================
+# LITERAL COLLECTION
+# =========================================================
+
+def string_literals(code, lines=None):
+    """
+    (text, location) for every quoted string token long enough to score.
+    Token-based, for languages without an AST in this service.
+    """
+    literals = []
+
+    for match in STRING_TOKEN.finditer(code):
+        text = match.group(2)
+        if len(text) >= MIN_SECRET_LENGTH:
+            if lines is None:
+                lines = LineIndex(code)
+            literals.append((text, lines.span(match.start(), match.end())))
+
+    return literals
+
+
+# =========================================================
+# VECTORIZED SCORING
+# =========================================================
+
+def score_literals(texts):
+    """
+    Per-literal features for a batch, computed with NumPy:
+    length, Shannon entropy (bits/char), character class counts and
+    whether the literal is pure hex. Non-ASCII bytes count as OTHER.
+    """
+    count = len(texts)
+    if count == 0:
+        empty = np.zeros(0)
+        return {
+            "length": empty, "entropy": empty, "classes": np.zeros((0, 5)),
+            "switch_rate": empty, "hex": empty
+        }
+
+    encoded = [text.encode("utf-8", "replace")[:MAX_SCORED_LENGTH] for text in texts]
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=count)
+    codes = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.int64)
+    rows = np.repeat(np.arange(count), lengths)
+
+    # Entropy from (literal, byte) counts c: H = log2(n) - sum(c log2 c) / n
+    pairs, pair_counts = np.unique(rows * 256 + codes, return_counts=True)
+    weighted = np.bincount(pairs >> 8, weights=pair_counts * np.log2(pair_counts), minlength=count)
+    safe_lengths = np.maximum(lengths, 1)
+    entropy = np.log2(safe_lengths) - weighted / safe_lengths
+
+    char_classes = CLASS_TABLE[codes]
+    classes = np.bincount(rows * 5 + char_classes, minlength=count * 5).reshape(count, 5)
+
+    switched = (char_classes[1:] != char_classes[:-1]) & (rows[1:] == rows[:-1])
+    switches = np.bincount(rows[1:], weights=switched, minlength=count)
+
+    hex_chars = np.bincount(rows, weights=HEX_TABLE[codes], minlength=count)
+
+    return {
+        "length": lengths,
+        "entropy": entropy,
+        "classes": classes,
+        "switch_rate": switches / np.maximum(lengths, 1),
+        "hex": hex_chars == lengths
+    }
+
+
+def high_entropy_mask(features):
+    """
+    Random-looking literals: pure hex with enough entropy, or mixed
+    case + digits (base64 alphabet only) with high entropy that switches
+    character class often (CamelCase words do not). Anything with
+    whitespace or other punctuation (prose, URLs, templates) is OTHER.
+    """
+    length = features["length"]
+    entropy = features["entropy"]
+    classes = features["classes"]
+
+    mixed = (
+        (classes[:, LOWER] > 0)
+        & (classes[:, UPPER] > 0)
+        & (classes[:, DIGIT] > 0)
+        & (classes[:, OTHER] == 0)
+        & (features["switch_rate"] >= MIN_CLASS_SWITCH_RATE)
+    )
+
+    return (
+        (length >= MIN_SECRET_LENGTH)
+        & (
+            (features["hex"] & (length >= HEX_MIN_LENGTH) & (entropy >= HEX_ENTROPY))
+            | (mixed & (entropy >= BASE64_ENTROPY))
+        )
+    )
+
+
+def provider_for(text):
+    if not PROVIDER_HINT.search(text):
+        return None
+
+    for provider, pattern in PROVIDER_PATTERNS:
+        if pattern.search(text):
+            return provider
+    return None
+
+
+# =========================================================
+# DETECTION
+# =========================================================
+
+def _located(issue, location):
+    if isinstance(location, dict):
+        issue.update(location)
+    else:
+        issue["line"] = location
+    return issue
+
+
+def detect_secrets(literals):
+    """
+    literals: [(text, location)] → issues; a location is a line number
+    or LineIndex position fields.
+    Known leaked credentials first (LEAKED_CREDENTIALS_INDEX), then
+    provider formats (CRITICAL), then entropy (MEDIUM) over the
+    remaining candidates in one vectorized batch.
+    """
+    issues = []
+    candidates = []
+
+    index = leak_index()
+    leaked = index.contains_many([text for text, _ in literals]) if index else None
+
+    for position, (text, location) in enumerate(literals):
+        if leaked and leaked[position]:
+            issues.append(_located({
+                "rule_id": "secrets.leaked-credential",
+                "severity": "CRITICAL",
+                "type": "Security",
+                "message": "String literal matches a known leaked credential",
+                "impact": "The credential is public and must be treated as compromised",
+                "suggestion": "Revoke and rotate the credential, then remove it from history"
+            }, location))
+            continue
+
+        provider = provider_for(text)
+
+        if provider is not None:
+            issues.append(_located({
+                "rule_id": "secrets.provider-token",
+                "severity": "CRITICAL",
+                "type": "Security",
+                "message": f"Hardcoded {provider} in string literal",
+                "impact": "Live credentials in source code can be used by anyone with read access",
+                "suggestion": "Revoke the credential and load it from a secrets manager"
+            }, location))
+        else:
+            candidates.append((text, location))
+
+    if not candidates:
+        return issues
+
+    mask = high_entropy_mask(score_literals([text for text, _ in candidates]))
+
+    for (text, location), flagged in zip(candidates, mask):
+        if flagged:
+            issues.append(_located({
+                "rule_id": "secrets.high-entropy-string",
+                "severity": "MEDIUM",
+                "type": "Security",
+                "message": "High-entropy string literal looks like a hardcoded secret",
+                "impact": "Credentials may be exposed in source code",
+                "suggestion": "Use environment variables or a secrets manager"
+            }, location))
+
+    return issues
@@ -0,0 +1,297 @@
+import builtins
+from array import array
+
+import numpy as np
+
+from app.core.import_graph import ModuleResolver, module_name, resolve_import
+from app.core.line_index import LOCATION_KEYS
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+PYTHON_BUILTINS = frozenset(dir(builtins))
+
+# Definition kinds
+FUNCTION = 0
+METHOD = 1
+CLASS = 2
+
+# Definition flags (per-file symbols and the table)
+DECORATED = 1   # registered by a decorator (routes, fixtures): never dead
+NESTED = 2      # defined inside a function: only visible in its file
+
+# Ints per stored span: line, column, end line, end column
+SPAN_WIDTH = len(LOCATION_KEYS)
+
+
+def span_locations(spans, positions):
+    """
+    Location fields of the selected spans in a flat span array
+    (gathered column-wise in one NumPy step: plain int lists, no
+    per-row containers for the garbage collector to scan).
+    """
+    rows = np.frombuffer(spans, dtype=np.int32).reshape(-1, SPAN_WIDTH)[positions]
+    return [
+        {"line": line, "column": column, "end_line": end_line, "end_column": end_column}
+        for line, column, end_line, end_column in zip(*rows.T.tolist())
+    ]
+
+
+class Interner:
+    """
+    str ↔ dense int id. Each distinct string is stored once; the table
+    holds ids in typed arrays instead of repeated string lists.
+    """
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, position):
+        return self.values[position]
+
+    def intern(self, value):
+        position = self.ids.get(value)
+        if position is None:
+            position = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return position
+
+    def get(self, value):
+        return self.ids.get(value)
+
+
+class SymbolTable:
+    """
+    Project symbol table keyed by module-qualified names
+    ('app.core.utils' + 'Parser.parse').
+
+    Definitions are parallel int arrays indexed by definition id: path
+    id (one path per module) and interned in-module name. A definition
+    counts as used when something can reach it: a bare reference in the
+    same file, an import of 'module.name' resolved against the project's
+    modules, or an attribute access with that name anywhere (the
+    receiver's type is unknown, so this errs on the side of "used").
+    Undefined calls are checked per file against the names that file
+    binds. Cross-file resolution runs as NumPy set operations.
+    Source spans sit in flat int arrays, SPAN_WIDTH values per entry.
+    """
+
+    def __init__(self):
+        self.paths = Interner()
+        self.names = Interner()         # 'parse', 'Parser.parse'
+        self.targets = Interner()       # absolute import bases: 'app.core.utils'
+
+        self.def_path = array("i")
+        self.def_name = array("i")
+        self.def_short = array("i")
+        self.def_kind = bytearray()
+        self.def_flags = bytearray()
+        self.local_used = bytearray()
+        self.def_span = array("i")
+
+        self.attribute_ids = set()
+        self.binding_target = array("i")
+        self.binding_name = array("i")
+        self.undefined_path = array("i")
+        self.undefined_name = array("i")
+        self.undefined_span = array("i")
+
+        # Import graph input (app/core/import_graph.py)
+        self.modules = {}
+        self.module_imports = {}
+
+        self._used = None
+
+    def __len__(self):
+        return len(self.def_kind)
+
+    # --------------------------------------------------
+    # Build
+    # --------------------------------------------------
+    def add_file(self, path, symbols):
+        """
+        Adds one file's symbols (see project_parser.extract_file_symbols).
+        """
+        self._used = None
+        path_id = self.paths.intern(path)
+        module, is_package = module_name(path)
+
+        if path.endswith(".py"):
+            self.modules[module] = path
+            self.module_imports[module] = [
+                (base, names, span)
+                for base, names, span in (
+                    (resolve_import(module, is_package, entry[0], entry[1]), entry[2], tuple(entry[3:]))
+                    for entry in symbols["module_imports"]
+                )
+                if base is not None
+            ]
+
+        names = self.names
+        local = {}
+
+        for qualname, kind, flags, *span in symbols["definitions"]:
+            name_id = names.intern(qualname)
+            short_id = names.intern(qualname.rsplit(".", 1)[-1]) if "." in qualname else name_id
+
+            if kind != METHOD:
+                local.setdefault(short_id, []).append(len(self.def_kind))
+
+            self.def_path.append(path_id)
+            self.def_name.append(name_id)
+            self.def_short.append(short_id)
+            self.def_kind.append(kind)
+            self.def_flags.append(flags)
+            self.local_used.append(0)
+            self.def_span.extend(span)
+
+        # Bare names resolve to this file's own functions and classes
+        if local:
+            for name in symbols["references"]:
+                for position in local.get(names.get(name), ()):
+                    self.local_used[position] = 1
+
+        self.attribute_ids.update(map(names.intern, symbols["attributes"]))
+
+        for level, target, name in symbols["import_bindings"]:
+            base = resolve_import(module, is_package, level, target)
+            if base is not None:
+                self.binding_target.append(self.targets.intern(base))
+                self.binding_name.append(names.intern(name))
+
+        if not symbols["star_import"]:
+            bound = set(symbols["bound"])
+            for name, *span in symbols["calls"]:
+                if name and name not in bound and name not in PYTHON_BUILTINS and not name[0].isupper():
+                    self.undefined_path.append(path_id)
+                    self.undefined_name.append(names.intern(name))
+                    self.undefined_span.extend(span)
+
+    def columns(self):
+        """
+        NumPy views of the definition arrays (no copies).
+        """
+        return (
+            np.frombuffer(self.def_path, dtype=np.int32),
+            np.frombuffer(self.def_name, dtype=np.int32),
+            np.frombuffer(self.def_short, dtype=np.int32),
+            np.frombuffer(self.def_kind, dtype=np.uint8),
+            np.frombuffer(self.def_flags, dtype=np.uint8)
+        )
+
+    # --------------------------------------------------
+    # Cross-file checks
+    # --------------------------------------------------
+    def used(self):
+        """
+        bool array over definition ids; resolves imports once per table.
+        """
+        if self._used is not None:
+            return self._used
+
+        paths, names, shorts, _, flags = self.columns()
+        visible = (flags & NESTED) == 0
+        used = np.frombuffer(self.local_used, dtype=bool).copy()
+
+        # Import target → path id of the module it names (-1: external)
+        resolver = ModuleResolver(self.modules)
+        target_paths = np.full(len(self.targets) + 1, -1, dtype=np.int64)
+        for target_id, base in enumerate(self.targets.values):
+            module = resolver.lookup(base)
+            if module is not None:
+                target_paths[target_id] = self.paths.get(resolver.paths[module])
+
+        # 'from module import name' reaches the definition (module path, name)
+        binding_paths = target_paths[np.frombuffer(self.binding_target, dtype=np.int32)]
+        binding_keys = (binding_paths << 32) | np.frombuffer(self.binding_name, dtype=np.int32)
+        definition_keys = (paths.astype(np.int64) << 32) | names
+        used |= visible & np.isin(definition_keys, binding_keys[binding_paths >= 0])
+
+        # obj.name / module.name
+        attributes = np.fromiter(self.attribute_ids, dtype=np.int32, count=len(self.attribute_ids))
+        used |= visible & np.isin(shorts, attributes)
+
+        self._used = used
+        return used
+
+    def unused_definitions(self):
+        """
+        [(qualified name, path, location)] of functions and methods nothing reaches.
+        Private names and decorated functions are skipped.
+        """
+        _, _, _, kinds, flags = self.columns()
+        candidates = (kinds != CLASS) & ((flags & DECORATED) == 0) & ~self.used()
+        modules = {}
+        dead = []
+        positions = [
+            position for position in np.flatnonzero(candidates).tolist()
+            if not self.names[self.def_short[position]].startswith("_")
+        ]
+
+        for position, location in zip(positions, span_locations(self.def_span, positions)):
+            path = self.paths[self.def_path[position]]
+            if path not in modules:
+                modules[path] = module_name(path)[0]
+
+            module = modules[path]
+            name = self.names[self.def_name[position]]
+            dead.append((f"{module}.{name}" if module else name, path, location))
+
+        return dead
+
+    def duplicate_functions(self):
+        """
+        {short name: [(path, location)]} for module-level functions
+        defined in more than one file, with the first definition per file.
+        Repeats within a file (@overload stubs, try/except fallbacks),
+        methods and nested helpers are not compared.
+        """
+        paths, _, shorts, kinds, flags = self.columns()
+
+        top_level = np.flatnonzero((kinds == FUNCTION) & ((flags & NESTED) == 0))
+        keys = (paths[top_level].astype(np.int64) << 32) | shorts[top_level]
+        _, first = np.unique(keys, return_index=True)
+        per_file = top_level[np.sort(first)]
+
+        values, counts = np.unique(shorts[per_file], return_counts=True)
+        repeated = per_file[np.isin(shorts[per_file], values[counts > 1])]
+
+        duplicates = {}
+        for position, location in zip(repeated.tolist(), span_locations(self.def_span, repeated)):
+            duplicates.setdefault(self.names[self.def_short[position]], []).append(
+                (self.paths[self.def_path[position]], location)
+            )
+
+        return duplicates
+
+    def undefined_calls(self):
+        """
+        [(name, path, location of the first call)] for calls to names the
+        calling file never binds.
+        """
+        _, _, shorts, kinds, _ = self.columns()
+        called = np.frombuffer(self.undefined_name, dtype=np.int32)
+        positions = np.flatnonzero(~np.isin(called, shorts[kinds == CLASS]))
+
+        return [
+            (
+                self.names[self.undefined_name[position]],
+                self.paths[self.undefined_path[position]],
+                location
+            )
+            for position, location in zip(positions.tolist(), span_locations(self.undefined_span, positions))
+        ]
+
+    def function_names(self):
+        """
+        Short names of every function and method (call-graph resolution).
+        """
+        _, _, shorts, kinds, _ = self.columns()
+        return {self.names[short_id] for short_id in np.unique(shorts[kinds != CLASS]).tolist()}
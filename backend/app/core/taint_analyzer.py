@@ -0,0 +1,756 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict, deque
+
+from app.core.line_index import LineIndex, node_span
+
+# =========================================================
+# CONFIG
+# =========================================================
+
+TAINT_RULES_VERSION = "3"
+
+# Label used for data coming from request input / environment
+SOURCE = -1
+
+SOURCE_CALLS = {
+    "input",
+    "getenv",
+    "os.getenv",
+    "os.environ.get",
+    "sys.stdin.read",
+    "sys.stdin.readline",
+}
+
+SOURCE_ATTRIBUTES = {
+    "os.environ",
+    "sys.argv",
+    "request.args",
+    "request.form",
+    "request.values",
+    "request.json",
+    "request.data",
+    "request.body",
+    "request.cookies",
+    "request.headers",
+    "request.files",
+    "request.query_params",
+    "request.path_params",
+    "request.get_json",
+}
+
+SINK_CALLS = {
+    "eval",
+    "exec",
+    "os.system",
+    "os.popen",
+    "subprocess.call",
+    "subprocess.run",
+    "subprocess.Popen",
+    "subprocess.check_call",
+    "subprocess.check_output",
+}
+
+# Summaries are cached by function-body hash (bounded LRU)
+SUMMARY_CACHE_SIZE = 50000
+
+_summary_cache = OrderedDict()
+_file_cache = OrderedDict()
+
+# Reviews analyze in worker threads; LRU reordering is not atomic
+_cache_lock = threading.Lock()
+
+
+def dotted_name(node):
+    """
+    Returns 'a.b.c' for Name/Attribute chains, None otherwise.
+    """
+    parts = []
+
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+
+    return None
+
+
+def is_source_name(name):
+    if not name:
+        return False
+
+    for source in SOURCE_ATTRIBUTES:
+        if name == source or name.startswith(source + "."):
+            return True
+
+    return False
+
+
+def is_sink_name(name):
+    if not name:
+        return False
+
+    # Mirrors the analyzer: any '.system()' attribute call is a sink
+    return name in SINK_CALLS or name.endswith(".system")
+
+
+# =========================================================
+# LOCAL (INTRAPROCEDURAL) SUMMARY
+# =========================================================
+
+class FunctionSummarizer:
+    """
+    Flow-insensitive taint summary of one function body.
+
+    Labels:
+    - int      → parameter index
+    - SOURCE   → request input / environment data
+    - "c<k>"   → return value of the k-th call site (resolved later)
+    """
+
+    def __init__(self, params, lines=None):
+        self.params = params
+        self.lines = lines
+        self.env = {name: {index} for index, name in enumerate(params)}
+        self.sinks = {}
+        self.calls = {}
+        self.returns = set()
+
+    # -----------------------------------------------------
+    # Statements
+    # -----------------------------------------------------
+    def run(self, body):
+        # Re-run until variable labels are stable (loops, reassignments)
+        for _ in range(3):
+            before = {name: len(labels) for name, labels in self.env.items()}
+            self.visit_block(body)
+            after = {name: len(labels) for name, labels in self.env.items()}
+            if before == after:
+                break
+
+        return self
+
+    def visit_block(self, statements):
+        for statement in statements:
+            self.visit_statement(statement)
+
+    def visit_statement(self, node):
+
+        # Nested definitions get their own summary
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            return
+
+        if isinstance(node, ast.Assign):
+            labels = self.labels(node.value)
+            for target in node.targets:
+                self.assign(target, labels)
+
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            if node.value is not None:
+                labels = self.labels(node.value)
+                if isinstance(node, ast.AugAssign):
+                    labels = labels | self.labels(node.target)
+                self.assign(node.target, labels)
+
+        elif isinstance(node, ast.Return):
+            if node.value is not None:
+                self.returns |= self.labels(node.value)
+
+        elif isinstance(node, (ast.For, ast.AsyncFor)):
+            self.assign(node.target, self.labels(node.iter))
+            self.visit_block(node.body)
+            self.visit_block(node.orelse)
+
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            for item in node.items:
+                labels = self.labels(item.context_expr)
+                if item.optional_vars is not None:
+                    self.assign(item.optional_vars, labels)
+            self.visit_block(node.body)
+
+        elif isinstance(node, (ast.If, ast.While)):
+            self.labels(node.test)
+            self.visit_block(node.body)
+            self.visit_block(node.orelse)
+
+        elif isinstance(node, ast.Try) or type(node).__name__ == "TryStar":
+            self.visit_block(node.body)
+            for handler in node.handlers:
+                self.visit_block(handler.body)
+            self.visit_block(node.orelse)
+            self.visit_block(node.finalbody)
+
+        elif type(node).__name__ == "Match":
+            # Capture names ('case {"cmd": cmd}', 'case [*rest]') carry the subject
+            labels = self.labels(node.subject)
+            for case in node.cases:
+                for pattern in ast.walk(case.pattern):
+                    name = getattr(pattern, "name", None) or getattr(pattern, "rest", None)
+                    if name:
+                        self.env.setdefault(name, set()).update(labels)
+                if case.guard is not None:
+                    self.labels(case.guard)
+                self.visit_block(case.body)
+
+        elif isinstance(node, ast.Expr):
+            self.labels(node.value)
+
+        else:
+            # Any other statement: still evaluate nested expressions
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.expr):
+                    self.labels(child)
+
+    def assign(self, target, labels):
+        if isinstance(target, ast.Name):
+            self.env.setdefault(target.id, set()).update(labels)
+
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self.assign(element, labels)
+
+        elif isinstance(target, ast.Starred):
+            self.assign(target.value, labels)
+
+        else:
+            # self.x = ..., obj[k] = ...
+            name = dotted_name(target)
+            if name:
+                self.env.setdefault(name, set()).update(labels)
+
+    # -----------------------------------------------------
+    # Expressions
+    # -----------------------------------------------------
+    def labels(self, node):
+
+        if isinstance(node, ast.Name):
+            return set(self.env.get(node.id, ()))
+
+        if isinstance(node, ast.Constant):
+            return set()
+
+        if isinstance(node, (ast.Attribute, ast.Subscript)):
+            name = dotted_name(node if isinstance(node, ast.Attribute) else node.value)
+
+            if is_source_name(name):
+                return {SOURCE}
+
+            if name and name in self.env:
+                return set(self.env[name])
+
+            return self.labels(node.value)
+
+        if isinstance(node, ast.Call):
+            return self.call_labels(node)
+
+        if isinstance(node, (ast.Lambda, ast.Compare)):
+            return set()
+
+        result = set()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                result |= self.labels(child)
+            elif isinstance(child, ast.comprehension):
+                self.assign(child.target, self.labels(child.iter))
+        return result
+
+    def call_labels(self, node):
+        name = dotted_name(node.func)
+
+        args = [self.labels(arg) for arg in node.args]
+        kwargs = {
+            keyword.arg: self.labels(keyword.value)
+            for keyword in node.keywords
+        }
+
+        receiver = set()
+        if isinstance(node.func, ast.Attribute):
+            receiver = self.labels(node.func.value)
+
+        if name in SOURCE_CALLS or is_source_name(name):
+            return {SOURCE}
+
+        everything = set(receiver)
+        for labels in args:
+            everything |= labels
+        for labels in kwargs.values():
+            everything |= labels
+
+        if is_sink_name(name):
+            sink = self.sinks.setdefault(id(node), {
+                "sink": name,
+                "span": node_span(node, self.lines),
+                "labels": set()
+            })
+            sink["labels"] |= everything
+            return set()
+
+        if name is None:
+            return everything
+
+        site = self.calls.get(id(node))
+        if site is None:
+            site = {
+                "id": "c%d" % len(self.calls),
+                "callee": name.rsplit(".", 1)[-1],
+                "method": isinstance(node.func, ast.Attribute),
+                "span": node_span(node, self.lines),
+                "args": [set() for _ in args],
+                "kwargs": defaultdict(set),
+                "receiver": set(),
+                "all": set()
+            }
+            self.calls[id(node)] = site
+
+        for index, labels in enumerate(args):
+            site["args"][index] |= labels
+        for key, labels in kwargs.items():
+            if key:
+                site["kwargs"][key] |= labels
+        site["receiver"] |= receiver
+        site["all"] |= everything
+
+        return {site["id"]}
+
+    # -----------------------------------------------------
+    # Export (lines are stored relative to the def line)
+    # -----------------------------------------------------
+    @staticmethod
+    def relative(span, first_line):
+        """
+        (line offset, column, end line offset, end column)
+        """
+        return (
+            span["line"] - first_line, span["column"],
+            span["end_line"] - first_line, span["end_column"]
+        )
+
+    def summary(self, first_line):
+        return {
+            "params": list(self.params),
+            "returns": self.returns,
+            "sinks": [
+                {
+                    "sink": sink["sink"],
+                    "offset": self.relative(sink["span"], first_line),
+                    "labels": sink["labels"]
+                }
+                for sink in self.sinks.values()
+            ],
+            "calls": [
+                {
+                    "callee": site["callee"],
+                    "method": site["method"],
+                    "offset": self.relative(site["span"], first_line),
+                    "args": site["args"],
+                    "kwargs": dict(site["kwargs"]),
+                    "receiver": site["receiver"],
+                    "all": site["all"]
+                }
+                for site in self.calls.values()
+            ]
+        }
+
+
+def _cache_get(cache, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache, key, value):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > SUMMARY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _hash(text):
+    return hashlib.sha256(
+        (TAINT_RULES_VERSION + "\0" + text).encode("utf-8", "surrogatepass")
+    ).hexdigest()
+
+
+def summarize_function(node, lines):
+    """
+    Local summary for one function node, cached by body hash.
+    """
+    body_text = lines.segment(node.lineno, node.end_lineno)
+    key = _hash(body_text)
+
+    cached = _cache_get(_summary_cache, key)
+    if cached is not None:
+        return cached
+
+    args = node.args
+    params = [a.arg for a in args.posonlyargs + args.args]
+    if args.vararg:
+        params.append(args.vararg.arg)
+    params.extend(a.arg for a in args.kwonlyargs)
+    if args.kwarg:
+        params.append(args.kwarg.arg)
+
+    summary = FunctionSummarizer(params, lines).run(node.body).summary(node.lineno)
+    _cache_put(_summary_cache, key, summary)
+
+    return summary
+
+
+def summarize_file(path, code, tree=None, lines=None):
+    """
+    Returns [(qualified_name, first_line, summary)] for one file.
+
+    Unchanged files are served from the cache without re-parsing.
+    """
+    file_key = _hash(code)
+
+    cached = _cache_get(_file_cache, file_key)
+    if cached is not None:
+        return cached
+
+    try:
+        if tree is None:
+            tree = ast.parse(code)
+    except SyntaxError:
+        return []
+
+    if lines is None:
+        lines = LineIndex(code)
+    functions = []
+
+    def walk(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = prefix + child.name
+                functions.append(
+                    (qualname, child.lineno, summarize_function(child, lines))
+                )
+                walk(child, qualname + ".")
+            elif isinstance(child, ast.ClassDef):
+                walk(child, prefix + child.name + ".")
+
+    walk(tree, "")
+
+    # Module-level statements act as one pseudo-function
+    module_summary = FunctionSummarizer([], lines).run(tree.body).summary(1)
+    functions.append(("<module>", 1, module_summary))
+
+    _cache_put(_file_cache, file_key, functions)
+
+    return functions
+
+
+# =========================================================
+# INTERPROCEDURAL PROPAGATION
+# =========================================================
+
+def _param_index(callee_params, site, position=None, keyword=None):
+    """
+    Maps a call-site argument onto the callee's parameter index.
+    """
+    shift = 0
+    if site["method"] and callee_params and callee_params[0] in ("self", "cls"):
+        shift = 1
+
+    if keyword is not None:
+        if keyword in callee_params:
+            return callee_params.index(keyword)
+        return None
+
+    index = position + shift
+    return index if index < len(callee_params) else None
+
+
+def _argument_labels(site, callee_params, param):
+    """
+    Labels the call site passes into the callee's parameter 'param'.
+    """
+    labels = set()
+
+    if site["method"] and callee_params and callee_params[0] in ("self", "cls") and param == 0:
+        return set(site["receiver"])
+
+    for position, arg_labels in enumerate(site["args"]):
+        if _param_index(callee_params, site, position=position) == param:
+            labels |= arg_labels
+
+    if param < len(callee_params):
+        labels |= site["kwargs"].get(callee_params[param], set())
+
+    return labels
+
+
+class TaintPropagator:
+
+    def __init__(self, functions, definitions):
+        # functions: key → {"path", "name", "line", "summary"}
+        self.functions = functions
+        self.effective = {
+            key: {"returns": set(), "param_sinks": {}}
+            for key in functions
+        }
+        self.findings = {}
+
+        by_name = defaultdict(list)
+        for key, info in functions.items():
+            by_name[info["name"].rsplit(".", 1)[-1]].append(key)
+
+        # Resolve call sites through the project symbol table
+        self.targets = {}
+        self.callers = defaultdict(set)
+
+        for key, info in functions.items():
+            for index, site in enumerate(info["summary"]["calls"]):
+                callee = site["callee"]
+                candidates = by_name.get(callee, [])
+
+                if callee not in definitions:
+                    candidates = []
+
+                # Prefer a definition in the same file
+                local = [c for c in candidates if functions[c]["path"] == info["path"]]
+                resolved = local or candidates
+
+                self.targets[(key, index)] = resolved
+                for target in resolved:
+                    self.callers[target].add(key)
+
+    def resolve(self, key, labels, memo, active):
+        info = self.functions[key]
+        calls = info["summary"]["calls"]
+        resolved = set()
+
+        for label in labels:
+            if isinstance(label, int):
+                resolved.add(label)
+                continue
+
+            # Call-site return value
+            index = int(label[1:])
+
+            if index in memo:
+                resolved |= memo[index]
+                continue
+
+            if index in active:
+                continue
+
+            active.add(index)
+            site = calls[index]
+            targets = self.targets.get((key, index), [])
+            value = set()
+
+            if targets:
+                for target in targets:
+                    target_params = self.functions[target]["summary"]["params"]
+                    for returned in self.effective[target]["returns"]:
+                        if returned == SOURCE:
+                            value.add(SOURCE)
+                        else:
+                            value |= self.resolve(
+                                key,
+                                _argument_labels(site, target_params, returned),
+                                memo,
+                                active
+                            )
+            else:
+                # External call: assume it propagates its inputs
+                value = self.resolve(key, site["all"], memo, active)
+
+            active.discard(index)
+            memo[index] = value
+            resolved |= value
+
+        return resolved
+
+    def evaluate(self, key):
+        info = self.functions[key]
+        summary = info["summary"]
+        memo = {}
+        active = set()
+
+        returns = self.resolve(key, summary["returns"], memo, active)
+        param_sinks = defaultdict(set)
+        findings = set()
+
+        for sink in summary["sinks"]:
+            for label in self.resolve(key, sink["labels"], memo, active):
+                if label == SOURCE:
+                    findings.add((sink["sink"], sink["offset"], None))
+                else:
+                    param_sinks[label].add(sink["sink"])
+
+        for index, site in enumerate(summary["calls"]):
+            for target in self.targets.get((key, index), []):
+                target_params = self.functions[target]["summary"]["params"]
+
+                for param, sinks in self.effective[target]["param_sinks"].items():
+                    passed = _argument_labels(site, target_params, param)
+
+                    for label in self.resolve(key, passed, memo, active):
+                        if label == SOURCE:
+                            for sink_name in sinks:
+                                findings.add(
+                                    (sink_name, site["offset"], self.functions[target]["name"])
+                                )
+                        else:
+                            param_sinks[label] |= sinks
+
+        self.findings[key] = findings
+
+        previous = self.effective[key]
+        changed = (
+            returns != previous["returns"]
+            or dict(param_sinks) != previous["param_sinks"]
+        )
+
+        self.effective[key] = {
+            "returns": returns,
+            "param_sinks": dict(param_sinks)
+        }
+
+        return changed
+
+    def callee_first_order(self):
+        """
+        Iterative DFS post-order, so callees are summarized before callers.
+        """
+        callees = defaultdict(list)
+        for (key, _), targets in self.targets.items():
+            callees[key].extend(targets)
+
+        order = []
+        visited = set()
+
+        for root in self.functions:
+            if root in visited:
+                continue
+
+            visited.add(root)
+            stack = [(root, iter(callees.get(root, ())))]
+
+            while stack:
+                node, children = stack[-1]
+                advanced = False
+
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(callees.get(child, ()))))
+                        advanced = True
+                        break
+
+                if not advanced:
+                    stack.pop()
+                    order.append(node)
+
+        return order
+
+    def run(self):
+        """
+        Worklist fixpoint: a function is re-evaluated only when one of
+        its callees' summaries grows, so work is ~linear in call edges.
+        """
+        order = self.callee_first_order()
+        queue = deque(order)
+        queued = set(order)
+
+        while queue:
+            key = queue.popleft()
+            queued.discard(key)
+
+            if self.evaluate(key):
+                for caller in self.callers.get(key, ()):
+                    if caller not in queued:
+                        queued.add(caller)
+                        queue.append(caller)
+
+        return self.findings
+
+
+# =========================================================
+# MAIN ENTRY
+# =========================================================
+
+def add_taint_summaries(functions, path, code, tree=None, lines=None):
+    """
+    Adds one file's function summaries to 'functions'.
+    """
+    add_file_summaries(functions, path, summarize_file(path, code, tree, lines))
+
+
+def add_file_summaries(functions, path, summaries):
+    """
+    Adds precomputed summarize_file() output (e.g. from a worker).
+    """
+    for qualname, line, summary in summaries:
+        functions[(path, qualname)] = {
+            "path": path,
+            "name": qualname,
+            "line": line,
+            "summary": summary
+        }
+
+
+def find_taint_issues(functions, project_data):
+    """
+    Propagates collected summaries and reports source → sink flows.
+    """
+
+    if not functions:
+        return []
+
+    definitions = project_data.function_names()
+    findings = TaintPropagator(functions, definitions).run()
+
+    issues = []
+
+    for key, function_findings in findings.items():
+        info = functions[key]
+
+        for sink_name, (line, column, end_line, end_column), via in sorted(function_findings, key=str):
+            if via:
+                message = (
+                    f"Untrusted input reaches '{sink_name}()' via "
+                    f"'{via}' in '{info['name']}'"
+                )
+            else:
+                message = f"Untrusted input reaches '{sink_name}()' in '{info['name']}'"
+
+            issues.append({
+                "rule_id": "python.tainted-flow",
+                "severity": "CRITICAL",
+                "type": "Security",
+                "message": message,
+                "impact": "Request or environment data can control executed code or commands",
+                "suggestion": "Validate input and avoid passing it to dynamic execution APIs",
+                "path": info["path"],
+                "line": info["line"] + line,
+                "column": column,
+                "end_line": info["line"] + end_line,
+                "end_column": end_column
+            })
+
+    return issues
+
+
+def analyze_taint(files, project_data):
+    """
+    Input: list of ProjectFile + SymbolTable from parse_project_files()
+    Output: list of taint issues (source → sink across functions/files)
+    """
+
+    functions = {}
+
+    for file in files:
+        if file.path.endswith(".py"):
+            add_taint_summaries(functions, file.path, file.code)
+
+    return find_taint_issues(functions, project_data)
@@ -4,10 +4,14 @@ from dotenv import load_dotenv  # 🔥 NEW
 import os
 
 from app.api.review import router as review_router
+from app.core.policy import policy_registry
 
 # 🔥 Load environment variables from .env
 load_dotenv()
 
+# Quality-gate policies are validated once, at startup (PolicyError)
+policy_registry()
+
 app = FastAPI(
     title="AI Code Quality Gate",
     version="1.0.0"
@@ -25,3 +25,24 @@ class ReviewRequest(BaseModel):
 
     # 🔹 Extra metadata (unchanged)
     metadata: Optional[Dict] = None
+
+    # 🔹 Advisory delivery: "inline" (default) or "deferred"
+    advisory_mode: Optional[str] = None
+    callback_url: Optional[str] = None
+
+    # 🔹 Quality-gate policy (default: configured default) and extra
+    # policies to report alongside it ("what_if": ["strict"] or ["*"])
+    policy: Optional[str] = None
+    what_if: Optional[List[str]] = None
+
+    # 🔹 Stored baseline (PUT /baselines/{name}) whose issues are not reported
+    baseline: Optional[str] = None
+
+
+# =========================================
+# Baseline update: a stored review's issues or explicit fingerprints
+# =========================================
+class BaselineUpdate(BaseModel):
+    review_id: Optional[str] = None
+    fingerprints: Optional[List[str]] = None
+    merge: bool = False
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.api import review as review_module
+from app.core.admission import AdmissionController, AdmissionRejected
+from app.main import app
+
+
+def test_sjf_releases_smallest_waiting_job_and_sheds_when_full():
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=2, policy="sjf",
+                                         queue_timeout=5, aging=60)
+        order = []
+
+        async def job(name, cost):
+            async with controller.admit(cost, "ci"):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        first = asyncio.create_task(job("running", 10))
+        await asyncio.sleep(0)
+
+        large = asyncio.create_task(job("large", 5_000_000))
+        small = asyncio.create_task(job("small", 2_000))
+        await asyncio.sleep(0)
+
+        assert controller.stats()["queue_depth"] == 2
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire(100, "ci")
+        assert rejected.value.retry_after >= 1
+
+        await asyncio.gather(first, large, small)
+        return order, controller.stats()
+
+    order, stats = asyncio.run(scenario())
+
+    assert order == ["running", "small", "large"]
+    assert stats["admitted"] == 3
+    assert stats["rejected"] == 1
+    assert stats["running"] == 0
+
+
+def test_wfq_interleaves_clients():
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=10, policy="wfq")
+        order = []
+
+        async def job(client):
+            async with controller.admit(100, client):
+                order.append(client)
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(job("busy")) for _ in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(job("other")))
+
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(scenario())
+
+    # The other client does not wait behind the whole burst
+    assert order.index("other") <= 2
+
+
+def test_wfq_charges_only_work_that_ran():
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1, policy="wfq",
+                                         queue_timeout=0.01)
+        await controller.acquire(100, "running")
+
+        # Queued then timed out, and rejected: neither is charged
+        waiting = asyncio.create_task(controller.acquire(100, "impatient"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire(100, "rejected")
+        with pytest.raises(AdmissionRejected):
+            await waiting
+
+        charged = dict(controller.client_finish)
+        controller.release()
+
+        # Served clients are forgotten when the server goes idle ...
+        for index in range(50):
+            await controller.acquire(100, f"client-{index}")
+            controller.release()
+        idle = dict(controller.client_finish)
+
+        # ... and, while busy, once virtual time reaches their finish
+        controller.max_queue = 2
+        await controller.acquire(100, "repeat")
+        queued = [
+            asyncio.create_task(controller.acquire(100, client))
+            for client in ("repeat", "once")
+        ]
+        await asyncio.sleep(0)
+        controller.release()                 # → "once" (earlier finish tag)
+        controller.release()                 # → "repeat", virtual time 100
+        await asyncio.gather(*queued)
+
+        return charged, idle, dict(controller.client_finish)
+
+    charged, idle, busy = asyncio.run(scenario())
+
+    assert charged == {"running": 100}
+    assert idle == {}
+    assert busy == {"repeat": 200}
+
+
+def test_admitted_reviews_analyze_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def slow_analysis(code, language, metrics=None):
+        threads.append(threading.get_ident())
+        time.sleep(0.3)
+        return []
+
+    monkeypatch.setattr(review_module, "analyze_code", slow_analysis)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(
+                client.post("/api/v1/review", json={"language": "python", "code": f"x = {index}\n"})
+                for index in range(2)
+            ))
+            return responses, time.perf_counter() - started
+
+    responses, elapsed = asyncio.run(scenario())
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert threading.get_ident() not in threads
+    # Both analyses ran at once, not one after the other
+    assert elapsed < 0.55
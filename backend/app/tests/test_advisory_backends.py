@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from app.core.advisory_backends import (
+    AdvisoryBackend,
+    AdvisoryBackendError,
+    ReplayBackend,
+    get_advisory_backend,
+    parse_latency,
+    prompt_hash,
+)
+from app.core.groq_advisory import generate_groq_advisory
+
+
+def test_replay_serves_exact_recording_first(tmp_path):
+    recordings = tmp_path / "advisories.jsonl"
+    recordings.write_text(
+        json.dumps({"prompt_hash": prompt_hash("p1"), "mode": "single", "response": "exact"}) + "\n"
+        + json.dumps({"mode": "single", "response": "fallback"}) + "\n"
+    )
+
+    backend = ReplayBackend(path=str(recordings))
+
+    assert backend.complete("p1", "single") == "exact"
+    assert backend.complete("other", "single") in ("exact", "fallback")
+    assert backend.model.startswith("replay:")
+
+
+def test_replay_error_rate_and_latency_spec():
+    backend = ReplayBackend(error_rate=1.0)
+
+    with pytest.raises(AdvisoryBackendError):
+        backend.complete("p", "single")
+
+    assert parse_latency("lognormal:-1,0.5") == ("lognormal", [-1.0, 0.5])
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1")
+
+
+def test_review_advisory_uses_replay_backend(monkeypatch):
+    monkeypatch.setenv("ADVISORY_BACKEND", "replay")
+    monkeypatch.setenv("ADVISORY_REPLAY_LATENCY", "fixed:0")
+
+    assert get_advisory_backend().name == "replay"
+
+    result = generate_groq_advisory(mode="single", code="x = 1", language="python")
+
+    assert result["advisory"].startswith("Replay advisory")
+    assert result["risk_modifier"] == 3
+
+
+def test_backend_without_complete_fails_at_construction():
+    class Incomplete(AdvisoryBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from app.core.advisory_cache import AdvisoryCache, advisory_fingerprint
+from app.models.schemas import ProjectFile
+
+
+def test_fingerprint_ignores_comments_and_formatting():
+    first = advisory_fingerprint("single", "python", "m", code="x = 1  # note\n\n\ny=2\n")
+    second = advisory_fingerprint("single", "python", "m", code="x=1\ny = 2")
+    other_model = advisory_fingerprint("single", "python", "other", code="x=1\ny = 2")
+
+    assert first == second
+    assert first != other_model
+
+
+def test_project_fingerprint_covers_file_contents():
+    summary = {"file_count": 1, "issues_detected": 0, "critical_issues": [], "files": ["a.py"]}
+
+    def key(code):
+        return advisory_fingerprint(
+            "project", "python", "m",
+            project_summary=summary, files=[ProjectFile(path="a.py", code=code)]
+        )
+
+    assert key("x = 1\n") == key("x = 1\n")
+    assert key("x = 1\n") != key("x = 2\n")
+
+
+def test_concurrent_requests_share_one_upstream_call():
+    cache = AdvisoryCache(max_entries=4, ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"advisory": "ok"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"advisory": "ok"}] * 5
+
+    cache.get_or_compute("k", compute)
+    stats = cache.stats()
+
+    assert stats["misses"] == 1
+    assert stats["hits"] + stats["coalesced"] == 5
+    assert stats["saved_latency_seconds"] > 0
+
+
+def test_failures_are_not_cached():
+    cache = AdvisoryCache(max_entries=4, ttl_seconds=60)
+
+    def fail():
+        raise ValueError("upstream down")
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute("k", fail)
+        except ValueError:
+            pass
+
+    assert cache.stats()["errors"] == 2
+    assert cache.stats()["entries"] == 0
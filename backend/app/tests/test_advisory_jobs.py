@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import httpx
+import requests
+
+from app.api import review as review_module
+from app.core.advisory_jobs import advisory_jobs, is_local_callback
+from app.main import app
+
+
+def use_replay_advisory(monkeypatch):
+    monkeypatch.setenv("ADVISORY_BACKEND", "replay")
+    monkeypatch.setenv("ADVISORY_REPLAY_LATENCY", "fixed:0.05")
+
+
+async def wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met in time")
+
+
+def deferred_review(code, **extra):
+    return dict({"language": "python", "code": code, "advisory_mode": "deferred"}, **extra)
+
+
+def run(scenario):
+    async def with_client():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+    return asyncio.run(with_client())
+
+
+def test_deferred_advisory_completes_without_changing_the_decision(monkeypatch):
+    use_replay_advisory(monkeypatch)
+
+    async def scenario(client):
+        review = (await client.post("/api/v1/review", json=deferred_review("import os\nos.system(a)\n"))).json()
+        handle = review["ai_section"]
+
+        pending = (await client.get(handle["poll_url"])).json()
+        await wait_for(lambda: advisory_jobs.get(handle["advisory_id"])["status"] == "done")
+        done = (await client.get(handle["poll_url"])).json()
+
+        return review, pending, done
+
+    review, pending, done = run(scenario)
+
+    assert review["ai_section"]["status"] == "pending"
+    assert pending["status"] == "pending" and pending["result"] is None
+
+    assert done["status"] == "done"
+    assert done["result"]["advisory"].startswith("Replay advisory")
+    assert done["result"]["decision"] == review["decision"]
+    assert done["result"]["final_score"] >= review["final_score"]
+
+
+def test_sse_sends_keep_alives_then_one_advisory_event(monkeypatch):
+    monkeypatch.setattr(review_module, "SSE_KEEPALIVE_SECONDS", 0.02)
+
+    async def scenario(client):
+        job_id = advisory_jobs.create({"decision": "PASS"})
+
+        async def finish():
+            await asyncio.sleep(0.1)
+            advisory_jobs.complete(job_id, "done", {"advisory": "ok"})
+
+        finishing = asyncio.create_task(finish())
+        async with client.stream("GET", f"/api/v1/advisory/{job_id}/events") as response:
+            events = [chunk async for chunk in response.aiter_text()]
+        await finishing
+
+        missing = await client.get("/api/v1/advisory/nope/events")
+        return response, "".join(events).split("\n\n"), missing
+
+    response, events, missing = run(scenario)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[-1] == ""
+    assert set(events[:-2]) == {": keep-alive"} and len(events) > 3
+
+    name, data = events[-2].split("\n")
+    assert name == "event: advisory"
+    assert json.loads(data[len("data: "):])["result"] == {"advisory": "ok"}
+
+    assert missing.status_code == 404
+
+
+def test_callback_is_delivered_locally_and_failures_are_contained(monkeypatch):
+    use_replay_advisory(monkeypatch)
+    delivered = []
+
+    def post(url, json, timeout):
+        delivered.append((url, json))
+        if url.endswith("/down"):
+            raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(review_module.requests, "post", post)
+
+    async def scenario(client):
+        handles = []
+        for hook in ("up", "down"):
+            body = deferred_review(f"x_{hook} = eval(y)\n", callback_url=f"http://localhost:8900/{hook}")
+            handles.append((await client.post("/api/v1/review", json=body)).json()["ai_section"])
+
+        await wait_for(lambda: len(delivered) == 2)
+
+        remote = await client.post(
+            "/api/v1/review", json=deferred_review("x = 1\n", callback_url="http://example.com/hook")
+        )
+        return handles, remote
+
+    handles, remote = run(scenario)
+
+    by_url = dict(delivered)
+    up = by_url["http://localhost:8900/up"]
+    assert up["advisory_id"] == handles[0]["advisory_id"] and up["status"] == "done"
+
+    # A failed delivery still leaves the job pollable
+    assert advisory_jobs.get(handles[1]["advisory_id"])["status"] == "done"
+
+    assert remote.status_code == 422
+    assert is_local_callback("http://[::1]:80/x") and not is_local_callback("ftp://localhost/x")
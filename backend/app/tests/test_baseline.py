@@ -0,0 +1,93 @@
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.core import baseline as baseline_module
+from app.core.analyzer import analyze_code
+from app.core.baseline import BaselineStore, apply_baseline
+from app.core.project_analyzer import analyze_project
+from app.main import app
+from app.models.schemas import ProjectFile
+
+
+CODE = (
+    "import os\n"
+    "def run(cmd):\n"
+    "    os.system(cmd)  # quality-gate: ignore[python.os-system]\n"
+    "    # quality-gate: ignore\n"
+    "    print(cmd)\n"
+    "    return eval(cmd)\n"
+)
+
+
+def test_inline_suppressions_and_stable_fingerprints():
+    rules = [issue["rule_id"] for issue in analyze_code(CODE, "python")]
+    assert rules == ["python.dangerous-call"]
+
+    # Same rule and line text → same fingerprint, wherever the line moves
+    moved = "\n\n" + CODE.replace("eval(cmd)", "eval( cmd )")
+    first, _, _ = apply_baseline(analyze_code(CODE, "python"))
+    second, _, _ = apply_baseline(analyze_code(moved, "python"))
+    assert first[0]["fingerprint"] == second[0]["fingerprint"]
+    assert "context_hash" not in first[0]
+
+    # ... but not across files, and not when the line itself changes
+    other = [dict(issue, path="b.py") for issue in analyze_code(CODE, "python")]
+    changed = analyze_code(CODE.replace("eval(cmd)", "eval(cmd + '1')"), "python")
+    assert apply_baseline(other)[0][0]["fingerprint"] != first[0]["fingerprint"]
+    assert apply_baseline(changed)[0][0]["fingerprint"] != first[0]["fingerprint"]
+
+    # Project-level issues honour the comments of the file they point at
+    files = [
+        ProjectFile(path="a.py", code="def handler():  # quality-gate: ignore\n    return missing()\n"),
+        ProjectFile(path="b.py", code="def handler():\n    pass\n"),
+    ]
+    project = [r for r in analyze_project(files) if r["path"] == "__project__"][0]["issues"]
+    assert {(i["rule_id"], i["path"]) for i in project if i["rule_id"] == "project.duplicate-definition"} == {
+        ("project.duplicate-definition", "b.py")
+    }
+
+
+def test_large_baseline_loads_and_matches_quickly(tmp_path):
+    store = BaselineStore(str(tmp_path))
+    known = np.random.default_rng(7).integers(0, 2 ** 63, size=100_000, dtype=np.uint64)
+
+    store.save("legacy", known)
+
+    started = time.perf_counter()
+    baseline = BaselineStore(str(tmp_path)).get("legacy")
+    matched = baseline.contains(np.concatenate([known[:50_000], known[:50_000] + np.uint64(1)]))
+    elapsed = time.perf_counter() - started
+
+    assert len(baseline) == 100_000
+    assert matched[:50_000].all() and matched[50_000:].sum() < 5
+    assert elapsed < 0.5
+
+    merged = store.save("legacy", [1, 2], merge=True)
+    assert len(merged) == 100_002 and merged.revision != baseline.revision
+    assert store.names() == ["legacy"] and store.delete("legacy") and store.get("legacy") is None
+
+
+def test_review_api_reports_only_new_issues(tmp_path, monkeypatch):
+    monkeypatch.setattr(baseline_module, "_store", BaselineStore(str(tmp_path)))
+    client = TestClient(app)
+
+    legacy = {"language": "python", "code": "import os\nos.system(cmd)\n"}
+    first = client.post("/api/v1/review", json=legacy).json()
+
+    saved = client.put("/api/v1/baselines/legacy", json={"review_id": first["review_id"]})
+    assert saved.status_code == 200 and saved.json()["size"] > 0
+
+    body = dict(legacy, code=legacy["code"] + "eval(x)\n", baseline="legacy")
+    result = client.post("/api/v1/review", json=body).json()
+
+    assert [issue["rule_id"] for issue in result["issues"]] == ["python.dangerous-call"]
+    assert result["baseline"]["suppressed"] == len(first["issues"])
+
+    sarif = client.post("/api/v1/review?format=sarif", json=body).json()
+    assert sarif["runs"][0]["results"][0]["partialFingerprints"]["qualityGate/v1"]
+
+    assert client.post("/api/v1/review", json=dict(body, baseline="nope")).status_code == 422
+    assert client.put("/api/v1/baselines/x", json={"fingerprints": ["zz"]}).status_code == 422
+    assert client.delete("/api/v1/baselines/legacy").status_code == 200
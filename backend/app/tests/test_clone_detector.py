@@ -0,0 +1,89 @@
+import ast
+
+from app.core.clone_detector import CloneIndex, clone_issues, detect_clones, normalized_tokens, winnow
+
+
+class MockFile:
+    def __init__(self, path, code):
+        self.path = path
+        self.code = code
+
+
+BODY = """
+    total = 0
+    for item in items:
+        if item.price > limit:
+            total += item.price * 2
+        else:
+            total -= 1
+    result = [x for x in range(total) if x % 3]
+    return sorted(result)[:10]
+"""
+
+
+def renamed_copy():
+    return (
+        BODY.replace("items", "goods")
+        .replace("item", "g")
+        .replace("total", "acc")
+        .replace("limit", "cap")
+    )
+
+
+def test_renamed_copy_is_reported():
+    files = [
+        MockFile("a.py", "def compute(items, limit):" + BODY),
+        MockFile("b.py", "def other(goods, cap):" + renamed_copy()),
+    ]
+
+    issues = detect_clones(files)
+
+    assert len(issues) == 1
+    assert issues[0]["path"] == "b.py"
+    assert "identical to 'compute'" in issues[0]["message"]
+
+
+def test_index_is_incremental_and_persistable(tmp_path):
+    index = CloneIndex()
+    index.add_file("a.py", "def compute(items, limit):" + BODY)
+    index.add_file("b.py", "def other(goods, cap):" + renamed_copy())
+
+    assert len(index.clone_groups()) == 1
+
+    target = tmp_path / "clones.json"
+    index.save(str(target))
+    restored = CloneIndex.load(str(target))
+
+    assert len(restored.clone_groups()) == 1
+
+    restored.add_file("b.py", "def other(x):\n    return x\n")
+    assert restored.clone_groups() == []
+
+
+def test_fingerprints_do_not_depend_on_the_interpreter():
+    # Pinned values: a persisted index must match on any Python version
+    tokens = normalized_tokens(ast.parse("def f():\n    return 'x'\n").body[0])
+
+    assert tokens == [2912527766, 1837971851, 624265607]   # Return, Constant, str
+    assert winnow(list(range(1, 20))).tolist() == [
+        3525937019741256298, 5521954492241201445, 7099295717060305897
+    ]
+
+
+def test_issues_name_a_function_the_clone_matches_directly():
+    # a ~ b and b ~ c (26 of 32 MinHash values), but a !~ c (20 of 32)
+    a = list(range(32))
+    b = a[:26] + [100 + i for i in range(6)]
+    c = [200 + i for i in range(6)] + b[6:]
+
+    index = CloneIndex()
+    for name, signature in [("a", a), ("b", b), ("c", c)]:
+        index.add_fingerprints(f"{name}.py", name, [
+            (name, {"line": 1}, {"exact": name, "signature": signature})
+        ])
+
+    assert len(index.clone_groups()) == 1
+    assert [issue["message"] for issue in clone_issues(index)] == [
+        "Function 'b' is a near-duplicate of 'a' in a.py",
+        "Function 'c' is a near-duplicate of 'b' in b.py",
+    ]
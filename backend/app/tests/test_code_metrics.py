@@ -0,0 +1,43 @@
+from app.core.analyzer import analyze_code
+
+
+CODE = '''
+class Handler:
+    def run(self, items, limit=10, *extra, strict, **options):
+        if items and limit:
+            for item in items:
+                if item > limit:
+                    continue
+                elif item < 0:
+                    raise ValueError(item)
+        return [i for i in items if i]
+
+
+async def fetch(url):
+    try:
+        return await url
+    except OSError:
+        return None
+''' + "\n\nasync def long_task():\n" + "    x = 1\n" * 45
+
+
+def test_metrics_are_reported_per_function_and_file():
+    metrics = {}
+    issues = analyze_code(CODE, "python", metrics=metrics)
+
+    functions = {f["name"]: f for f in metrics["functions"]}
+
+    run = functions["Handler.run"]
+    assert run["params"] == 5
+    # 1 + if + and + for + if + elif + comprehension (for + if)
+    assert run["complexity"] == 8
+    # 'elif' does not add a nesting level
+    assert run["max_nesting"] == 3
+    assert run["halstead"]["distinct_operators"] == 3
+
+    assert functions["fetch"]["complexity"] == 2
+    assert metrics["class_count"] == 1
+    assert metrics["function_count"] == 3
+
+    # Long-function rule now covers async functions
+    assert [i["rule_id"] for i in issues] == ["python.long-function"]
@@ -0,0 +1,34 @@
+from app.core.deduplicator import group_issues
+
+
+def secret(path, line, severity="CRITICAL"):
+    return {
+        "type": "Security",
+        "severity": severity,
+        "message": "Hardcoded password detected",
+        "path": path,
+        "line": line
+    }
+
+
+def test_groups_keep_every_location_and_strongest_issue():
+    issues = [secret(f"pkg/mod{i}.py", 3) for i in range(40)]
+    issues.append(secret("pkg/mod0.py", 3))               # same spot, other analyzer
+    issues.append({"type": "Code Quality", "severity": "LOW", "message": "Debug print() found",
+                   "path": "a.py", "line": 1})
+
+    groups = group_issues(issues)
+
+    assert len(groups) == 2
+    secrets = groups[0]
+    assert secrets["count"] == 40
+    assert secrets["occurrences"][1] == {"path": "pkg/mod1.py", "line": 3}
+
+
+def test_occurrence_list_is_bounded():
+    issues = (secret(f"f{i}.py", i) for i in range(100_000))
+
+    [group] = group_issues(issues, max_occurrences=10)
+
+    assert group["count"] == 100_000
+    assert len(group["occurrences"]) == 10
@@ -0,0 +1,58 @@
+import subprocess
+
+from app.core.git_scanner import BlobCache, scan_revision_range
+
+
+def commit(repo, files, message):
+    for name, content in files.items():
+        (repo / name).write_text(content)
+    subprocess.run(["git", "-C", str(repo), "add", "."], check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t",
+         "commit", "-q", "-m", message],
+        check=True
+    )
+
+
+def test_only_changed_blobs_are_read(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+
+    commit(repo, {
+        "utils.py": "def add(a, b):\n    return a + b\n",
+        "main.py": "from utils import add\nadd(1, 2)\n",
+        "README.md": "# docs\n",
+    }, "first")
+    commit(repo, {"main.py": "from utils import add\nadd(1, 2)\nmissing()\n"}, "second")
+
+    cache = BlobCache(str(tmp_path / "cache"))
+    scan_revision_range(str(repo), head="HEAD~1", cache=cache)
+
+    result = scan_revision_range(
+        str(repo), head="HEAD", base="HEAD~1", cache=BlobCache(str(tmp_path / "cache"))
+    )
+
+    assert result["changed_files"] == ["main.py"]
+    assert result["stats"]["blobs_read"] == 1
+    assert result["stats"]["cache_hits"] == 1
+    assert [i["message"] for i in result["raw_issues"]] == [
+        "Function 'missing' is used but not defined in project"
+    ]
+
+
+def test_inline_suppressions_apply_to_cross_file_issues(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+
+    commit(repo, {
+        "main.py": "missing()  # quality-gate: ignore[project.undefined-function]\nother()\n",
+    }, "first")
+
+    # Second scan reads the suppressions back from the on-disk cache
+    for _ in range(2):
+        result = scan_revision_range(str(repo), cache=BlobCache(str(tmp_path / "cache")))
+        assert [i["message"] for i in result["raw_issues"]] == [
+            "Function 'other' is used but not defined in project"
+        ]
@@ -0,0 +1,83 @@
+from app.core.import_graph import (
+    cyclic_components,
+    import_graph_issues,
+    module_name,
+    resolve_import,
+    strongly_connected_components
+)
+from app.core.project_issue_detector import detect_project_issues
+from app.core.project_parser import parse_project_files
+from app.models.schemas import ProjectFile
+
+
+def project(files):
+    return parse_project_files([ProjectFile(path=path, code=code) for path, code in files.items()])
+
+
+def test_relative_imports_resolve_against_the_file():
+    assert module_name("app/core/x.py") == ("app.core.x", False)
+    assert module_name("app/core/__init__.py") == ("app.core", True)
+
+    assert resolve_import("app.core.x", False, 1, "y") == "app.core.y"
+    assert resolve_import("app.core.x", False, 2, "") == "app"
+    assert resolve_import("app.core", True, 1, "y") == "app.core.y"
+    assert resolve_import("app.core.x", False, 4, "y") is None
+
+
+def test_cycles_reported_once_per_component():
+    data = project({
+        "pkg/__init__.py": "",
+        "pkg/a.py": "from . import b\n",
+        "pkg/b.py": "from .c import helper\n",
+        "pkg/c.py": "import pkg.a\n\ndef helper():\n    from pkg import d\n",
+        "pkg/d.py": "from pkg.a import thing\n",
+        "pkg/e.py": "from typing import TYPE_CHECKING\nif TYPE_CHECKING:\n    from pkg import a\n",
+    })
+
+    issues = [i for i in detect_project_issues(data) if i["rule_id"] == "project.import-cycle"]
+
+    # d → a is not a cycle: c imports d only inside a function
+    assert len(issues) == 1
+    assert issues[0]["message"] == "Circular import: pkg.a → pkg.b → pkg.c → pkg.a"
+    assert issues[0]["path"] == "pkg/a.py"
+
+
+def test_tarjan_handles_deep_chains_without_recursion():
+    count = 50_000
+    adjacency = [[position + 1] for position in range(count - 1)] + [[0]]
+
+    assert len(set(strongly_connected_components(adjacency))) == 1
+    assert [len(c) for c in cyclic_components(adjacency)] == [count]
+    assert cyclic_components([[1], [2], []]) == []
+
+
+def test_layer_violations_match_dotted_suffixes():
+    data = project({
+        "backend/app/api/review.py": "from app.core import analyzer\n",
+        "backend/app/core/analyzer.py": "from app.api.review import router\n",
+        "backend/app/core/__init__.py": "",
+    })
+
+    issues = import_graph_issues(data.modules, data.module_imports, layers=["app.api", "app.core"])
+    violations = [i for i in issues if i["rule_id"] == "project.layer-violation"]
+
+    assert [v["path"] for v in violations] == ["backend/app/core/analyzer.py"]
+    assert "imports 'backend.app.api.review' (app.api)" in violations[0]["message"]
+
+
+def test_single_segment_imports_stay_external_outside_a_source_root():
+    # 'import json' is the standard library, not pkg/json.py
+    data = project({
+        "pkg/json.py": "from pkg import util\n",
+        "pkg/util.py": "import json\n",
+    })
+    assert import_graph_issues(data.modules, data.module_imports) == []
+
+    # ... but under src/ (above the 'tool' package) it is a project module
+    data = project({
+        "src/tool/__init__.py": "",
+        "src/tool/cli.py": "import helpers\n",
+        "src/helpers.py": "import tool.cli\n",
+    })
+    issues = import_graph_issues(data.modules, data.module_imports)
+    assert [i["message"] for i in issues] == ["Circular import: src.helpers → src.tool.cli → src.helpers"]
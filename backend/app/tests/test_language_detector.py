@@ -0,0 +1,60 @@
+from app.core.language_detector import detect_language
+from app.core.project_analyzer import analyze_project
+
+
+class MockFile:
+    def __init__(self, path, code):
+        self.path = path
+        self.code = code
+
+
+def test_detect_language_by_extension_and_shebang():
+    assert detect_language("app/main.py") == "python"
+    assert detect_language("web/App.JSX") == "javascript"
+    assert detect_language("README.md") is None
+    assert detect_language("package-lock.json") is None
+    assert detect_language("bin/tool", "#!/usr/bin/env python3\nprint(1)\n") == "python"
+    assert detect_language("bin/serve", b"#!/usr/bin/env -S node --no-warnings\n") == "javascript"
+    assert detect_language("bin/run", "#!/bin/sh\n") == "shell"
+    assert detect_language("Makefile", "all:\n\tmake\n") == "generic"
+    assert detect_language("web/config.ts") == "typescript"
+    assert detect_language("deploy/app.conf", "key = 1\n") == "generic"
+    assert detect_language("assets/logo.dat", b"\x89PNG\r\n\x1a\n\0\0") is None
+    assert detect_language("LICENSE", "MIT License\n") is None
+
+
+def test_mixed_project_is_routed_per_file():
+    results = analyze_project([
+        MockFile("server.js", "if (bad) { process.exit(1) }\n"),
+        MockFile("tool", "#!/usr/bin/env python3\neval(input())\n"),
+        MockFile("README.md", "password = 'not code'\n"),
+    ])
+
+    by_path = {r["path"]: r for r in results}
+    project = by_path["__project__"]
+
+    assert project["skipped_files"] == ["README.md"]
+    assert project["languages"] == {"javascript": 1, "python": 1}
+
+    # JavaScript is not parsed as Python (no syntax error)
+    assert [i["rule_id"] for i in by_path["server.js"]["issues"]] == ["javascript.process-exit"]
+    assert by_path["tool"]["language"] == "python"
+    assert "python.dangerous-call" in [i["rule_id"] for i in by_path["tool"]["issues"]]
+
+
+def test_other_languages_still_get_generic_and_secret_checks():
+    results = analyze_project([
+        MockFile("src/Main.java", 'class Main {\n    String password = "hunter2";\n}\n'),
+        MockFile("web/config.ts", 'const apiToken = "abc";\n'),
+        MockFile("yarn.lock", 'token = "not-a-secret"\n'),
+    ])
+
+    by_path = {r["path"]: r for r in results}
+
+    assert by_path["src/Main.java"]["language"] == "java"
+    assert by_path["web/config.ts"]["language"] == "typescript"
+    assert by_path["__project__"]["skipped_files"] == ["yarn.lock"]
+
+    for path in ("src/Main.java", "web/config.ts"):
+        secrets = [i for i in by_path[path]["issues"] if i["rule_id"] == "generic.hardcoded-secret"]
+        assert secrets and secrets[0]["severity"] == "MEDIUM"
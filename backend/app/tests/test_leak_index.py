@@ -0,0 +1,30 @@
+import os
+
+from app.core import leak_index
+from app.core.leak_index import LeakIndex, build_index, credential_digest
+from app.core.secret_detector import detect_secrets
+
+
+def test_index_build_and_lookup(tmp_path, monkeypatch):
+    leaked = [f"leaked-{i}" for i in range(500)]
+    digests = [credential_digest(text) for text in leaked]
+    digests += [os.urandom(32) for _ in range(2000)] + digests[:50]   # duplicates
+
+    path = str(tmp_path / "leaked.idx")
+    # Small runs force the external merge
+    assert build_index(iter(digests), path, chunk_records=300) == 2500
+
+    index = LeakIndex(path)
+    assert index.contains_many(["leaked-0", "leaked-499", "fresh-value", ""]) == [True, True, False, False]
+    assert "leaked-250" in index
+
+    monkeypatch.setattr(leak_index, "_index", index)
+    monkeypatch.setattr(leak_index, "_index_loaded", True)
+
+    # Cache keys over secret findings name the index that produced them
+    assert leak_index.leak_index_identity() == index.identity
+
+    issues = detect_secrets([("leaked-17", 4), ("nothing to see here", 5)])
+    assert [(i["rule_id"], i["line"]) for i in issues] == [("secrets.leaked-credential", 4)]
+
+    index.close()
@@ -0,0 +1,85 @@
+import ast
+
+from app.core.analyzer import analyze_code
+from app.core.line_index import LineIndex
+from app.core.project_analyzer import analyze_project
+from app.models.schemas import ProjectFile
+
+
+def test_offsets_and_ast_columns_map_to_character_positions():
+    lines = LineIndex("a = 1\r\nb = 'é'\rc\n")
+
+    assert lines.position(0) == (1, 1)
+    assert lines.position(7) == (2, 1)     # after \r\n
+    assert lines.position(16) == (3, 2)
+    assert lines.position(17) == (4, 1)    # after the lone \r and \n
+    assert lines.span(11, 14) == {"line": 2, "column": 5, "end_line": 2, "end_column": 8}
+
+    # UTF-8 byte columns from the AST become character columns
+    code = "name = 'héllo'; eval(x)\n"
+    call = ast.parse(code).body[1].value
+    assert call.col_offset == 17
+    assert LineIndex(code).node_span(call) == {"line": 1, "column": 17, "end_line": 1, "end_column": 24}
+
+
+def test_file_rules_report_start_and_end_positions():
+    code = (
+        "import os\n"
+        "password = 'hunter2'\n"
+        "def run(cmd):\n"
+        "    print(cmd)\n"
+        "    os.system(cmd)\n"
+        "    return eval(cmd)\n"
+        "token = 'ghp_" + "a" * 36 + "'\n"
+    )
+
+    located = {
+        issue["rule_id"]: (issue["line"], issue["column"], issue["end_line"], issue["end_column"])
+        for issue in analyze_code(code, "python")
+    }
+
+    assert located == {
+        "generic.hardcoded-secret": (7, 1, 7, 51),     # last match wins in the dict
+        "python.hardcoded-secret": (7, 1, 7, 51),
+        "python.print": (4, 5, 4, 15),
+        "python.os-system": (5, 5, 5, 19),
+        "python.dangerous-call": (6, 12, 6, 21),
+        "secrets.provider-token": (7, 9, 7, 51),
+    }
+
+    js = analyze_code("let a = 1 / 0;\nprocess.exit(1);\nprocess.exit(2);\n", "javascript")
+    assert [(i["rule_id"], i["line"], i["column"]) for i in js] == [
+        ("javascript.process-exit", 2, 1),
+        ("javascript.process-exit", 3, 1),
+        ("javascript.division-by-zero", 1, 11),
+    ]
+
+
+def test_project_rules_report_positions_in_their_own_file():
+    files = [
+        ProjectFile(path="app/a.py", code=(
+            "import os\n"
+            "from app import b\n\n"
+            "def handler():\n"
+            "    return missing()\n\n"
+            "def shell(cmd):\n"
+            "    os.system(cmd)\n\n"
+            "def route():\n"
+            "    shell(input())\n"
+        )),
+        ProjectFile(path="app/b.py", code="from app import a\n\ndef handler():\n    pass\n"),
+    ]
+
+    issues = [
+        issue
+        for result in analyze_project(files) if result["path"] == "__project__"
+        for issue in result["issues"]
+    ]
+    located = {(i["rule_id"], i["path"], i["line"], i["column"]) for i in issues}
+
+    assert ("project.undefined-function", "app/a.py", 5, 12) in located
+    assert ("project.dead-code", "app/a.py", 10, 1) in located
+    assert ("project.duplicate-definition", "app/b.py", 3, 1) in located
+    assert ("project.import-cycle", "app/a.py", 2, 1) in located
+    assert ("python.tainted-flow", "app/a.py", 11, 5) in located
+    assert all(i.get("end_line") and i.get("end_column") for i in issues)
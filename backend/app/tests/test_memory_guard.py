@@ -0,0 +1,38 @@
+from app.core.project_analyzer import analyze_project
+from app.models.schemas import ProjectFile
+
+
+class PressuredTracker:
+    """
+    Reports memory pressure after the first file.
+    """
+
+    def enforce(self, on_pressure=None):
+        if on_pressure is not None:
+            on_pressure()
+
+
+CODE = (
+    "def run(cmd, retries):\n"
+    "    total = 0\n"
+    "    for attempt in range(retries):\n"
+    "        if attempt > 2:\n"
+    "            total += attempt * 2\n"
+    "    return eval(cmd) + total\n"
+)
+
+
+def test_low_memory_strategy_drops_the_clone_index_only():
+    files = [ProjectFile(path="a.py", code=CODE), ProjectFile(path="b.py", code=CODE)]
+
+    results = analyze_project(files, memory=PressuredTracker())
+
+    assert [f.code for f in files] == [CODE, CODE]
+    assert all(
+        "python.dangerous-call" in [i["rule_id"] for i in r["issues"]]
+        for r in results if r["path"] != "__project__"
+    )
+
+    # Identical functions, but no clone index to find them
+    assert "project.duplicate-code" not in [i["rule_id"] for i in results[-1]["issues"]]
+    assert "project.duplicate-code" in [i["rule_id"] for i in analyze_project(files)[-1]["issues"]]
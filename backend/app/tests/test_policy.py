@@ -0,0 +1,86 @@
+import pytest
+
+from app.core.decision import make_decision
+from app.core.policy import PolicyError, PolicyRegistry
+
+
+def issue(severity, issue_type, message="m", path="app/x.py", rule_id="python.rule"):
+    return {"severity": severity, "type": issue_type, "message": message,
+            "path": path, "rule_id": rule_id}
+
+
+def test_default_policy_reproduces_previous_gate():
+    cases = [
+        (10, [issue("LOW", "Style"), issue("CRITICAL", "Security", "eval() call")],
+         "BLOCK", "Critical security issue: eval() call"),
+        (90, [issue("CRITICAL", "Project Consistency", "missing()")],
+         "WARN", "Critical issue detected: missing()"),
+        (90, [issue("MEDIUM", "Security")], "WARN", "Non-critical security issues detected"),
+        (70, [issue("LOW", "Style")], "BLOCK", "Overall risk score is high"),
+        (30, [], "WARN", "Moderate risk issues detected"),
+        (29, [], "PASS", "No high-risk issues detected"),
+    ]
+
+    for score, issues, decision, reason in cases:
+        assert make_decision(score, issues) == (decision, [reason])
+
+    # Composite weights and structural score of the former review_code
+    outcome = PolicyRegistry().get().evaluate([issue("LOW", "Style")] * 10, 40, "project", 10)
+    assert outcome["risk_breakdown"]["structural_risk"] == 40
+    assert outcome["final_score"] == int(0.5 * 40 + 0.3 * 40 + 0.2 * 10)
+
+
+def test_policies_are_validated_once_with_a_path_to_the_error():
+    bad = [
+        ({"policies": {"x": {"weights": {"static": -1}}}}, "policies.x.weights.static"),
+        ({"policies": {"x": {"rules": [{"name": "r", "decision": "FAIL"}]}}}, "policies.x.rules[0].decision"),
+        ({"policies": {"x": {"thresholds": {"warn": 80, "block": 50}}}}, "policies.x.thresholds"),
+        ({"policies": {"a": {"extends": "b"}, "b": {"extends": "a"}}}, "'extends' cycle"),
+        ({"policies": {"x": {"rules": [{"name": "r", "decision": "WARN", "trace": "{oops}"}]}}}, "invalid template"),
+        ({"default": "missing"}, "unknown policy 'missing'"),
+    ]
+
+    for config, message in bad:
+        with pytest.raises(PolicyError, match=message.replace("[", r"\[").replace("]", r"\]")):
+            PolicyRegistry(config)
+
+
+def test_what_if_over_many_policies_in_one_pass():
+    registry = PolicyRegistry({
+        "policies": {
+            "strict": {"thresholds": {"block": 40, "warn": 10}},
+            "payments": {
+                "extends": "strict",
+                "rules": [
+                    {"name": "no-medium-in-payments", "severity": ["HIGH", "MEDIUM"],
+                     "path": ["services/payments/*"], "max": 1, "decision": "BLOCK",
+                     "trace": "{count} issue(s) in payments (max {max})"},
+                    {"name": "security", "type": "Security", "decision": "WARN"}
+                ]
+            }
+        }
+    })
+
+    issues = [
+        issue("MEDIUM", "Maintainability", path="services/payments/api.py"),
+        dict(issue("HIGH", "Performance", path="app/main.py"),
+             occurrences=[{"path": "app/main.py", "line": 1},
+                          {"path": "services/payments/db.py", "line": 9}]),
+        issue("LOW", "Style", path="services/payments/api.py"),
+    ]
+
+    policies = registry.policy_set(["default", "strict", "payments"])
+    outcomes = policies.evaluate(issues, 20, "single-file")
+
+    assert {name: o["decision"] for name, o in outcomes.items()} == {
+        "default": "PASS", "strict": "WARN", "payments": "BLOCK"
+    }
+    assert outcomes["payments"]["decision_trace"] == ["2 issue(s) in payments (max 1)"]
+    assert outcomes["payments"]["trace"]["rules"][1] == {
+        "rule": "security", "matched": 0, "max": 0, "triggered": False, "decision": "WARN"
+    }
+
+    # Identical filters (strict's inherited rules, payments' "security")
+    # are matched once: 3 default filters + the payments path rule
+    assert len(policies.matchers) == 4
+    assert registry.version != PolicyRegistry().version
@@ -0,0 +1,61 @@
+import os
+
+from app.core.file_watcher import InotifyWatcher
+from app.core.project_index import ProjectIndex
+
+
+def write(path, content, mtime_step=0):
+    path.write_text(content)
+    if mtime_step:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_step))
+
+
+def test_only_changed_files_are_reanalyzed(tmp_path):
+    write(tmp_path / "utils.py", "def add(a, b):\n    return a + b\n")
+    write(tmp_path / "main.py", "from utils import add\nadd(1, 2)\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    index = ProjectIndex(str(tmp_path))
+    index.scan()
+    index.review()
+
+    assert index.status()["files"] == 2
+    assert index.stats["project_recomputes"] == 1
+
+    # Body-only edit: symbols unchanged → cross-file checks not recomputed
+    write(tmp_path / "utils.py", "def add(a, b):\n    return b + a\n", mtime_step=10**9)
+    assert index.scan() == ["utils.py"]
+    index.review()
+    assert index.stats["reanalyzed"] == 3
+    assert index.stats["project_recomputes"] == 1
+
+    # New call: symbol table changes → recomputed
+    write(tmp_path / "main.py", "from utils import add\nadd(1, 2)\nmissing()\n", mtime_step=10**9)
+    index.update([str(tmp_path / "main.py")])
+
+    messages = [i["message"] for i in index.review()["issues"]]
+    assert index.stats["project_recomputes"] == 2
+    assert any("'missing' is used but not defined" in m for m in messages)
+
+    os.remove(tmp_path / "main.py")
+    assert index.scan() == ["main.py"]
+    assert index.file_issues("main.py") is None
+
+
+def test_inotify_reports_written_files(tmp_path):
+    try:
+        watcher = InotifyWatcher(str(tmp_path))
+    except (OSError, AttributeError):
+        return
+
+    try:
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+
+        changed = watcher.read_changes()
+        assert str(tmp_path / "b.py") in changed
+        assert str(tmp_path / "pkg" / "a.py") in changed
+    finally:
+        watcher.close()
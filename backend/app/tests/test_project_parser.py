@@ -20,6 +20,6 @@ files = [
 
 result = parse_project_files(files)
 
-print("DEFINITIONS:", dict(result["definitions"]))
-print("CALLS:", dict(result["calls"]))
-print("IMPORTS:", dict(result["imports"]))
+print("FUNCTIONS:", sorted(result.function_names()))
+print("UNDEFINED:", result.undefined_calls())
+print("UNUSED:", result.unused_definitions())
@@ -0,0 +1,82 @@
+import json
+import xml.etree.ElementTree as ET
+
+from fastapi.testclient import TestClient
+
+from app.core.report_writers import buffered, junit_chunks, sarif_chunks
+from app.main import app
+
+
+RESULT = {
+    "decision": "BLOCK",
+    "final_score": 72,
+    "decision_trace": ["Critical security issue: eval() <call> & more"],
+    "issues": [
+        {"rule_id": "python.eval-call", "severity": "CRITICAL", "type": "Security",
+         "message": "Use of eval() <detected>", "suggestion": "Avoid eval",
+         "occurrences": [{"path": "app/a.py", "line": 3}, {"path": "app/b.py", "line": 9}]},
+        {"rule_id": "python.eval-call", "severity": "MEDIUM", "type": "Security",
+         "message": "eval in test", "path": "tests/t.py", "line": 1},
+        {"rule_id": "project.import-cycle", "severity": "MEDIUM", "type": "Architecture",
+         "message": "Circular import: a → b → a", "path": "app/a.py"},
+    ]
+}
+
+
+def test_sarif_report_is_valid_and_located():
+    chunks = list(sarif_chunks(RESULT))
+    assert len(chunks) > 4  # written per result, not as one document
+
+    run = json.loads("".join(chunks))["runs"][0]
+    rules = run["tool"]["driver"]["rules"]
+
+    assert [rule["id"] for rule in rules] == ["python.eval-call", "project.import-cycle"]
+    assert rules[0]["properties"]["security-severity"] == "9.5"  # strongest seen
+
+    results = run["results"]
+    assert [(r["ruleId"], r["ruleIndex"], r["level"]) for r in results] == [
+        ("python.eval-call", 0, "error"),
+        ("python.eval-call", 0, "error"),
+        ("python.eval-call", 0, "warning"),
+        ("project.import-cycle", 1, "warning"),
+    ]
+
+    location = results[1]["locations"][0]["physicalLocation"]
+    assert location == {"artifactLocation": {"uri": "app/b.py"}, "region": {"startLine": 9}}
+    assert "region" not in results[3]["locations"][0]["physicalLocation"]
+    assert run["invocations"][0]["properties"]["decision"] == "BLOCK"
+
+
+def test_junit_report_escapes_and_counts():
+    suite = ET.fromstring("".join(junit_chunks(RESULT))).find("testsuite")
+
+    assert suite.get("tests") == "5" and suite.get("failures") == "5"
+
+    cases = suite.findall("testcase")
+    assert cases[0].get("name") == "decision"
+    assert "<call> & more" in cases[0].find("failure").text
+
+    assert cases[2].get("classname") == "app.b"
+    assert cases[2].get("line") == "9"
+    assert cases[2].find("failure").get("message") == "Use of eval() <detected>"
+
+    assert list(buffered(iter(["ab", "cd", "e"]), size=3)) == ["abcd", "e"]
+
+
+def test_review_api_streams_requested_format():
+    client = TestClient(app)
+    body = {"language": "python", "code": "eval(input())\n"}
+
+    sarif = client.post("/api/v1/review?format=sarif", json=body)
+    assert sarif.status_code == 200
+    assert sarif.headers["content-type"].startswith("application/sarif+json")
+    assert sarif.headers["x-quality-gate-decision"] in ("PASS", "WARN", "BLOCK")
+    assert sarif.headers["etag"].endswith('-sarif"')
+
+    results = sarif.json()["runs"][0]["results"]
+    assert any(r["ruleId"] == "python.dangerous-call" for r in results)
+
+    junit = client.post("/api/v1/review?format=junit", json=body)
+    assert ET.fromstring(junit.content).tag == "testsuites"
+
+    assert client.post("/api/v1/review?format=pdf", json=body).status_code == 422
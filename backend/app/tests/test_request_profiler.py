@@ -0,0 +1,43 @@
+import pstats
+
+import pytest
+
+from app.core.request_profiler import RequestProfiler, ProfilingDenied
+
+
+def busy():
+    return sum(i * i for i in range(20000))
+
+
+def test_profiling_is_guarded_and_saved(tmp_path):
+    profiler = RequestProfiler(
+        token="secret", directory=str(tmp_path), rate_per_minute=60, burst=2, keep=5
+    )
+
+    with pytest.raises(ProfilingDenied) as denied:
+        profiler.start("cprofile", "wrong")
+    assert denied.value.status_code == 403
+
+    session = profiler.start("cprofile", "secret")
+
+    # Only one profiled request at a time
+    with pytest.raises(ProfilingDenied) as busy_slot:
+        profiler.start("sampling", "secret")
+    assert busy_slot.value.status_code == 429
+
+    busy()
+    summary = session.stop()
+    assert session.stop() is summary
+
+    saved = profiler.find(summary["profile_id"])
+    assert saved.endswith(".pstats")
+    assert pstats.Stats(saved).total_calls > 0
+    assert any("busy" in row["function"] for row in summary["top"])
+
+    # Burst of 2 used up (the denied busy-slot attempt consumed a token)
+    with pytest.raises(ProfilingDenied) as limited:
+        profiler.start("sampling", "secret")
+    assert limited.value.status_code == 429
+    assert limited.value.retry_after > 0
+
+    assert profiler.find("../etc/passwd") is None
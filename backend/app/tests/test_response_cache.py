@@ -0,0 +1,40 @@
+from app.models.schemas import ReviewRequest
+from app.core import response_cache
+from app.core.response_cache import request_fingerprint, etag_for, etag_matches
+
+
+def test_fingerprint_is_canonical_and_versioned(monkeypatch):
+    files = [
+        {"path": "b.py", "code": "y = 2\n"},
+        {"path": "a.py", "code": "x = 1\n"},
+    ]
+
+    first = ReviewRequest(language="Python", files=files)
+    reordered = ReviewRequest(language="python", files=list(reversed(files)))
+    edited = ReviewRequest(language="python", files=[files[0], {"path": "a.py", "code": "x = 3\n"}])
+    with_context = ReviewRequest(language="python", files=files, context="payments")
+
+    assert request_fingerprint(first) == request_fingerprint(reordered)
+    assert request_fingerprint(first) != request_fingerprint(edited)
+    assert request_fingerprint(first) != request_fingerprint(with_context)
+
+    # A rules release invalidates every cached response
+    assert request_fingerprint(first) != request_fingerprint(first, version="next")
+
+    # ... and so does any run-time rule input
+    seen = {request_fingerprint(first)}
+    monkeypatch.setattr(response_cache, "IMPORT_LAYERS", ["app.api", "app.core"])
+    seen.add(request_fingerprint(first))
+    monkeypatch.setattr(response_cache, "leak_index_identity", lambda: "0123456789ab")
+    seen.add(request_fingerprint(first))
+    assert len(seen) == 3
+
+
+def test_if_none_match_parsing():
+    etag = etag_for("ab" * 32)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
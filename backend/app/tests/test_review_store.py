@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+
+from app.api import review as review_module
+from app.core.response_cache import response_cache
+from app.core.review_store import ReviewStore
+from app.main import app
+
+
+def make_issue(path, severity, issue_type="Security", confidence=0.9):
+    return {
+        "type": issue_type,
+        "severity": severity,
+        "message": f"{severity} in {path}",
+        "confidence": confidence,
+        "occurrences": [{"path": path, "line": 1}]
+    }
+
+
+def test_filtered_pages_follow_the_cursor():
+    issues = [make_issue(f"app/mod{i:03}.py", "CRITICAL" if i % 10 == 0 else "LOW") for i in range(300)]
+    issues += [make_issue(f"tests/t{i}.py", "CRITICAL") for i in range(20)]
+
+    # One group found in two directories → one entry per path
+    issues.append({"type": "Security", "severity": "CRITICAL", "message": "Hardcoded password",
+                   "confidence": 0.95, "occurrences": [{"path": "app/a.py", "line": 4},
+                                                       {"path": "lib/b.py", "line": 9}]})
+
+    store = ReviewStore()
+    review_id = store.save({"decision": "BLOCK", "issues": issues})
+
+    seen = []
+    cursor = None
+    while True:
+        page = store.issues(review_id, severity="critical", path_prefix="app/",
+                            cursor=cursor, limit=7)
+        seen.extend(entry["path"] for entry in page["issues"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 31
+    assert seen == sorted(seen)
+    assert all(path.startswith("app/") for path in seen)
+
+    confident = store.issues(review_id, min_confidence=0.95)
+    assert [entry["path"] for entry in confident["issues"]] == ["app/a.py", "lib/b.py"]
+
+    assert store.issues("missing") is None
+
+
+def test_cached_response_keeps_its_review_resolvable(monkeypatch):
+    # The store holds one review; the response cache outlives it
+    monkeypatch.setattr(review_module, "review_store", ReviewStore(limit=1))
+    response_cache.clear()
+    client = TestClient(app)
+
+    first = {"language": "python", "code": "import os\nos.system(cmd)\n"}
+    review_id = client.post("/api/v1/review", json=first).json()["review_id"]
+    client.post("/api/v1/review", json=dict(first, code="eval(x)\n"))
+    assert client.get(f"/api/v1/reviews/{review_id}").status_code == 404
+
+    repeat = client.post("/api/v1/review", json=first)
+    assert repeat.headers["X-Cache"] == "HIT" and repeat.json()["review_id"] == review_id
+
+    stored = client.get(f"/api/v1/reviews/{review_id}")
+    assert stored.status_code == 200 and stored.json()["review_id"] == review_id
+    assert client.get(f"/api/v1/reviews/{review_id}/issues").json()["issues"]
+    assert len(review_module.review_store.get(review_id)["fingerprints"]) > 0
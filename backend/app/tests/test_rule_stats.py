@@ -0,0 +1,33 @@
+from app.core.analyzer import analyze_code
+from app.core.rule_stats import active_rule_stats, collect_rule_stats
+
+
+CODE = '''
+def handler(data):
+    print(data)
+    print("done")
+    return eval(data)
+
+api_token = "abc"
+'''
+
+
+def test_rule_stats_are_opt_in_and_count_matches():
+    plain = analyze_code(CODE, "python", path="handler.py")
+    assert active_rule_stats() is None
+    assert all("rule_id" in issue for issue in plain)
+
+    with collect_rule_stats() as stats:
+        instrumented = analyze_code(CODE, "python", path="handler.py")
+
+    assert instrumented == plain
+
+    rows = {row["check"]: row for row in stats.report()}
+
+    calls = rows["PythonCodeAnalyzer.visit_Call"]
+    assert calls["invocations"] == 3
+    assert calls["rules"] == {"python.dangerous-call": 1, "python.print": 2}
+    assert calls["slowest_files"][0]["path"] == "handler.py"
+
+    assert rows["PythonCodeAnalyzer.visit_Assign"]["rules"] == {"python.hardcoded-secret": 1}
+    assert rows["analyze_generic"]["rules"] == {"generic.hardcoded-secret": 1}
@@ -0,0 +1,66 @@
+from app.core.project_parser import parse_project_files
+from app.models.schemas import ProjectFile
+
+
+def table(files):
+    return parse_project_files([ProjectFile(path=path, code=code) for path, code in files.items()])
+
+
+def test_names_resolve_per_file_and_through_imports():
+    symbols = table({
+        "backend/app/utils.py": (
+            "def add(a, b):\n    return a + b\n\n"
+            "def unused():\n    pass\n\n"
+            "class Parser:\n"
+            "    def parse(self):\n        return helper()\n"
+            "    def stale(self):\n        pass\n"
+        ),
+        "backend/app/main.py": (
+            "from .utils import add, Parser\n"
+            "from fastapi import APIRouter\n"
+            "router = APIRouter()\n\n"
+            "@router.get('/')\n"
+            "def index(callback):\n"
+            "    callback()\n"
+            "    Parser().parse()\n"
+            "    return add(1, 2)\n"
+        ),
+        "backend/app/star.py": "from os.path import *\njoin('a', 'b')\n",
+    })
+
+    # helper() is unbound in utils.py; callback() is a parameter
+    assert symbols.undefined_calls() == [(
+        "helper", "backend/app/utils.py",
+        {"line": 9, "column": 16, "end_line": 9, "end_column": 24}
+    )]
+
+    # add: imported (relative import, backend/ root); parse: attribute;
+    # index: decorated route
+    assert [(name, path, location["line"]) for name, path, location in sorted(symbols.unused_definitions())] == [
+        ("backend.app.utils.Parser.stale", "backend/app/utils.py", 10),
+        ("backend.app.utils.unused", "backend/app/utils.py", 4),
+    ]
+    assert symbols.function_names() == {"add", "unused", "parse", "stale", "index"}
+
+
+def test_only_module_level_functions_are_duplicates():
+    symbols = table({
+        "a.py": "def run():\n    pass\n\nclass A:\n    def save(self):\n        pass\n",
+        "b.py": "def run():\n    def inner():\n        pass\n    inner()\n\nclass B:\n    def save(self):\n        pass\n",
+        "c.py": "def outer():\n    def inner():\n        pass\n",
+        "d.py": (
+            "from typing import overload\n"
+            "@overload\ndef one(x: int) -> int: ...\n"
+            "@overload\ndef one(x: str) -> str: ...\n"
+            "def one(x):\n    return x\n"
+        ),
+    })
+
+    assert symbols.duplicate_functions() == {"run": [
+        ("a.py", {"line": 1, "column": 1, "end_line": 2, "end_column": 9}),
+        ("b.py", {"line": 1, "column": 1, "end_line": 4, "end_column": 12}),
+    ]}
+
+    # Nested helpers resolve only within their own file
+    dead = {name: path for name, path, _ in symbols.unused_definitions()}
+    assert "c.outer.inner" in dead and "b.run.inner" not in dead
@@ -0,0 +1,99 @@
+from app.core.project_parser import parse_project_files
+from app.core.taint_analyzer import analyze_taint
+
+
+class MockFile:
+    def __init__(self, path, code):
+        self.path = path
+        self.code = code
+
+
+def run(files):
+    return analyze_taint(files, parse_project_files(files))
+
+
+def test_request_input_reaches_sink_across_files():
+    files = [
+        MockFile(
+            "api.py",
+            "from flask import request\n"
+            "from runner import run_cmd\n"
+            "def handler():\n"
+            "    cmd = request.args.get('cmd')\n"
+            "    run_cmd('echo ' + cmd)\n"
+        ),
+        MockFile(
+            "runner.py",
+            "import os\n"
+            "def run_cmd(c):\n"
+            "    os.system(c)\n"
+        )
+    ]
+
+    issues = run(files)
+
+    assert len(issues) == 1
+    assert issues[0]["path"] == "api.py"
+    assert issues[0]["line"] == 5
+    assert "via 'run_cmd'" in issues[0]["message"]
+
+
+def test_constant_argument_is_not_reported():
+    files = [
+        MockFile(
+            "main.py",
+            "import os\n"
+            "def run_cmd(c):\n"
+            "    os.system(c)\n"
+            "def main():\n"
+            "    run_cmd('ls')\n"
+        )
+    ]
+
+    assert run(files) == []
+
+
+def test_environment_flows_through_return_value():
+    files = [
+        MockFile(
+            "main.py",
+            "import os\n"
+            "def load():\n"
+            "    return os.getenv('EXPR')\n"
+            "def main():\n"
+            "    eval(load())\n"
+        )
+    ]
+
+    issues = run(files)
+
+    assert [i["message"] for i in issues] == [
+        "Untrusted input reaches 'eval()' in 'main'"
+    ]
+
+
+def test_flows_inside_match_cases_are_summarized():
+    files = [
+        MockFile(
+            "main.py",
+            "import os\n"
+            "from flask import request\n"
+            "def dispatch(action):\n"
+            "    match action:\n"
+            "        case {'run': cmd}:\n"
+            "            os.system(cmd)\n"
+            "        case [first, *rest]:\n"
+            "            eval(rest)\n"
+            "        case _:\n"
+            "            os.system('true')\n"
+            "def handler():\n"
+            "    dispatch(request.json)\n"
+        )
+    ]
+
+    issues = run(files)
+
+    assert sorted(i["message"] for i in issues) == [
+        "Untrusted input reaches 'eval()' via 'dispatch' in 'handler'",
+        "Untrusted input reaches 'os.system()' via 'dispatch' in 'handler'",
+    ]
@@ -0,0 +1,109 @@
+"""
+Import-graph build and cycle detection on synthetic projects.
+
+Usage (from backend/):
+    python scripts/bench_import_graph.py
+    python scripts/bench_import_graph.py --modules 10000 50000 --degree 8 --cycles 20
+
+Each project is a package tree of --modules modules. Every module
+imports --degree modules from lower (later) positions, so the graph is
+acyclic until --cycles back edges are added, each closing one cycle.
+A single import chain of the same length checks that cycle detection
+does not recurse. Reports graph build time (name resolution included),
+SCC time and the cycles found; both should grow linearly.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.import_graph import ImportGraph, cyclic_components, import_graph_issues  # noqa: E402
+
+
+def synthetic_project(count, degree, cycles, seed):
+    """
+    project_data with 'modules' / 'module_imports' as merge_file_symbols
+    builds them.
+    """
+    rng = random.Random(seed)
+    names = [f"app.pkg{i % 97}.mod{i}" for i in range(count)]
+
+    modules = {name: name.replace(".", "/") + ".py" for name in names}
+    module_imports = {}
+
+    for position, name in enumerate(names):
+        imports = []
+        for _ in range(degree):
+            if position + 1 < count:
+                target = names[rng.randrange(position + 1, count)]
+                package, _, leaf = target.rpartition(".")
+                imports.append((package, [leaf]) if rng.random() < 0.5 else (target, []))
+        module_imports[name] = imports
+
+    for _ in range(cycles):
+        low = rng.randrange(0, count - 1)
+        high = rng.randrange(low + 1, count)
+        module_imports[names[high]].append((names[low], []))
+
+    return {"modules": modules, "module_imports": module_imports}
+
+
+def chain_project(count):
+    names = [f"chain.m{i}" for i in range(count)]
+    return {
+        "modules": {name: name.replace(".", "/") + ".py" for name in names},
+        "module_imports": {
+            name: [(names[(position + 1) % count], [])] for position, name in enumerate(names)
+        }
+    }
+
+
+def measure(project_data):
+    started = time.perf_counter()
+    graph = ImportGraph(project_data["modules"], project_data["module_imports"])
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cyclic = cyclic_components(graph.adjacency)
+    scc = time.perf_counter() - started
+
+    started = time.perf_counter()
+    issues = import_graph_issues(project_data["modules"], project_data["module_imports"], layers=[])
+    total = time.perf_counter() - started
+
+    return graph, build, scc, total, cyclic, issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import-graph analysis")
+    parser.add_argument("--modules", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    parser.add_argument("--degree", type=int, default=6, help="imports per module")
+    parser.add_argument("--cycles", type=int, default=10, help="back edges added")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'modules':>8} {'edges':>9} {'build ms':>9} {'scc ms':>8} {'issues ms':>10} "
+          f"{'µs/edge':>8} {'cyclic SCCs':>12} {'largest':>8}")
+
+    for count in args.modules:
+        project_data = synthetic_project(count, args.degree, args.cycles, args.seed)
+        graph, build, scc, total, cyclic, _ = measure(project_data)
+        edges = graph.edge_count()
+        largest = max((len(component) for component in cyclic), default=0)
+
+        print(f"{count:>8,} {edges:>9,} {build * 1000:>9.1f} {scc * 1000:>8.1f} {total * 1000:>10.1f} "
+              f"{total * 1e6 / max(1, edges):>8.2f} {len(cyclic):>12} {largest:>8,}")
+
+    count = max(args.modules)
+    graph, build, scc, total, cyclic, issues = measure(chain_project(count))
+    print(f"\nchain of {count:,} modules (one cycle through all): "
+          f"scc {scc * 1000:.1f} ms, {len(issues)} issue, "
+          f"{len(cyclic[0]) if cyclic else 0:,} modules in it")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Lookup throughput and resident memory of the leaked-credential index.
+
+Usage (from backend/):
+    python scripts/bench_leak_index.py --count 5000000
+    python scripts/bench_leak_index.py --index leaked.idx --known leaked-tokens.txt
+
+Without --index, builds a temporary index of --count digests: random
+SHA-256 values plus --known-count hashed "leaked" credentials, so half
+of the queries hit. Reports batched lookups/sec (hashing included),
+single-lookup latency and RSS before/after opening and querying, split
+into private memory (per worker) and shared file-backed pages.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.leak_index import LeakIndex, build_index, credential_digest  # noqa: E402
+
+
+def rss_mb():
+    """
+    (private, file-backed) resident MB. File-backed pages of the mapping
+    live in the page cache and are shared by every worker process.
+    """
+    fields = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                key, _, value = line.partition(":")
+                if key in ("RssAnon", "RssFile"):
+                    fields[key] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+
+    return fields.get("RssAnon", 0.0), fields.get("RssFile", 0.0)
+
+
+def synthetic_digests(count, known):
+    for text in known:
+        yield credential_digest(text)
+
+    remaining = count - len(known)
+    while remaining > 0:
+        block = os.urandom(32 * min(remaining, 65536))
+        for start in range(0, len(block), 32):
+            yield block[start:start + 32]
+        remaining -= len(block) // 32
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the leaked-credential index")
+    parser.add_argument("--index", help="existing index (default: build a temporary one)")
+    parser.add_argument("--known", help="file of credentials present in --index")
+    parser.add_argument("--count", type=int, default=5_000_000)
+    parser.add_argument("--known-count", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.index:
+            path = args.index
+            with open(args.known, encoding="utf-8") as handle:
+                known = [line.rstrip("\n") for line in handle if line.strip()]
+        else:
+            path = os.path.join(directory, "leaked.idx")
+            known = [f"leaked-token-{i:08d}-{i * 7919:x}" for i in range(args.known_count)]
+
+            started = time.perf_counter()
+            count = build_index(synthetic_digests(args.count, known), path)
+            print(f"built {count:,} digests in {time.perf_counter() - started:.1f}s "
+                  f"({os.path.getsize(path) / 2**20:.0f} MB)")
+
+        # Half hits, half misses
+        queries = [
+            known[i % len(known)] if i % 2 == 0 else f"not-leaked-{i:010d}"
+            for i in range(args.queries)
+        ]
+
+        before_open = rss_mb()
+        started = time.perf_counter()
+        index = LeakIndex(path)
+        open_ms = (time.perf_counter() - started) * 1000
+        after_open = rss_mb()
+
+        started = time.perf_counter()
+        hits = 0
+        for start in range(0, len(queries), args.batch):
+            hits += sum(index.contains_many(queries[start:start + args.batch]))
+        batched = len(queries) / (time.perf_counter() - started)
+
+        latencies = []
+        for text in queries[:10_000]:
+            started = time.perf_counter()
+            _ = text in index
+            latencies.append((time.perf_counter() - started) * 1e6)
+
+        after_queries = rss_mb()
+        index.close()
+
+    print(f"entries:          {len(index):,}")
+    print(f"open:             {open_ms:.2f} ms")
+    print(f"hits:             {hits:,} / {len(queries):,}")
+    print(f"batched lookups:  {batched:,.0f} /s (batch {args.batch}, hashing included)")
+    print(f"single lookup:    p50 {statistics.median(latencies):.1f} µs, "
+          f"p99 {sorted(latencies)[int(len(latencies) * 0.99)]:.1f} µs")
+    for label, (anon, shared) in (("before open", before_open), ("after open", after_open),
+                                  ("after queries", after_queries)):
+        print(f"RSS {label + ':':<14}{anon:>7.0f} MB private, {shared:.0f} MB shared file pages")
+
+
+if __name__ == "__main__":
+    main()
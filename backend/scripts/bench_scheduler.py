@@ -0,0 +1,84 @@
+"""
+Tail latency of single-file reviews under each admission scheduler.
+
+Usage (from backend/):
+    python scripts/bench_scheduler.py --rate 6 --duration 20
+
+Runs load_test.py in-process once per scheduler (same seed, same
+arrival schedule, offline replay advisory) with a mix dominated by
+single-file reviews plus occasional 200-file projects, and compares
+per-class p50/p99. Each run is a separate process so the scheduler
+config is read fresh.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MIX = "single-python=8,single-javascript=2,project-large=1"
+
+
+def run_policy(policy, args, directory):
+    output = os.path.join(directory, f"{policy}.json")
+
+    subprocess.run(
+        [
+            sys.executable, os.path.join(HERE, "load_test.py"),
+            "--in-process", "--advisory", "replay",
+            "--replay-latency", args.replay_latency,
+            "--scheduler", policy,
+            "--max-concurrent", str(args.max_concurrent),
+            "--rate", str(args.rate),
+            "--duration", str(args.duration),
+            "--mix", args.mix,
+            "--seed", str(args.seed),
+            "--output", output
+        ],
+        cwd=os.path.dirname(HERE),
+        check=True,
+        stdout=subprocess.DEVNULL
+    )
+
+    with open(output, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare admission schedulers")
+    parser.add_argument("--policies", default="fifo,sjf,wfq")
+    parser.add_argument("--rate", type=float, default=6.0)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--max-concurrent", type=int, default=1)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--replay-latency", default="fixed:0.05")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    reports = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for policy in args.policies.split(","):
+            reports[policy] = run_policy(policy.strip(), args, directory)
+
+    if args.json:
+        print(json.dumps(reports, indent=2, sort_keys=True))
+        return
+
+    print(f"{'scheduler':<10}{'class':<20}{'reqs':>6}{'429':>6}{'p50 ms':>10}{'p99 ms':>10}")
+    for policy, report in reports.items():
+        for name, stats in sorted(report["classes"].items()):
+            latency = stats["latency_ms"]
+            print(
+                f"{policy:<10}{name:<20}{stats['requests']:>6}"
+                f"{stats['statuses'].get('429', 0):>6}"
+                f"{latency['p50']:>10.1f}{latency['p99']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Memory and time of the project symbol table on synthetic projects.
+
+Usage (from backend/):
+    python scripts/bench_symbol_table.py
+    python scripts/bench_symbol_table.py --files 10000 50000 --functions 30
+
+Per-file symbols are generated in the shape extract_file_symbols
+returns (so parsing is not measured): --functions module-level
+functions, a class with methods, calls into imported sibling modules,
+attribute calls and a few local names. Compared against the previous
+representation (name → [path, ...] per occurrence, global import set)
+built from the same symbols. Memory is what tracemalloc attributes to
+building the table, input symbols excluded; checks are the three
+symbol checks (undefined / dead / duplicate), issue dicts and the
+import graph (scripts/bench_import_graph.py) excluded.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.project_parser import new_project_data, merge_file_symbols  # noqa: E402
+from app.core.symbol_table import FUNCTION, METHOD, CLASS  # noqa: E402
+
+
+def synthetic_symbols(count, functions, seed):
+    rng = random.Random(seed)
+    files = []
+
+    for position in range(count):
+        definitions = [[f"handle_{position}_{i}", FUNCTION, 0, 3 * i + 1, 1, 3 * i + 3, 9] for i in range(functions)]
+        definitions += [[f"Service{position}", CLASS, 0, 200, 1, 220, 9]]
+        definitions += [
+            [f"Service{position}.{name}", METHOD, 0, 201 + 5 * i, 5, 205 + 5 * i, 9]
+            for i, name in enumerate(("load", "save", "validate"))
+        ]
+
+        imports, calls = [], []
+        for _ in range(5):
+            other = rng.randrange(count)
+            name = f"handle_{other}_{rng.randrange(functions)}"
+            imports.append([0, f"app.pkg{other % 50}.mod{other}", name])
+            calls.append(name)
+
+        local = [f"handle_{position}_{rng.randrange(functions)}" for _ in range(functions // 2)]
+        calls += local
+
+        files.append((f"app/pkg{position % 50}/mod{position}.py", {
+            "definitions": sorted(definitions),
+            "calls": sorted([name, 10, 5, 10, 5 + len(name) + 2] for name in set(calls + ["print", "len"])),
+            "references": sorted(set(calls + ["print", "len", "self", "data"])),
+            "attributes": ["load", "save", "get"],
+            "bound": sorted({name for _, _, name in imports} | {"self", "data"} |
+                            {d[0].rsplit(".", 1)[-1] for d in definitions}),
+            "star_import": False,
+            "import_bindings": sorted(imports),
+            "module_imports": sorted(
+                [level, module, [name], line, 1, line, 30] for line, (level, module, name) in enumerate(imports, 1)
+            )
+        }))
+
+    return files
+
+
+# =========================================================
+# PREVIOUS REPRESENTATION (name → [path] per occurrence)
+# =========================================================
+
+def legacy_table(files):
+    data = {
+        "definitions": defaultdict(list),
+        "class_definitions": defaultdict(list),
+        "calls": defaultdict(list),
+        "imports": set(),
+        "modules": {},
+        "module_imports": {}
+    }
+
+    for path, symbols in files:
+        for qualname, kind, *_ in symbols["definitions"]:
+            short = qualname.rsplit(".", 1)[-1]
+            target = data["class_definitions"] if kind == CLASS else data["definitions"]
+            target[short].append(path)
+        for name, *_ in symbols["calls"]:
+            data["calls"][name].append(path)
+        data["imports"].update(name for _, _, name in symbols["import_bindings"])
+
+        module = path[:-3].replace("/", ".")
+        data["modules"][module] = path
+        data["module_imports"][module] = [(base, names) for _, base, names, *_ in symbols["module_imports"]]
+
+    return data
+
+
+def legacy_checks(data):
+    issues = 0
+    for name, paths in data["calls"].items():
+        if name not in data["imports"] and name not in data["class_definitions"] and name not in data["definitions"]:
+            issues += len(paths)
+    for name, paths in data["definitions"].items():
+        if not name.startswith("_") and name not in data["calls"]:
+            issues += len(paths)
+        if len(paths) > 1:
+            issues += 1
+    return issues
+
+
+def table_checks(table):
+    return (
+        len(table.undefined_calls())
+        + len(table.unused_definitions())
+        + len(table.duplicate_functions())
+    )
+
+
+def measure(build, check, files):
+    # Timed without tracemalloc (it slows allocation-heavy code several-fold)
+    started = time.perf_counter()
+    table = build(files)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = check(table)
+    check_time = time.perf_counter() - started
+
+    del table
+    tracemalloc.start()
+    table = build(files)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return memory, build_time, check_time, result
+
+
+def build_table(files):
+    table = new_project_data()
+    for path, symbols in files:
+        merge_file_symbols(table, path, symbols)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the project symbol table")
+    parser.add_argument("--files", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--functions", type=int, default=20, help="module-level functions per file")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'files':>7} {'table':>9} {'memory MB':>10} {'build ms':>9} {'checks ms':>10} {'issues':>7}")
+
+    for count in args.files:
+        files = synthetic_symbols(count, args.functions, args.seed)
+
+        for label, build, check in (
+            ("previous", legacy_table, legacy_checks),
+            ("interned", build_table, table_checks)
+        ):
+            memory, build_time, check_time, issues = measure(build, check, files)
+            print(f"{count:>7,} {label:>9} {memory / 2**20:>10.1f} {build_time * 1000:>9.0f} "
+                  f"{check_time * 1000:>10.0f} {issues:>7,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Build the known-leaked-credential index.
+
+Usage (from backend/):
+    # one hex SHA-256 per line (e.g. an exported revocation list)
+    python scripts/build_leak_index.py hashes.txt more-hashes.txt -o leaked.idx
+
+    # the leaked credentials themselves, one per line (hashed here)
+    python scripts/build_leak_index.py --raw leaked-tokens.txt -o leaked.idx
+
+Then point the service at it:
+    LEAKED_CREDENTIALS_INDEX=leaked.idx uvicorn app.main:app
+
+Inputs may be unsorted, contain duplicates and exceed memory: digests
+are sorted in runs of --chunk records and merged.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.leak_index import BUILD_CHUNK_RECORDS, build_index, parse_digest  # noqa: E402
+
+
+def read_digests(paths, raw):
+    for path in paths:
+        with open(path, encoding="utf-8", errors="surrogateescape") as handle:
+            for line in handle:
+                digest = parse_digest(line, raw=raw)
+                if digest is not None:
+                    yield digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a leaked-credential index")
+    parser.add_argument("inputs", nargs="+", help="text files, one entry per line")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--raw", action="store_true",
+                        help="lines are credentials, not hex SHA-256 digests")
+    parser.add_argument("--chunk", type=int, default=BUILD_CHUNK_RECORDS,
+                        help="digests sorted in memory per run")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = build_index(read_digests(args.inputs, args.raw), args.output, args.chunk)
+    elapsed = time.perf_counter() - started
+
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"{count:,} unique digests → {args.output} ({size_mb:.1f} MB) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
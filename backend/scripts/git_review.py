@@ -0,0 +1,99 @@
+"""
+Review a local git repository (or bundle) without the HTTP API.
+
+Usage (from backend/):
+    python scripts/git_review.py ../ --base origin/main --head HEAD
+    python scripts/git_review.py repo.bundle --head main --json
+    python scripts/git_review.py ../ --format sarif --output review.sarif
+    python scripts/git_review.py ../ --baseline legacy      # new issues only
+
+Only files whose blob SHA changed between --base and --head are
+reported; cross-file checks run over the whole --head tree. Per-file
+results are cached by blob SHA in --cache-dir, so unchanged files are
+never read again on later runs. Works offline with plain git.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.git_scanner import BlobCache, GitScanError, scan_revision_range  # noqa: E402
+from app.core.pipeline import static_verdict  # noqa: E402
+from app.core.report_writers import write_report  # noqa: E402
+from app.core.baseline import BaselineError, baseline_store  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Review a local git repository")
+    parser.add_argument("repo", help="repository path or bundle file")
+    parser.add_argument("--head", default="HEAD")
+    parser.add_argument("--base", help="only report files changed since this revision")
+    parser.add_argument("--context", default="deployment")
+    parser.add_argument(
+        "--cache-dir",
+        default=os.path.join(os.path.expanduser("~"), ".cache", "quality-gate", "blobs"),
+        help="per-blob result cache ('' to disable)"
+    )
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    parser.add_argument("--format", choices=["sarif", "junit"], help="write a SARIF / JUnit report")
+    parser.add_argument("--output", help="report file for --format (default: stdout)")
+    parser.add_argument("--baseline", help="stored baseline (BASELINE_DIR) whose issues are not reported")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = baseline_store().get(args.baseline)
+        except BaselineError as e:
+            parser.error(str(e))
+        if baseline is None:
+            parser.error(f"unknown baseline {args.baseline!r}")
+
+    cache = BlobCache(args.cache_dir or None)
+
+    try:
+        scan = scan_revision_range(args.repo, head=args.head, base=args.base, cache=cache)
+    except GitScanError as e:
+        print(f"git scan failed: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    result = static_verdict(scan["raw_issues"], args.context, "project", baseline)
+    result["scan"] = scan["stats"]
+    result["changed_files"] = scan["changed_files"]
+
+    if args.format:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                write_report(result, args.format, f)
+        else:
+            write_report(result, args.format, sys.stdout)
+    elif args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        stats = scan["stats"]
+        print("\n==============================")
+        print("   QUALITY GATE REPORT (git)")
+        print("==============================\n")
+        print(f"Files: {stats['files']}  changed: {stats['changed']}  "
+              f"read: {stats['blobs_read']}  cache hits: {stats['cache_hits']}")
+        if baseline is not None:
+            print(f"Baseline: {baseline.name} ({result['baseline']['suppressed']} known issue(s) suppressed)")
+        print("Decision:", result["decision"])
+        print("Final Score:", result["final_score"])
+        print("\nDetected Issues:\n")
+        for issue in result["issues"]:
+            print(f"[{issue['severity']}] {issue['message']}")
+            if "path" in issue:
+                print(f"   File: {issue['path']}")
+        print("\nDecision Trace:")
+        for reason in result["decision_trace"]:
+            print("-", reason)
+
+    sys.exit(1 if result["decision"] == "BLOCK" else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Open-loop HTTP load generator for the review API.
+
+Usage (from backend/):
+    # in-process via ASGI, offline advisory stand-in
+    python scripts/load_test.py --in-process --advisory replay --rate 20 --duration 30
+
+    # against a running instance
+    python scripts/load_test.py --url http://127.0.0.1:8000 --rate 50 --duration 60
+
+    # in-process, comparing admission schedulers (see bench_scheduler.py)
+    python scripts/load_test.py --in-process --scheduler fifo --max-concurrent 1
+
+Requests are sent at a fixed arrival rate (not closed-loop), drawn from a
+weighted mix of payload classes. Throughput and p50/p95/p99 latency are
+reported per class; --output writes the same numbers as sorted, indented
+JSON so runs can be diffed for capacity planning.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+REVIEW_PATH = "/api/v1/review"
+
+DEFAULT_MIX = "single-python=6,single-javascript=2,project-small=3,project-large=1"
+
+
+# =========================================================
+# PAYLOAD CLASSES
+# =========================================================
+
+PYTHON_MODULE = '''
+import os
+import subprocess
+
+
+def load_settings(path):
+    settings = {}
+    with open(path) as handle:
+        for line in handle:
+            key, _, value = line.partition("=")
+            settings[key.strip()] = value.strip()
+    return settings
+
+
+def run_job(name, args):
+    command = "run " + name + " " + " ".join(args)
+    print(command)
+    return subprocess.run(command.split(), capture_output=True)
+
+
+class Worker:
+    def __init__(self, queue):
+        self.queue = queue
+        self.processed = 0
+
+    def step(self):
+        item = self.queue.pop()
+        if item is None:
+            return False
+        self.processed += 1
+        return run_job(item["name"], item.get("args", []))
+'''
+
+JAVASCRIPT_MODULE = '''
+const express = require("express");
+const app = express();
+
+app.get("/ratio", (req, res) => {
+  const total = Number(req.query.total);
+  const parts = Number(req.query.parts);
+  if (parts === 0) {
+    res.status(400).send("bad input");
+    return;
+  }
+  res.json({ ratio: total / parts });
+});
+
+app.listen(3000);
+'''
+
+
+def python_project(file_count, marker):
+    """
+    The marker is in the paths too: project advisories are keyed on a
+    summary (paths, issue messages), not on the file contents.
+    """
+    files = []
+    for index in range(file_count):
+        code = PYTHON_MODULE.replace("run_job", f"run_job_{index % 7}")
+        if index == 0:
+            code += f"\nLOAD_MARKER = {marker}\n"
+        files.append({"path": f"pkg_{marker}/module_{index}.py", "code": code})
+    return files
+
+
+def build_payload(kind, marker):
+    """
+    'marker' makes each payload unique so neither the response cache nor
+    the advisory cache flatters the numbers.
+    """
+    if kind == "single-python":
+        return {
+            "language": "python",
+            "context": "deployment",
+            "code": PYTHON_MODULE + f"\nLOAD_MARKER = {marker}\n"
+        }
+
+    if kind == "single-javascript":
+        return {
+            "language": "javascript",
+            "context": "deployment",
+            "code": JAVASCRIPT_MODULE + f"\nconst LOAD_MARKER = {marker};\n"
+        }
+
+    if kind == "project-small":
+        return {
+            "language": "python",
+            "context": "deployment",
+            "files": python_project(10, marker)
+        }
+
+    if kind == "project-large":
+        return {
+            "language": "python",
+            "context": "deployment",
+            "files": python_project(200, marker)
+        }
+
+    raise ValueError(f"Unknown payload class '{kind}'")
+
+
+def parse_mix(spec):
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        build_payload(name.strip(), 0)
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+# =========================================================
+# STATISTICS
+# =========================================================
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(sample["latency"] for sample in samples if sample["ok"])
+    errors = sum(1 for sample in samples if not sample["ok"])
+
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample["status"])] = statuses.get(str(sample["status"]), 0) + 1
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "statuses": statuses,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99": round(percentile(latencies, 0.99) * 1000, 1),
+            "max": round((latencies[-1] if latencies else 0.0) * 1000, 1),
+        }
+    }
+
+
+# =========================================================
+# RUNNER
+# =========================================================
+
+async def send(client, kind, payload, samples, limiter):
+    async with limiter:
+        started = time.perf_counter()
+        try:
+            response = await client.post(REVIEW_PATH, json=payload)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+
+        samples.setdefault(kind, []).append({
+            "latency": time.perf_counter() - started,
+            "status": status,
+            "ok": status == 200
+        })
+
+
+async def run_load(client, mix, rate, duration, concurrency, seed):
+    """
+    Fires rate * duration requests on an open-loop schedule.
+    Returns (samples per class, elapsed seconds).
+    """
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    total = int(rate * duration)
+
+    samples = {}
+    limiter = asyncio.Semaphore(concurrency)
+    tasks = []
+
+    started = time.perf_counter()
+
+    for index in range(total):
+        due = started + index / rate
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        kind = rng.choices(kinds, weights)[0]
+        payload = build_payload(kind, index)
+        tasks.append(asyncio.create_task(send(client, kind, payload, samples, limiter)))
+
+    await asyncio.gather(*tasks)
+
+    return samples, time.perf_counter() - started
+
+
+def make_client(args):
+    timeout = httpx.Timeout(args.timeout)
+
+    if args.in_process:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        return httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout)
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    return httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits)
+
+
+def build_report(args, samples, elapsed):
+    classes = {kind: summarize(kind_samples, elapsed) for kind, kind_samples in samples.items()}
+    everything = [sample for kind_samples in samples.values() for sample in kind_samples]
+
+    return {
+        "config": {
+            "target": "in-process" if args.in_process else args.url,
+            "rate_rps": args.rate,
+            "duration_s": args.duration,
+            "concurrency": args.concurrency,
+            "mix": args.mix,
+            "advisory": args.advisory,
+            "scheduler": args.scheduler,
+            "max_concurrent": args.max_concurrent,
+            "seed": args.seed
+        },
+        "overall": summarize(everything, elapsed),
+        "classes": classes
+    }
+
+
+async def fetch_queue_stats(client):
+    try:
+        response = await client.get("/api/v1/queue/stats")
+        return response.json() if response.status_code == 200 else None
+    except httpx.HTTPError:
+        return None
+
+
+def print_report(report):
+    print(f"\n{'class':<20}{'reqs':>7}{'errs':>6}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = list(sorted(report["classes"].items())) + [("overall", report["overall"])]
+    for name, stats in rows:
+        latency = stats["latency_ms"]
+        print(
+            f"{name:<20}{stats['requests']:>7}{stats['errors']:>6}"
+            f"{stats['throughput_rps']:>9.1f}{latency['p50']:>10.1f}"
+            f"{latency['p95']:>10.1f}{latency['p99']:>10.1f}"
+        )
+
+    queue = report.get("queue")
+    if queue:
+        wait = queue["wait_ms"]
+        print(
+            f"\nqueue ({queue['policy']}): admitted={queue['admitted']} "
+            f"rejected={queue['rejected']} timed_out={queue['timed_out']} "
+            f"wait p50={wait['p50']}ms p99={wait['p99']}ms"
+        )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Load test the review API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--in-process", action="store_true",
+                        help="drive app.main:app through ASGI instead of HTTP")
+    parser.add_argument("--rate", type=float, default=10.0, help="requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=256,
+                        help="max outstanding requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--advisory", choices=["default", "replay"], default="default",
+                        help="in-process only: use the offline replay advisory backend")
+    parser.add_argument("--replay-latency", default="lognormal:-0.7,0.4")
+    parser.add_argument("--scheduler", choices=["sjf", "wfq", "fifo"],
+                        help="in-process only: admission scheduler (REVIEW_SCHEDULER)")
+    parser.add_argument("--max-concurrent", type=int,
+                        help="in-process only: admitted reviews (REVIEW_MAX_CONCURRENT)")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the report as JSON")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    mix = parse_mix(args.mix)
+
+    if args.advisory == "replay":
+        os.environ["ADVISORY_BACKEND"] = "replay"
+        os.environ["ADVISORY_REPLAY_LATENCY"] = args.replay_latency
+
+    if args.scheduler:
+        os.environ["REVIEW_SCHEDULER"] = args.scheduler
+    if args.max_concurrent is not None:
+        os.environ["REVIEW_MAX_CONCURRENT"] = str(args.max_concurrent)
+
+    async def run():
+        async with make_client(args) as client:
+            samples, elapsed = await run_load(
+                client, mix, args.rate, args.duration, args.concurrency, args.seed
+            )
+            return samples, elapsed, await fetch_queue_stats(client)
+
+    samples, elapsed, queue = asyncio.run(run())
+    report = build_report(args, samples, elapsed)
+    report["queue"] = queue
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Watch-mode review daemon with a warm in-memory project index.
+
+Usage (from backend/):
+    # start watching a project (inotify on Linux, polling elsewhere)
+    python scripts/review_daemon.py serve ../my-project
+
+    # query it from an editor hook, pre-commit, etc.
+    python scripts/review_daemon.py query decision --root ../my-project
+    python scripts/review_daemon.py query file --path app/main.py --root ../my-project
+
+The daemon listens on a Unix socket (default <root>/.quality-gate.sock).
+Protocol: one JSON object per line in, one JSON object per line out.
+
+    {"command": "review", "context": "deployment"}   full static verdict
+    {"command": "decision"}                          decision + score only
+    {"command": "file", "path": "app/main.py"}       issues for one file
+    {"command": "status"}                            index size / counters
+    {"command": "rescan"}                            full re-walk
+
+Only changed files are re-analyzed; cross-file checks are recomputed
+only when a file's definitions, calls or imports changed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.file_watcher import create_watcher  # noqa: E402
+from app.core.project_index import ProjectIndex  # noqa: E402
+
+SOCKET_NAME = ".quality-gate.sock"
+
+# Editors write files in bursts; wait this long before re-indexing
+DEBOUNCE_SECONDS = 0.05
+POLL_SECONDS = 1.0
+
+
+# =========================================================
+# QUERY HANDLING
+# =========================================================
+
+def handle_command(index, request):
+    command = request.get("command")
+    context = request.get("context", "deployment")
+
+    if command == "review":
+        return index.review(context)
+
+    if command == "decision":
+        result = index.review(context)
+        return {
+            "decision": result["decision"],
+            "final_score": result["final_score"],
+            "summary": result["summary"]
+        }
+
+    if command == "file":
+        issues = index.file_issues(request.get("path", ""))
+        if issues is None:
+            raise ValueError(f"File not indexed: {request.get('path')}")
+        return {"path": request["path"], "issues": issues}
+
+    if command == "status":
+        return index.status()
+
+    if command == "rescan":
+        return {"changed": index.scan()}
+
+    raise ValueError(f"Unknown command: {command}")
+
+
+async def serve_client(index, reader, writer):
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            start = time.perf_counter()
+
+            try:
+                body = {"ok": True, "result": handle_command(index, json.loads(line))}
+            except Exception as e:
+                body = {"ok": False, "error": str(e)}
+
+            body["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+            writer.write(json.dumps(body).encode("utf-8") + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+# =========================================================
+# WATCH LOOP
+# =========================================================
+
+async def watch(index, watcher):
+    loop = asyncio.get_running_loop()
+
+    def apply(changes):
+        changed = index.scan() if changes is None else index.update(changes)
+        if changed:
+            print(f"re-indexed {len(changed)} file(s): {', '.join(changed[:5])}", flush=True)
+
+    fd = watcher.fileno()
+
+    if fd is None:
+        while True:
+            await asyncio.sleep(POLL_SECONDS)
+            apply(watcher.read_changes())
+
+    ready = asyncio.Event()
+    loop.add_reader(fd, ready.set)
+
+    try:
+        while True:
+            await ready.wait()
+            await asyncio.sleep(DEBOUNCE_SECONDS)
+            ready.clear()
+            apply(watcher.read_changes())
+    finally:
+        loop.remove_reader(fd)
+
+
+async def serve(root, socket_path):
+    index = ProjectIndex(root)
+
+    start = time.perf_counter()
+    index.scan()
+    index.review()      # warm the cross-file caches
+    print(
+        f"indexed {len(index.files)} file(s) in {time.perf_counter() - start:.2f}s; "
+        f"listening on {socket_path}",
+        flush=True
+    )
+
+    watcher = create_watcher(index.root)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = await asyncio.start_unix_server(
+        lambda r, w: serve_client(index, r, w), path=socket_path
+    )
+
+    # Clean shutdown (socket removed) on SIGTERM as well as Ctrl-C
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM, asyncio.current_task().cancel
+    )
+
+    try:
+        async with server:
+            await asyncio.gather(server.serve_forever(), watch(index, watcher))
+    finally:
+        watcher.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# =========================================================
+# CLIENT
+# =========================================================
+
+def query(socket_path, request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        buffer = b""
+        while not buffer.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            buffer += chunk
+
+    return json.loads(buffer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch-mode review daemon")
+    subcommands = parser.add_subparsers(dest="mode", required=True)
+
+    serve_parser = subcommands.add_parser("serve", help="index and watch a directory")
+    serve_parser.add_argument("root")
+    serve_parser.add_argument("--socket", help=f"socket path (default <root>/{SOCKET_NAME})")
+
+    query_parser = subcommands.add_parser("query", help="ask a running daemon")
+    query_parser.add_argument("command", choices=["review", "decision", "file", "status", "rescan"])
+    query_parser.add_argument("--root", default=".")
+    query_parser.add_argument("--socket")
+    query_parser.add_argument("--path")
+    query_parser.add_argument("--context", default="deployment")
+
+    args = parser.parse_args()
+    socket_path = args.socket or os.path.join(args.root, SOCKET_NAME)
+
+    if args.mode == "serve":
+        try:
+            asyncio.run(serve(args.root, socket_path))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        return
+
+    request = {"command": args.command, "context": args.context}
+    if args.path:
+        request["path"] = args.path
+
+    try:
+        response = query(socket_path, request)
+    except OSError as e:
+        print(f"daemon not reachable at {socket_path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps(response, indent=2))
+
+    if not response.get("ok"):
+        sys.exit(2)
+    if response["result"].get("decision") == "BLOCK":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,64 +1,149 @@
-import requests
-import sys
-import os
-import json
-
-API_URL = "https://ai-based-code-quality-and-security.onrender.com/api/v1/review"
-
-project_files = []
-
-print("\n🔎 Scanning backend/app folder only...\n")
-
-for root, dirs, files in os.walk("app"):  # ✅ ONLY scan your code
-    for file in files:
-        if file.endswith(".py"):
-            path = os.path.join(root, file)
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                project_files.append({
-                    "path": path,
-                    "code": f.read()
-                })
-
-payload = {
-    "language": "python",
-    "context": "deployment",
-    "files": project_files
-}
+"""
+Run the hosted quality gate over backend/app.
 
-response = requests.post(API_URL, json=payload)
+Usage (from backend/):
+    python scripts/run_quality_gate.py
+    python scripts/run_quality_gate.py --format sarif --output quality-gate.sarif
+    python scripts/run_quality_gate.py --format junit --output quality-gate.xml
+    python scripts/run_quality_gate.py --baseline my-service     # new issues only
 
-if response.status_code != 200:
-    print("Analyzer failed.")
-    sys.exit(1)
+SARIF / JUnit reports are streamed to --output chunk by chunk, so the
+document is never held in memory. Exits 1 when the gate BLOCKs.
+"""
 
-result = response.json()
-
-print("\n==============================")
-print("   QUALITY GATE REPORT")
-print("==============================\n")
-
-print("Decision:", result["decision"])
-print("Final Score:", result["final_score"])
-
-print("\nRisk Breakdown:")
-print(json.dumps(result["risk_breakdown"], indent=2))
-
-print("\nDetected Issues:\n")
-
-for issue in result.get("issues", []):
-    print(f"[{issue['severity']}] {issue['message']}")
-    if "path" in issue:
-        print(f"   File: {issue['path']}")
-    if "suggestion" in issue:
-        print(f"   Suggestion: {issue['suggestion']}")
-    print()
+import argparse
+import json
+import os
+import sys
 
-print("\nDecision Trace:")
-for reason in result.get("decision_trace", []):
-    print("-", reason)
+import requests
 
-if result["decision"] == "BLOCK":
-    print("\n❌ Quality Gate FAILED")
-    sys.exit(1)
+API_URL = "https://ai-based-code-quality-and-security.onrender.com/api/v1/review"
 
-print("\n✅ Quality Gate PASSED")
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def collect_files(folder):
+    project_files = []
+
+    for root, dirs, files in os.walk(folder):  # ✅ ONLY scan your code
+        for file in files:
+            if file.endswith(".py"):
+                path = os.path.join(root, file)
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    project_files.append({
+                        "path": path,
+                        "code": f.read()
+                    })
+
+    return project_files
+
+
+def print_report(result):
+    print("\n==============================")
+    print("   QUALITY GATE REPORT")
+    print("==============================\n")
+
+    print("Decision:", result["decision"])
+    print("Final Score:", result["final_score"])
+
+    if result.get("baseline"):
+        baseline = result["baseline"]
+        print(f"Baseline: {baseline['name']} ({baseline['suppressed']} known issue(s) suppressed)")
+
+    print("\nRisk Breakdown:")
+    print(json.dumps(result["risk_breakdown"], indent=2))
+
+    print("\nDetected Issues:\n")
+
+    for issue in result.get("issues", []):
+        print(f"[{issue['severity']}] {issue['message']}")
+        if "path" in issue:
+            print(f"   File: {issue['path']}")
+        if "suggestion" in issue:
+            print(f"   Suggestion: {issue['suggestion']}")
+        print()
+
+    print("\nDecision Trace:")
+    for reason in result.get("decision_trace", []):
+        print("-", reason)
+
+
+def stream_report(response, output):
+    """
+    Copies a SARIF / JUnit response body to 'output' as it arrives.
+    """
+    handle = open(output, "wb") if output else sys.stdout.buffer
+    try:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+            handle.write(chunk)
+    finally:
+        if output:
+            handle.close()
+        else:
+            handle.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the quality gate over a folder")
+    parser.add_argument("--url", default=os.getenv("QUALITY_GATE_URL", API_URL))
+    parser.add_argument("--path", default="app", help="folder to scan")
+    parser.add_argument("--context", default="deployment")
+    parser.add_argument("--policy", help="quality-gate policy (default: server default)")
+    parser.add_argument("--baseline", help="server-side baseline whose known issues are not reported")
+    parser.add_argument(
+        "--format", choices=["text", "json", "sarif", "junit"], default="text",
+        help="report format (sarif / junit are streamed)"
+    )
+    parser.add_argument("--output", help="write the report to this file instead of stdout")
+    args = parser.parse_args()
+
+    # Progress goes to stderr when the report itself is on stdout
+    log = sys.stderr if args.format != "text" and not args.output else sys.stdout
+
+    print(f"\n🔎 Scanning {args.path} folder only...\n", file=log)
+
+    payload = {
+        "language": "python",
+        "context": args.context,
+        "files": collect_files(args.path)
+    }
+    if args.policy:
+        payload["policy"] = args.policy
+    if args.baseline:
+        payload["baseline"] = args.baseline
+
+    streamed = args.format in ("sarif", "junit")
+    params = {"format": args.format} if streamed else None
+
+    response = requests.post(args.url, json=payload, params=params, stream=streamed)
+
+    if response.status_code != 200:
+        print("Analyzer failed.", file=log)
+        sys.exit(1)
+
+    if streamed:
+        stream_report(response, args.output)
+        decision = response.headers.get("X-Quality-Gate-Decision", "PASS")
+    else:
+        result = response.json()
+        decision = result["decision"]
+
+        if args.format == "json":
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as f:
+                    json.dump(result, f, indent=2)
+            else:
+                print(json.dumps(result, indent=2))
+        else:
+            print_report(result)
+
+    if decision == "BLOCK":
+        print("\n❌ Quality Gate FAILED", file=log)
+        sys.exit(1)
+
+    print("\n✅ Quality Gate PASSED", file=log)
+
+
+if __name__ == "__main__":
+    main()